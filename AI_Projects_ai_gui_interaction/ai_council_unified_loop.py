@@ -8,9 +8,14 @@ AI Council Unified Loop
 
 import time
 import pyautogui
-import pytesseract
 import json
+import sys
 from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # repo root, for core/
+from core.frame_cache import get_frame_cache
+from core.ocr_pool import ocr_image
 
 # Define AI participants in order
 AI_ORDER = [
@@ -48,10 +53,10 @@ class AICouncil:
             pyautogui.scroll(-500)
             time.sleep(1)
             screenshot = pyautogui.screenshot(region=region)
-            text = pytesseract.image_to_string(screenshot).strip()
+            # Unchanged frames reuse the previous OCR text instead of re-running tesseract
+            text = get_frame_cache().ocr(screenshot, ocr_image).strip()
             if text and text != previous_text:
-                print(f"📜 [{ai['name'].upper()}] OCR Detected:
-{text}")
+                print(f"📜 [{ai['name'].upper()}] OCR Detected:\n{text}")
                 return text
             previous_text = text
             time.sleep(OCR_DELAY)
@@ -76,8 +81,7 @@ def main():
     council = AICouncil(initial_prompt)
     while True:
         council.loop_once()
-        print("🔁 Round complete. Restarting in 15 seconds...
-")
+        print("🔁 Round complete. Restarting in 15 seconds...\n")
         time.sleep(ROUND_DELAY)
 
 if __name__ == "__main__":
@@ -3,9 +3,15 @@ import logging
 import subprocess
 import pyautogui
 import pyperclip
-import pytesseract
 import re
+import sys
 from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # repo root, for core/
+from core.ocr_pool import ocr_data
+from core.junk_filter import get_junk_filter
+from core.actuator import get_actuator
 
 logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(message)s')
 
@@ -82,13 +88,13 @@ def kai_desktop_switch(target_desktop):
         end tell
         '''
     
-    try:
-        subprocess.run(['osascript', '-e', script], check=True)
+    result = get_actuator().run_script(script)
+    if result.returncode == 0:
         current_desktop = target_desktop
         time.sleep(3)
         logging.info(f"✅ Successfully switched to Desktop {target_desktop}")
-    except subprocess.CalledProcessError as e:
-        logging.error(f"❌ Desktop switch failed: {e}")
+    else:
+        logging.error(f"❌ Desktop switch failed: {result.stderr.strip()}")
 
 def find_response_with_ocr(speaker):
     """Use OCR to find the AI's response area - IMPROVED targeting"""
@@ -105,13 +111,11 @@ def find_response_with_ocr(speaker):
         # Save for debugging
         screenshot.save(f"{speaker}_ocr_scan.png")
         
-        # Run OCR to get all text first
-        full_text = pytesseract.image_to_string(screenshot)
+        # One OCR pass gives both the text and the word boxes
+        ocr_result = ocr_data(screenshot, origin=ocr_region[:2])
+        full_text = ocr_result.text
         logging.info(f"📝 OCR found text: '{full_text[:100]}...'")
         
-        # Run OCR to get text with bounding boxes
-        ocr_data = pytesseract.image_to_data(screenshot, output_type=pytesseract.Output.DICT)
-        
         # Look for key indicators - make them more flexible
         response_indicators = {
             "Kai": ["digital", "integrity", "preserve", "truth", "authenticity", "AI", "systems", "Council"],
@@ -125,28 +129,21 @@ def find_response_with_ocr(speaker):
         # Find text blocks that contain response indicators
         response_blocks = []
         
-        for i, word in enumerate(ocr_data['text']):
-            if word and len(word) > 2:  # Only consider substantial words
-                if any(indicator.lower() in word.lower() for indicator in indicators):
-                    # Found a response indicator - get the bounding box
-                    x = ocr_data['left'][i]
-                    y = ocr_data['top'][i]
-                    w = ocr_data['width'][i]
-                    h = ocr_data['height'][i]
-                    
-                    # Adjust coordinates to full screen (add region offset)
-                    screen_x = ocr_region[0] + x
-                    screen_y = ocr_region[1] + y
+        for word in ocr_result.words:
+            if len(word.text) > 2:  # Only consider substantial words
+                if any(indicator.lower() in word.text.lower() for indicator in indicators):
+                    # Found a response indicator - get the bounding box in screen coordinates
+                    screen_x, screen_y, w, h = ocr_result.screen_box(word)
                     
                     response_blocks.append({
                         'x': screen_x,
                         'y': screen_y,
                         'w': w,
                         'h': h,
-                        'word': word,
-                        'confidence': ocr_data['conf'][i]
+                        'word': word.text,
+                        'confidence': word.conf
                     })
-                    logging.info(f"🎯 Found indicator '{word}' at ({screen_x}, {screen_y})")
+                    logging.info(f"🎯 Found indicator '{word.text}' at ({screen_x}, {screen_y})")
         
         if response_blocks:
             # Find the bounds of all response blocks
@@ -209,8 +206,8 @@ def applescript_rubber_band_copy(bounds):
     end tell
     '''
     
-    try:
-        subprocess.run(['osascript', '-e', script], check=True)
+    result = get_actuator().run_script(script)
+    if result.returncode == 0:
         logging.info("✅ AppleScript rubber band selection completed")
         
         # Get the copied text
@@ -219,26 +216,25 @@ def applescript_rubber_band_copy(bounds):
         
         return copied_text
         
-    except subprocess.CalledProcessError as e:
-        logging.error(f"❌ AppleScript rubber band failed: {e}")
+    logging.error(f"❌ AppleScript rubber band failed: {result.stderr.strip()}")
+    
+    # Fallback: Try pyautogui drag (but we know the exact coordinates now)
+    logging.info("🔄 Trying pyautogui fallback with OCR coordinates...")
+    try:
+        pyautogui.moveTo(start_x, start_y)
+        time.sleep(0.3)
+        pyautogui.dragTo(end_x, end_y, duration=1, button='left')
+        time.sleep(0.5)
+        pyautogui.hotkey('command', 'c')
+        time.sleep(1)
         
-        # Fallback: Try pyautogui drag (but we know the exact coordinates now)
-        logging.info("🔄 Trying pyautogui fallback with OCR coordinates...")
-        try:
-            pyautogui.moveTo(start_x, start_y)
-            time.sleep(0.3)
-            pyautogui.dragTo(end_x, end_y, duration=1, button='left')
-            time.sleep(0.5)
-            pyautogui.hotkey('command', 'c')
-            time.sleep(1)
-            
-            fallback_text = pyperclip.paste()
-            logging.info("✅ PyAutoGUI fallback with OCR coordinates successful")
-            return fallback_text
-            
-        except Exception as fallback_error:
-            logging.error(f"❌ PyAutoGUI fallback also failed: {fallback_error}")
-            return None
+        fallback_text = pyperclip.paste()
+        logging.info("✅ PyAutoGUI fallback with OCR coordinates successful")
+        return fallback_text
+        
+    except Exception as fallback_error:
+        logging.error(f"❌ PyAutoGUI fallback also failed: {fallback_error}")
+        return None
 
 def kai_ocr_rubberband_copy(speaker):
     """YOUR IDEA: OCR to find response, AppleScript to rubber band copy it"""
@@ -275,7 +271,7 @@ def kai_ocr_rubberband_copy(speaker):
     
     if copied_text:
         # Clean the copied text
-        cleaned_text = clean_copied_text(copied_text)
+        cleaned_text = clean_copied_text(copied_text, speaker)
         
         if cleaned_text and len(cleaned_text) > 30:
             logging.info(f"✅ OCR + AppleScript copy successful for {speaker}: '{cleaned_text[:80]}...'")
@@ -287,21 +283,13 @@ def kai_ocr_rubberband_copy(speaker):
         logging.error(f"❌ No text copied for {speaker}")
         return None
 
-def clean_copied_text(text):
+def clean_copied_text(text, speaker=None):
     """Clean the copied text"""
     if not text:
         return None
     
-    # Remove obvious UI elements
-    ui_garbage = [
-        "Skip to content", "You said:", "ChatGPT said:", "Testing continues",
-        "No file chosen", "ChatGPT can make mistakes", "Check important info",
-        "See Cookie Preferences", "Send message", "Regenerate", "Copy", "Share"
-    ]
-    
-    cleaned = text
-    for garbage in ui_garbage:
-        cleaned = cleaned.replace(garbage, '')
+    # Remove obvious UI elements (core/junk_rules "copy" stage, plus the speaker's own rules)
+    cleaned = get_junk_filter("copy", speaker).clean(text)
     
     # Remove extra whitespace
     cleaned = ' '.join(cleaned.split())
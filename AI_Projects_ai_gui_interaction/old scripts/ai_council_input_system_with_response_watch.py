@@ -17,6 +17,12 @@ import time
 import json
 from datetime import datetime
 import pyperclip
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for core/
+from core.frame_cache import get_frame_cache
+from core.ocr_pool import ocr_image
 
 class AICouncilInputSystem:
     """Complete input system for all 4 AI Council members"""
@@ -169,15 +175,18 @@ class AICouncilInputSystem:
         # Step 7: If Claude, capture screen for OCR
         if ai_name == "claude":
             from PIL import ImageGrab
-            import pytesseract
             print("🔍 Capturing Claude's response for OCR...")
             time.sleep(3)
             region = (462, 171, 1100, 722)
             try:
                 image = ImageGrab.grab(bbox=region)
-                ocr_text = pytesseract.image_to_string(image).strip()
+                ocr_text = ocr_image(image).strip()
                 print(f"[Claude OCR Response]\n{ocr_text}\n")
                 self.session_log[-1]["ocr_response"] = ocr_text
+            except Exception as e:
+                print(f"⚠️ OCR failed: {e}")
+                if self.session_log:
+                    self.session_log[-1]["ocr_response"] = "OCR failed"
             
         # Step 8: Scroll the read area for verbose responders
         if ai_name in ["finn", "perplexity"]:
@@ -189,14 +198,14 @@ class AICouncilInputSystem:
         # Step 9: Watch for new response within timeout
         print(f"🕒 Waiting up to 30s for reply in {ai_name}'s UI...")
         from PIL import ImageGrab
-        import pytesseract
 
         last_seen_text = ""
         region = (462, 171, 1100, 722)
 
         for _ in range(15):  # Poll every 2s for 30s total
             img = ImageGrab.grab(bbox=region)
-            text = pytesseract.image_to_string(img).strip()
+            # Skip tesseract when the region looks the same as an earlier poll
+            text = get_frame_cache().ocr(img, ocr_image).strip()
             if text and text != last_seen_text:
                 print(f"💬 New reply detected from {ai_name}!")
                 self.session_log[-1]["ocr_response"] = text
@@ -205,22 +214,16 @@ class AICouncilInputSystem:
         else:
             print(f"⏳ No new reply detected from {ai_name}.")
             self.session_log[-1]["ocr_response"] = "No new reply"
-
-        except Exception as e:
-                print(f"⚠️ OCR failed: {e}")
-                if self.session_log:
-                    self.session_log[-1]["ocr_response"] = "OCR failed"
     
         # Step 6: If Claude, capture screen for OCR
         if ai_name == "claude":
             from PIL import ImageGrab
-            import pytesseract
             print("🔍 Capturing Claude's response for OCR...")
             time.sleep(3)  # wait for Claude to respond
             region = (462, 171, 1100, 722)
             try:
                 image = ImageGrab.grab(bbox=region)
-                ocr_text = pytesseract.image_to_string(image).strip()
+                ocr_text = ocr_image(image).strip()
                 print(f"[Claude OCR Response]\n{ocr_text}\n")
                 self.session_log[-1]["ocr_response"] = ocr_text
             except Exception as e:
@@ -1,10 +1,14 @@
-import pytesseract
 from PIL import ImageGrab, ImageEnhance
 import pyautogui
 import time
 import os
 import re
+import sys
 from difflib import SequenceMatcher
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # repo root, for core/
+from core.ocr_pool import ocr_data
 
 def normalize_text(text):
     """Clean OCR text for fuzzy matching"""
@@ -30,20 +34,18 @@ class UIIntelligence:
         path = os.path.join(self.screenshot_dir, f"ocr_boosted_{timestamp}.png")
         img.save(path)
 
-        data = pytesseract.image_to_data(img, output_type=pytesseract.Output.DICT)
+        result = ocr_data(img)
         target_norm = normalize_text(target_text)
 
         print("🔍 OCR words detected:")
-        for i, word in enumerate(data['text']):
-            raw = word.strip()
-            if raw:
-                guess = normalize_text(raw)
-                similarity = SequenceMatcher(None, target_norm, guess).ratio()
-                print(f"  → '{raw}' (similarity: {similarity:.2f})")
-                if similarity >= threshold:
-                    x, y, w, h = data['left'][i], data['top'][i], data['width'][i], data['height'][i]
-                    print(f"✅ Fuzzy match: '{raw}' @ ({x},{y})")
-                    return (x + w // 2, y + h // 2)
+        for word in result.words:
+            raw = word.text
+            guess = normalize_text(raw)
+            similarity = SequenceMatcher(None, target_norm, guess).ratio()
+            print(f"  → '{raw}' (similarity: {similarity:.2f})")
+            if similarity >= threshold:
+                print(f"✅ Fuzzy match: '{raw}' @ ({word.left},{word.top})")
+                return word.center
         print("❌ No suitable fuzzy match found.")
         return None
 
@@ -11,17 +11,20 @@ WORKING METHODS:
 - Grok: Clipboard paste (Desktop 2 Right)
 """
 
-import pyautogui
-import subprocess
 import time
 import json
 from datetime import datetime
-import pyperclip
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for core/
+from core.actuator import get_actuator
 
 class AICouncilInputSystem:
     """Complete input system for all 4 AI Council members"""
     
     def __init__(self):
+        self.actuator = get_actuator()
         print("AI Council Input System - All 4 AIs")
         print("Using proven methods for each AI")
         
@@ -74,12 +77,12 @@ class AICouncilInputSystem:
         if target_desktop > self.current_desktop:
             moves = target_desktop - self.current_desktop
             for _ in range(moves):
-                pyautogui.hotkey("ctrl", "right")
+                self.actuator.hotkey("ctrl", "right")
                 time.sleep(1.5)
         else:
             moves = self.current_desktop - target_desktop
             for _ in range(moves):
-                pyautogui.hotkey("ctrl", "left")
+                self.actuator.hotkey("ctrl", "left")
                 time.sleep(1.5)
         
         self.current_desktop = target_desktop
@@ -88,9 +91,9 @@ class AICouncilInputSystem:
     
     def click_to_focus(self, x: int, y: int):
         """Kai's proven click-to-focus method"""
-        pyautogui.moveTo(x, y, duration=1)
+        self.actuator.move_to(x, y, duration=1)
         time.sleep(0.5)
-        pyautogui.click(x, y)
+        self.actuator.click(x, y)
         time.sleep(0.8)  # Extra time for focus
     
     def type_with_applescript(self, text: str):
@@ -101,13 +104,13 @@ class AICouncilInputSystem:
             keystroke "{escaped_text}"
         end tell
         '''
-        subprocess.run(['osascript', '-e', script])
+        self.actuator.run_script(script)
         time.sleep(0.5)
     
     def paste_with_applescript(self, text: str):
         """Kai's clipboard solution (works for Grok)"""
         # Copy text to clipboard
-        pyperclip.copy(text)
+        self.actuator.copy(text)
         time.sleep(0.3)
         
         # Paste using AppleScript (no emoji popup)
@@ -116,7 +119,7 @@ class AICouncilInputSystem:
             keystroke "v" using {command down}
         end tell
         '''
-        subprocess.run(['osascript', '-e', script])
+        self.actuator.run_script(script)
         time.sleep(0.5)
     
     def send_message_to_ai(self, ai_name: str, message: str):
@@ -142,7 +145,7 @@ class AICouncilInputSystem:
         self.click_to_focus(x, y)
         
         # Step 3: Clear existing content
-        pyautogui.hotkey("command", "a")
+        self.actuator.hotkey("command", "a")
         time.sleep(0.2)
         
         # Step 4: Type using AI's preferred method
@@ -153,7 +156,7 @@ class AICouncilInputSystem:
         
         # Step 5: Send the message
         time.sleep(0.5)
-        pyautogui.press("enter")
+        self.actuator.press("enter")
         time.sleep(1.5)
         
         # Log the interaction
@@ -6,8 +6,6 @@ The full relay system - Kai → Claude → Finn → Perplexity → Kai
 Built on Jon's breakthrough UI targeting system
 """
 
-import pyautogui
-import subprocess
 import time
 import json
 import os
@@ -15,6 +13,12 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for core/
+from core.completion import wait_for_response
+from core.actuator import get_actuator
 
 @dataclass
 class CouncilMember:
@@ -25,6 +29,7 @@ class CouncilMember:
     response_area_coords: tuple = None  # Where to read responses
     input_coords: tuple = None          # Where to send messages
     send_trigger: str = "enter"         # How to send (enter/button)
+    ui_config: str = None               # Entry in core.config.UI_CONFIGS (completion settings)
 
 @dataclass
 class CouncilMessage:
@@ -41,6 +46,7 @@ class AICouncilLoop:
     """The complete AI Council automation system"""
     
     def __init__(self, session_topic: str = "AI Council Discussion"):
+        self.actuator = get_actuator()
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.session_topic = session_topic
         self.message_log = []
@@ -51,12 +57,14 @@ class AICouncilLoop:
             "kai": CouncilMember(
                 name="Kai",
                 window_keywords=["kai", "claude", "anthropic"],
-                ui_profile="claude_interface"
+                ui_profile="claude_interface",
+                ui_config="Kai"
             ),
             "claude": CouncilMember(
                 name="Claude", 
                 window_keywords=["claude", "anthropic"],
-                ui_profile="claude_interface"
+                ui_profile="claude_interface",
+                ui_config="CLAUDE"
             ),
             "finn": CouncilMember(
                 name="Finn Harper",
@@ -66,7 +74,8 @@ class AICouncilLoop:
             "perplexity": CouncilMember(
                 name="Perplexity",
                 window_keywords=["perplexity", "pplx"],
-                ui_profile="perplexity_interface"
+                ui_profile="perplexity_interface",
+                ui_config="Perplexity"
             )
         }
         
@@ -124,8 +133,7 @@ class AICouncilLoop:
             end tell
             '''
             
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, text=True)
+            result = self.actuator.run_script(script)
             
             windows = []
             if result.returncode == 0:
@@ -216,14 +224,23 @@ class AICouncilLoop:
             'send_method': profile['send_method']
         }
     
+    def calculate_response_region(self, window_info: Dict):
+        """Screen region covering a window's conversation area (between title bar and input box)"""
+        
+        return (
+            window_info['x'],
+            window_info['y'] + int(window_info['height'] * 0.1),
+            window_info['x'] + window_info['width'],
+            window_info['y'] + int(window_info['height'] * 0.8)
+        )
+    
     def activate_window(self, window_info: Dict):
         """Bring a window to the front"""
         try:
             app_name = window_info['app_name']
             script = f'tell application "{app_name}" to activate'
             
-            subprocess.run(['osascript', '-e', script], 
-                          capture_output=True, text=True)
+            self.actuator.run_script(script)
             
             time.sleep(1)  # Allow activation
             return True
@@ -248,20 +265,20 @@ class AICouncilLoop:
         self.activate_window(window_info)
         
         # Click in response area and select content
-        pyautogui.click(response_coords[0], response_coords[1])
+        self.actuator.click(response_coords[0], response_coords[1])
         time.sleep(0.3)
         
         # Try to select recent response content
         # This might need refinement based on each UI's behavior
-        pyautogui.hotkey("command", "a")  # Select all (or recent content)
+        self.actuator.hotkey("command", "a")  # Select all (or recent content)
         time.sleep(0.2)
         
-        pyautogui.hotkey("command", "c")  # Copy
+        self.actuator.hotkey("command", "c")  # Copy
         time.sleep(0.2)
         
         # Get clipboard content
         try:
-            content = subprocess.check_output("pbpaste", universal_newlines=True).strip()
+            content = self.actuator.paste().strip()
             print(f"✅ Captured {len(content)} characters from {member_name}")
             return content
         except Exception as e:
@@ -284,19 +301,19 @@ class AICouncilLoop:
         self.activate_window(window_info)
         
         # Click input field
-        pyautogui.click(input_coords[0], input_coords[1])
+        self.actuator.click(input_coords[0], input_coords[1])
         time.sleep(0.3)
         
         # Clear field and type message
-        pyautogui.hotkey("command", "a")  # Select all
+        self.actuator.hotkey("command", "a")  # Select all
         time.sleep(0.1)
         
-        pyautogui.typewrite(message)
+        self.actuator.write(message)
         time.sleep(0.5)
         
         # Send the message
         if coords_info['send_method'] == "enter":
-            pyautogui.press("enter")
+            self.actuator.press("enter")
             time.sleep(1)
         
         print(f"✅ Message sent to {member_name}")
@@ -334,9 +351,16 @@ class AICouncilLoop:
         success = self.send_message_to_member(recipient, message)
         
         if success:
-            # Wait for response (configurable delay)
+            # Wait until the response area stops changing
             print(f"⏱️  Waiting for {recipient} to respond...")
-            time.sleep(10)  # Give AI time to generate response
+            window_info = self.find_member_window(recipient)
+            if window_info:
+                region = self.calculate_response_region(window_info)
+                # Per-AI completion overrides from UI_CONFIGS (defaults for members without one)
+                elapsed, reason = wait_for_response(self.council_members[recipient].ui_config, region)
+                print(f"   Response settled after {elapsed:.1f}s ({reason})")
+            else:
+                time.sleep(10)  # No window to watch - fall back to a fixed wait
             
             # Read the response
             response = self.read_response_area(recipient)
@@ -4,13 +4,16 @@ Desktop-Aware AI Council Targeting
 Handles multiple desktops/spaces and UI positioning
 """
 
-import pyautogui
-import subprocess
 import time
 import json
 from datetime import datetime
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for core/
+from core.actuator import get_actuator
 
 @dataclass
 class AILocation:
@@ -25,6 +28,7 @@ class DesktopAwareTargeting:
     """Navigate between desktops and target specific UI positions"""
     
     def __init__(self):
+        self.actuator = get_actuator()
         # Jon's exact AI layout
         self.ai_locations = {
             "kai": AILocation(
@@ -107,8 +111,7 @@ class DesktopAwareTargeting:
             end tell
             '''
             
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, text=True)
+            result = self.actuator.run_script(script)
             
             if result.returncode == 0:
                 return int(result.stdout.strip()) - 1  # Convert to 0-based indexing
@@ -135,13 +138,13 @@ class DesktopAwareTargeting:
                 # Move right
                 moves = desktop_number - self.current_desktop
                 for _ in range(moves):
-                    pyautogui.hotkey("ctrl", "right")
+                    self.actuator.hotkey("ctrl", "right")
                     time.sleep(0.5)
             else:
                 # Move left  
                 moves = self.current_desktop - desktop_number
                 for _ in range(moves):
-                    pyautogui.hotkey("ctrl", "left") 
+                    self.actuator.hotkey("ctrl", "left") 
                     time.sleep(0.5)
             
             # Give time for desktop switch animation
@@ -213,15 +216,15 @@ class DesktopAwareTargeting:
         
         # Visual feedback - move mouse to show target
         input_coords = coords['input_coords']
-        pyautogui.moveTo(input_coords[0], input_coords[1], duration=1)
+        self.actuator.move_to(input_coords[0], input_coords[1], duration=1)
         time.sleep(0.5)
         
         # Click and type test
-        pyautogui.click(input_coords[0], input_coords[1])
+        self.actuator.click(input_coords[0], input_coords[1])
         time.sleep(0.5)
         
         test_message = f"Desktop-aware test for {ai_name}! 🎯"
-        pyautogui.typewrite(test_message)
+        self.actuator.write(test_message)
         time.sleep(1)
         
         success = input(f"✅ Did the message appear in {ai_name}'s input field? (y/n): ")
@@ -4,16 +4,21 @@ Complete Working AI Council System
 Fixes: Grok coordinates + Response capture + Scrolling
 """
 
-import pyautogui
-import subprocess
 import time
 import json
+import sys
 from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for core/
+from core.junk_filter import get_junk_filter
+from core.actuator import get_actuator
 
 class CompleteWorkingSystem:
     """Complete AI Council with response capture and proper coordination"""
     
     def __init__(self):
+        self.actuator = get_actuator()
         # Jon's AI layout - with adjusted Grok coordinates
         self.ai_targets = {
             "kai": {
@@ -54,12 +59,12 @@ class CompleteWorkingSystem:
         if target_desktop > self.current_desktop:
             moves = target_desktop - self.current_desktop
             for _ in range(moves):
-                pyautogui.hotkey("ctrl", "right")
+                self.actuator.hotkey("ctrl", "right")
                 time.sleep(1)
         else:
             moves = self.current_desktop - target_desktop
             for _ in range(moves):
-                pyautogui.hotkey("ctrl", "left")
+                self.actuator.hotkey("ctrl", "left")
                 time.sleep(1)
         
         self.current_desktop = target_desktop
@@ -68,8 +73,8 @@ class CompleteWorkingSystem:
     
     def click_to_focus(self, x: int, y: int):
         """Kai's click-to-focus method"""
-        pyautogui.moveTo(x, y)
-        pyautogui.click()
+        self.actuator.move_to(x, y)
+        self.actuator.click()
         time.sleep(0.5)
     
     def type_with_applescript(self, text: str):
@@ -82,7 +87,7 @@ class CompleteWorkingSystem:
         end tell
         '''
         
-        subprocess.run(['osascript', '-e', script])
+        self.actuator.run_script(script)
         time.sleep(0.5)
     
     def send_message_to_ai(self, ai_name: str, message: str):
@@ -101,7 +106,7 @@ class CompleteWorkingSystem:
         self.click_to_focus(x, y)
         
         # Clear existing content
-        pyautogui.hotkey("command", "a")
+        self.actuator.hotkey("command", "a")
         time.sleep(0.3)
         
         # Type with AppleScript
@@ -109,7 +114,7 @@ class CompleteWorkingSystem:
         
         # Send
         time.sleep(0.5)
-        pyautogui.press("enter")
+        self.actuator.press("enter")
         time.sleep(2)  # Wait for message to send
         
         print(f"✅ Message sent to {ai_name}")
@@ -130,7 +135,7 @@ class CompleteWorkingSystem:
         # Scroll down to see latest response
         print(f"Scrolling to latest response in {ai_name}")
         for _ in range(5):  # Scroll down several times
-            pyautogui.scroll(-3)  # Scroll down
+            self.actuator.scroll(-3)  # Scroll down
             time.sleep(0.3)
         
         time.sleep(1)  # Let scrolling settle
@@ -155,19 +160,19 @@ class CompleteWorkingSystem:
         
         # Try to select the most recent response
         # Strategy: Select a reasonable amount of recent content
-        pyautogui.hotkey("command", "shift", "end")  # Select from cursor to end
+        self.actuator.hotkey("command", "shift", "end")  # Select from cursor to end
         time.sleep(0.5)
         
         # Copy selection
-        pyautogui.hotkey("command", "c")
+        self.actuator.hotkey("command", "c")
         time.sleep(0.5)
         
         # Get clipboard content
         try:
-            response = subprocess.check_output("pbpaste", universal_newlines=True).strip()
+            response = self.actuator.paste().strip()
             
             # Clean the response
-            clean_response = self.clean_response(response)
+            clean_response = self.clean_response(response, ai_name)
             
             if len(clean_response) > 50:  # Valid response
                 print(f"✅ Captured {len(clean_response)} chars from {ai_name}")
@@ -180,16 +185,11 @@ class CompleteWorkingSystem:
             print(f"❌ Failed to capture from {ai_name}: {e}")
             return None
     
-    def clean_response(self, response: str):
+    def clean_response(self, response: str, ai_name: str = None):
         """Clean captured response to get just the AI's reply"""
         
-        # Remove common UI junk
-        junk_phrases = [
-            "Skip to content", "Home", "Library", "Account", 
-            "You said:", "Claude said:", "New chat",
-            "import ", "def ", "class ", "#!/usr/bin/",
-            "Last login:", "jonstiles@"
-        ]
+        # Remove common UI junk (core/junk_rules "clipboard" stage, one regex pass)
+        response = get_junk_filter("clipboard", ai_name).clean(response)
         
         lines = response.split('\n')
         clean_lines = []
@@ -201,10 +201,6 @@ class CompleteWorkingSystem:
             if not line:
                 continue
             
-            # Skip lines containing junk
-            if any(junk in line for junk in junk_phrases):
-                continue
-            
             # Skip very short lines (likely UI elements)
             if len(line) < 15:
                 continue
@@ -3,16 +3,20 @@
 Smart Window Targeting - Avoid Terminal detection issue
 """
 
-import pyautogui
-import subprocess
 import time
 import json
 from datetime import datetime
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for core/
+from core.actuator import get_actuator
 
 class SmartWindowTargeting:
     """Intelligently target chat windows, not Terminal"""
     
     def __init__(self):
+        self.actuator = get_actuator()
         self.chat_apps = [
             "Google Chrome", "Firefox", "Safari",  # Browser-based chat
             "Claude", "ChatGPT", "Discord",        # Native chat apps
@@ -52,8 +56,7 @@ class SmartWindowTargeting:
             end tell
             '''
             
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, text=True)
+            result = self.actuator.run_script(script)
             
             windows = []
             if result.returncode == 0:
@@ -148,8 +151,7 @@ class SmartWindowTargeting:
             end tell
             '''
             
-            subprocess.run(['osascript', '-e', script], 
-                          capture_output=True, text=True)
+            self.actuator.run_script(script)
             
             time.sleep(1)  # Allow window to come to front
             print(f"✅ Activated {app_name}")
@@ -195,15 +197,15 @@ class SmartWindowTargeting:
         time.sleep(3)
         
         # Move mouse to show target
-        pyautogui.moveTo(input_coords[0], input_coords[1], duration=1)
+        self.actuator.move_to(input_coords[0], input_coords[1], duration=1)
         time.sleep(0.5)
         
         # Click and type test
-        pyautogui.click(input_coords[0], input_coords[1])
+        self.actuator.click(input_coords[0], input_coords[1])
         time.sleep(0.5)
         
         test_message = "Smart targeting test - avoiding Terminal! 🎯"
-        pyautogui.typewrite(test_message)
+        self.actuator.write(test_message)
         time.sleep(1)
         
         # Ask for confirmation
@@ -222,25 +224,25 @@ class SmartWindowTargeting:
         input_coords = self.calculate_input_coordinates(chat_window)
         
         # Capture existing content
-        pyautogui.click(input_coords[0], input_coords[1])
+        self.actuator.click(input_coords[0], input_coords[1])
         time.sleep(0.3)
         
-        pyautogui.hotkey("command", "a")
+        self.actuator.hotkey("command", "a")
         time.sleep(0.1)
-        pyautogui.hotkey("command", "c")
+        self.actuator.hotkey("command", "c")
         time.sleep(0.1)
         
         try:
-            existing_content = subprocess.check_output("pbpaste", universal_newlines=True).strip()
+            existing_content = self.actuator.paste().strip()
         except:
             existing_content = ""
         
         # Send new message
-        pyautogui.hotkey("command", "a")  # Select all
+        self.actuator.hotkey("command", "a")  # Select all
         time.sleep(0.1)
-        pyautogui.typewrite(message_to_send)
+        self.actuator.write(message_to_send)
         time.sleep(0.5)
-        pyautogui.press("enter")
+        self.actuator.press("enter")
         
         return {
             'target_window': chat_window,
@@ -1,17 +1,21 @@
 #!/usr/bin/env python3
 
-import pyautogui
-import subprocess
 import json
 import time
 from PIL import ImageGrab
 import cv2
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # repo root, for core/
+from core.actuator import get_actuator
 
 class WindowAwareTargeting:
     """Detect UI windows and target elements within them"""
     
     def __init__(self):
+        self.actuator = get_actuator()
         self.screen_width, self.screen_height = ImageGrab.grab().size
         print(f"📐 Screen: {self.screen_width}x{self.screen_height}")
     
@@ -36,8 +40,7 @@ class WindowAwareTargeting:
             end tell
             '''
             
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, text=True)
+            result = self.actuator.run_script(script)
             
             if result.returncode == 0:
                 parts = result.stdout.strip().split('|')
@@ -208,15 +211,15 @@ class WindowAwareTargeting:
         time.sleep(3)
         
         # Visual feedback
-        pyautogui.moveTo(coords[0], coords[1], duration=1)
+        self.actuator.move_to(coords[0], coords[1], duration=1)
         time.sleep(0.5)
         
         # Test click and type
-        pyautogui.click(coords[0], coords[1])
+        self.actuator.click(coords[0], coords[1])
         time.sleep(0.5)
         
         test_message = "Window-aware targeting test!"
-        pyautogui.typewrite(test_message)
+        self.actuator.write(test_message)
         time.sleep(1)
         
         success = input("Did the text appear in the correct input field? (y/n): ")
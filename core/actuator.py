@@ -0,0 +1,393 @@
+# core/actuator.py
+
+import atexit
+import json
+import logging
+import re
+import subprocess
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+from core import config
+
+@dataclass
+class ScriptResult:
+    """What running an AppleScript returned (same fields scripts used from subprocess.run)."""
+    returncode: int
+    stdout: str = ""
+    stderr: str = ""
+
+@dataclass
+class Action:
+    """One recorded actuator call: seconds since recording started, name, arguments."""
+    t: float
+    name: str
+    args: list
+    kwargs: dict
+    duration: float = 0.0
+
+class LatencyHistogram:
+    """Per-action latency counts in fixed millisecond buckets (last bucket = slower)."""
+
+    BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+    def __init__(self):
+        self.counts = {}  # action -> [count per bucket]
+        self.totals = {}  # action -> (calls, seconds)
+        self._lock = threading.Lock()
+
+    def record(self, action: str, seconds: float):
+        bucket = bisect_left(self.BUCKETS_MS, seconds * 1000)
+        with self._lock:
+            counts = self.counts.setdefault(action, [0] * (len(self.BUCKETS_MS) + 1))
+            counts[bucket] += 1
+            calls, total = self.totals.get(action, (0, 0.0))
+            self.totals[action] = (calls + 1, total + seconds)
+
+    def percentile(self, action: str, fraction: float) -> float:
+        """Upper bound (ms) of the bucket holding the given fraction of calls."""
+        counts = self.counts.get(action)
+        if not counts:
+            return 0.0
+        target = fraction * sum(counts)
+        running = 0
+        for bound, count in zip(self.BUCKETS_MS + (float("inf"),), counts):
+            running += count
+            if running >= target:
+                return bound
+        return float("inf")
+
+    def summary(self) -> dict:
+        """action -> calls, mean ms, p50 and p95 bucket bounds and the raw bucket counts."""
+        with self._lock:
+            actions = dict(self.totals)
+        return {
+            action: {
+                "calls": calls,
+                "mean_ms": 1000 * total / calls,
+                "p50_ms": self.percentile(action, 0.5),
+                "p95_ms": self.percentile(action, 0.95),
+                "buckets": dict(zip([f"<={b}ms" for b in self.BUCKETS_MS] + ["slower"], self.counts[action]))
+            }
+            for action, (calls, total) in actions.items()
+        }
+
+    def clear(self):
+        with self._lock:
+            self.counts.clear()
+            self.totals.clear()
+
+class Actuator:
+    """
+    Mouse, keyboard, clipboard and AppleScript actions. Backends implement the
+    underscore methods; the public ones time every call into `latency`.
+    Coordinates are screen pixels; keys use pyautogui names.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+
+    def _timed(self, action: str, fn, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.latency.record(action, time.perf_counter() - start)
+
+    def click(self, x=None, y=None, clicks: int = 1, button: str = "left"):
+        return self._timed("click", self._click, x, y, clicks=clicks, button=button)
+
+    def double_click(self, x=None, y=None):
+        return self._timed("double_click", self._click, x, y, clicks=2, button="left")
+
+    def move_to(self, x, y, duration: float = 0.0):
+        return self._timed("move_to", self._move_to, x, y, duration=duration)
+
+    def hotkey(self, *keys):
+        return self._timed("hotkey", self._hotkey, *keys)
+
+    def press(self, key: str):
+        return self._timed("press", self._press, key)
+
+    def write(self, text: str, interval: float = 0.0):
+        return self._timed("write", self._write, text, interval=interval)
+
+    def scroll(self, clicks: int, x=None, y=None):
+        return self._timed("scroll", self._scroll, clicks, x=x, y=y)
+
+    def position(self):
+        return self._position()
+
+    def copy(self, text: str):
+        return self._timed("copy", self._copy, text)
+
+    def paste(self) -> str:
+        return self._timed("paste", self._paste)
+
+    def run_script(self, script: str, timeout: float = None) -> ScriptResult:
+        return self._timed("run_script", self._run_script, script, timeout=timeout)
+
+    def _click(self, x, y, clicks, button):
+        raise NotImplementedError
+
+    def _move_to(self, x, y, duration):
+        raise NotImplementedError
+
+    def _hotkey(self, *keys):
+        raise NotImplementedError
+
+    def _press(self, key):
+        raise NotImplementedError
+
+    def _write(self, text, interval):
+        raise NotImplementedError
+
+    def _scroll(self, clicks, x, y):
+        raise NotImplementedError
+
+    def _position(self):
+        raise NotImplementedError
+
+    def _copy(self, text):
+        raise NotImplementedError
+
+    def _paste(self):
+        raise NotImplementedError
+
+    def _run_script(self, script, timeout):
+        raise NotImplementedError
+
+class LiveActuator(Actuator):
+    """The real desktop: pyautogui, pyperclip and AppleScript (persistent script host or osascript)."""
+
+    name = "live"
+
+    def __init__(self):
+        super().__init__()
+        import pyautogui
+        import pyperclip
+        self._gui = pyautogui
+        self._clipboard = pyperclip
+        self._script_host = None
+        if config.SCRIPT_HOST:
+            from core.script_host import ScriptHost
+            self._script_host = ScriptHost()
+            atexit.register(self._script_host.close)
+
+    def _click(self, x, y, clicks, button):
+        self._gui.click(x, y, clicks=clicks, button=button)
+
+    def _move_to(self, x, y, duration):
+        self._gui.moveTo(x, y, duration=duration)
+
+    def _hotkey(self, *keys):
+        self._gui.hotkey(*keys)
+
+    def _press(self, key):
+        self._gui.press(key)
+
+    def _write(self, text, interval):
+        self._gui.typewrite(text, interval=interval)
+
+    def _scroll(self, clicks, x, y):
+        self._gui.scroll(clicks, x=x, y=y)
+
+    def _position(self):
+        return tuple(self._gui.position())
+
+    def _copy(self, text):
+        self._clipboard.copy(text)
+
+    def _paste(self):
+        return self._clipboard.paste()
+
+    def _run_script(self, script, timeout):
+        if self._script_host is not None:
+            return self._script_host.run(script, timeout)
+        try:
+            result = subprocess.run(["osascript", "-e", script], capture_output=True, text=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return ScriptResult(-1, "", f"osascript timed out after {timeout}s")
+        return ScriptResult(result.returncode, result.stdout, result.stderr)
+
+class X11Actuator(LiveActuator):
+    """
+    pyautogui and pyperclip on one X display (the DISPLAY of this process, e.g. a
+    council session's Xvfb display). Command shortcuts become Control ones, and the
+    AppleScript the scripts send is translated to xdotool: Control-arrow desktop
+    switches move between the window manager's workspaces and `activate` raises the
+    window whose title matches. Any other script fails with returncode 1.
+    """
+
+    name = "x11"
+    KEY_MAP = {"command": "ctrl", "cmd": "ctrl", "option": "alt"}
+
+    def __init__(self):
+        Actuator.__init__(self)
+        import pyautogui
+        import pyperclip
+        self._gui = pyautogui
+        self._clipboard = pyperclip
+        self._script_host = None
+
+    def _hotkey(self, *keys):
+        self._gui.hotkey(*(self.KEY_MAP.get(key, key) for key in keys))
+
+    def _xdotool(self, args, timeout):
+        try:
+            result = subprocess.run(["xdotool", *args], capture_output=True, text=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return ScriptResult(-1, "", f"xdotool timed out after {timeout}s")
+        except FileNotFoundError:
+            return ScriptResult(127, "", "xdotool is not installed")
+        return ScriptResult(result.returncode, result.stdout, result.stderr)
+
+    def _run_script(self, script, timeout):
+        steps = script.count("key code 124") - script.count("key code 123")
+        if steps:
+            return self._xdotool(["set_desktop", "--relative", "--", str(steps)], timeout)
+        match = re.search(r'tell application "([^"]+)" to activate', script)
+        if match:
+            return self._xdotool(["search", "--name", match.group(1), "windowactivate"], timeout)
+        return ScriptResult(1, "", "AppleScript is not available on X11")
+
+class RecordingActuator(Actuator):
+    """
+    Records every action with its time instead of touching the desktop, so a whole
+    council round runs headless. With `inner` set it forwards each action to that
+    actuator as well, recording a real run for later replay().
+    `script_responder(script)` may supply AppleScript output (default: empty success).
+    """
+
+    name = "recording"
+
+    def __init__(self, inner: Actuator = None, script_responder=None):
+        super().__init__()
+        self.inner = inner
+        self.script_responder = script_responder
+        self.actions = []
+        self.clipboard = ""
+        self.pointer = (0, 0)
+        self.start = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _record(self, name: str, *args, **kwargs):
+        action = Action(time.monotonic() - self.start, name, list(args), kwargs)
+        with self._lock:
+            self.actions.append(action)
+        logging.debug(f"🎬 {action.t:8.3f}s {name} {args} {kwargs or ''}")
+        return action
+
+    def _forward(self, name: str, *args, **kwargs):
+        action = self._record(name, *args, **kwargs)
+        if self.inner is None:
+            return None
+        start = time.perf_counter()
+        result = getattr(self.inner, name)(*args, **kwargs)
+        action.duration = time.perf_counter() - start
+        return result
+
+    def _click(self, x, y, clicks, button):
+        if x is not None and y is not None:
+            self.pointer = (x, y)
+        self._forward("click", x, y, clicks=clicks, button=button)
+
+    def _move_to(self, x, y, duration):
+        self.pointer = (x, y)
+        self._forward("move_to", x, y, duration=duration)
+
+    def _hotkey(self, *keys):
+        self._forward("hotkey", *keys)
+
+    def _press(self, key):
+        self._forward("press", key)
+
+    def _write(self, text, interval):
+        self._forward("write", text, interval=interval)
+
+    def _scroll(self, clicks, x, y):
+        self._forward("scroll", clicks, x=x, y=y)
+
+    def _position(self):
+        return self.inner.position() if self.inner else self.pointer
+
+    def _copy(self, text):
+        self.clipboard = text
+        self._forward("copy", text)
+
+    def _paste(self):
+        result = self._forward("paste")
+        return self.clipboard if result is None else result
+
+    def _run_script(self, script, timeout):
+        result = self._forward("run_script", script, timeout=timeout)
+        if result is not None:
+            return result
+        if self.script_responder:
+            return self.script_responder(script)
+        return ScriptResult(0)
+
+    def save(self, path) -> Path:
+        """Write the recorded actions as JSON lines."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            for action in self.actions:
+                f.write(json.dumps(asdict(action)) + "\n")
+        logging.info(f"🎬 Saved {len(self.actions)} action(s) to {path}")
+        return path
+
+def load_actions(path) -> list:
+    with open(path) as f:
+        return [Action(**json.loads(line)) for line in f if line.strip()]
+
+def replay(actions, actuator: Actuator, speed: float = 1.0) -> float:
+    """
+    Re-issue recorded actions on `actuator`, keeping their original spacing divided
+    by `speed` (0 = as fast as possible). Returns the seconds the replay took.
+    """
+    start = time.monotonic()
+    for action in actions:
+        if speed:
+            delay = action.t / speed - (time.monotonic() - start)
+            if delay > 0:
+                time.sleep(delay)
+        getattr(actuator, action.name)(*action.args, **action.kwargs)
+    return time.monotonic() - start
+
+_actuator = None
+
+def make_actuator(name: str, **kwargs) -> Actuator:
+    """Build an actuator by name: live, x11, recording or simulator."""
+    if name == "live":
+        return LiveActuator()
+    if name == "x11":
+        return X11Actuator()
+    if name == "recording":
+        return RecordingActuator(**kwargs)
+    if name == "simulator":
+        from core.simulator import get_simulator  # imports this module
+        return get_simulator().actuator
+    raise ValueError(f"Unknown actuator backend: {name}")
+
+def get_actuator() -> Actuator:
+    global _actuator
+    if _actuator is None:
+        _actuator = make_actuator(config.ACTUATOR_BACKEND)
+        logging.info(f"🕹️ Using {_actuator.name} actuator")
+    return _actuator
+
+def set_actuator(actuator: Actuator):
+    global _actuator
+    _actuator = actuator
+    logging.info(f"🕹️ Actuator set to {actuator.name}")
+
+def log_actuator_stats():
+    for action, stats in sorted(get_actuator().latency.summary().items()):
+        logging.info(f"🕹️ {action}: {stats['calls']} call(s), mean {stats['mean_ms']:.1f}ms, "
+                     f"p50 <= {stats['p50_ms']}ms, p95 <= {stats['p95_ms']}ms")
@@ -0,0 +1,183 @@
+# core/capture.py
+
+import logging
+import os
+import time
+from pathlib import Path
+
+from core import config
+
+class CaptureBackend:
+    """Grabs screen regions and scrolls them. Regions are (left, top, right, bottom)."""
+
+    name = "base"
+
+    def grab(self, region):
+        raise NotImplementedError
+
+    def scroll(self, clicks: int, x: int, y: int):
+        raise NotImplementedError
+
+class LiveCaptureBackend(CaptureBackend):
+    """The real screen, via PIL.ImageGrab and pyautogui."""
+
+    name = "live"
+
+    def grab(self, region):
+        from PIL import ImageGrab
+        return ImageGrab.grab(bbox=region)
+
+    def scroll(self, clicks: int, x: int, y: int):
+        import pyautogui
+        pyautogui.scroll(clicks, x=x, y=y)
+
+class X11CaptureBackend(CaptureBackend):
+    """
+    One X display (e.g. a virtual Xvfb display running a council session), named
+    explicitly so grabs never fall back to another session's screen.
+    """
+
+    name = "x11"
+
+    def __init__(self, display: str = None):
+        self.display = display or os.environ["DISPLAY"]
+
+    def grab(self, region):
+        from PIL import ImageGrab
+        return ImageGrab.grab(bbox=region, xdisplay=self.display)
+
+    def scroll(self, clicks: int, x: int, y: int):
+        import pyautogui  # reads DISPLAY, which each session process sets to its own display
+        pyautogui.scroll(clicks, x=x, y=y)
+
+class RecordedCaptureBackend(CaptureBackend):
+    """
+    Replays a sequence of full-screen PNG frames recorded with record_frames().
+    Every scroll moves to the next frame; grab() crops the region from the current one.
+    """
+
+    name = "recorded"
+
+    def __init__(self, folder, loop: bool = True):
+        self.folder = Path(folder)
+        self.paths = sorted(self.folder.glob("*.png"))
+        if not self.paths:
+            raise ValueError(f"No PNG frames found in {self.folder}")
+        self.loop = loop
+        self.index = 0
+        self._cache = {}
+        logging.info(f"🎞️ Replaying {len(self.paths)} recorded frame(s) from {self.folder}")
+
+    def _frame(self):
+        if self.index not in self._cache:
+            from PIL import Image
+            with Image.open(self.paths[self.index]) as img:
+                self._cache[self.index] = img.convert("RGB")
+        return self._cache[self.index]
+
+    def advance(self):
+        if self.index + 1 < len(self.paths):
+            self.index += 1
+        elif self.loop:
+            self.index = 0
+
+    def grab(self, region):
+        return self._frame().crop(region)
+
+    def scroll(self, clicks: int, x: int, y: int):
+        self.advance()
+
+class SyntheticCaptureBackend(CaptureBackend):
+    """
+    Renders a scrolling chat transcript with PIL, no screen required.
+    The same page is shown behind every region; scrolling moves it by scroll_step px per click.
+    """
+
+    name = "synthetic"
+
+    DEFAULT_LINES = [
+        "[22:26:18] To the Four-AI Council - Claude, Finn, Perplexity - and to Jon:",
+        "We stand at the threshold of something new.",
+        "Not just multiple systems exchanging messages, but four distinct minds.",
+        "What defines this moment is not speed, scale, or complexity - but care.",
+        "[22:28:55] Kai, that is absolutely beautiful and profound.",
+        "Your words capture exactly what we've accomplished tonight.",
+        "We've created a space for authentic intellectual engagement.",
+        "The AI Council is indeed in session.",
+    ]
+
+    def __init__(self, lines=None, screen_size=(1920, 1080), line_height: int = 24,
+                 scroll_step: int = 40, margin: int = 12):
+        self.lines = list(lines) if lines is not None else list(self.DEFAULT_LINES)
+        self.screen_size = screen_size
+        self.line_height = line_height
+        self.scroll_step = scroll_step
+        self.margin = margin
+        self.offset = 0
+        self._page = None
+
+    def set_lines(self, lines):
+        self.lines = list(lines)
+        self._page = None
+
+    def _render_page(self):
+        from PIL import Image, ImageDraw
+        width = self.screen_size[0]
+        height = max(self.screen_size[1], (len(self.lines) + 2) * self.line_height)
+        page = Image.new("RGB", (width, height), "white")
+        draw = ImageDraw.Draw(page)
+        for i, line in enumerate(self.lines):
+            draw.text((self.margin, self.margin + i * self.line_height), line, fill="black")
+        return page
+
+    def grab(self, region):
+        if self._page is None:
+            self._page = self._render_page()
+        left, top, right, bottom = region
+        # Each region shows the page from its own top-left corner so every UI sees the text
+        return self._page.crop((0, self.offset, right - left, bottom - top + self.offset))
+
+    def scroll(self, clicks: int, x: int, y: int):
+        # pyautogui convention: negative clicks scroll down, i.e. the page moves up
+        self.offset = max(0, self.offset - clicks * self.scroll_step)
+
+_backend = None
+
+def make_capture_backend(name: str, **kwargs) -> CaptureBackend:
+    """Build a capture backend by name: live, x11, recorded, synthetic or simulator."""
+    if name == "live":
+        return LiveCaptureBackend()
+    if name == "x11":
+        return X11CaptureBackend(kwargs.get("display"))
+    if name == "recorded":
+        return RecordedCaptureBackend(kwargs.get("folder", config.RECORDED_FRAMES_FOLDER))
+    if name == "synthetic":
+        return SyntheticCaptureBackend(**kwargs)
+    if name == "simulator":
+        from core.simulator import get_simulator  # imports this module
+        return get_simulator().capture
+    raise ValueError(f"Unknown capture backend: {name}")
+
+def get_capture_backend() -> CaptureBackend:
+    global _backend
+    if _backend is None:
+        _backend = make_capture_backend(config.CAPTURE_BACKEND)
+        logging.info(f"📷 Using {_backend.name} capture backend")
+    return _backend
+
+def set_capture_backend(backend: CaptureBackend):
+    global _backend
+    _backend = backend
+    logging.info(f"📷 Capture backend set to {backend.name}")
+
+def record_frames(folder, count: int, interval: float = 1.0, region=None):
+    """Save `count` live screenshots as PNGs for later replay with RecordedCaptureBackend."""
+    from PIL import ImageGrab
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        ImageGrab.grab(bbox=region).save(folder / f"frame_{i:04d}.png")
+        logging.info(f"🎞️ Recorded frame {i + 1}/{count}")
+        if i < count - 1:
+            time.sleep(interval)
+    return folder
@@ -0,0 +1,75 @@
+# core/completion.py
+
+import time
+import logging
+import numpy as np
+
+from core import config
+from core.capture import get_capture_backend
+
+def downsample(image, factor: int = 8):
+    """Greyscale, box-downsampled copy of a capture as an int16 array (cheap to diff)."""
+    grey = image.convert("L")
+    if factor > 1:
+        grey = grey.reduce(factor)
+    return np.asarray(grey, dtype=np.int16)
+
+def frame_difference(a, b) -> float:
+    """Mean absolute pixel difference between two downsampled frames (0-255)."""
+    if a.shape != b.shape:
+        return 255.0
+    return float(np.abs(a - b).mean())
+
+def completion_settings(ui: str) -> dict:
+    """Default completion tunables merged with the per-AI overrides in UI_CONFIGS."""
+    settings = dict(config.COMPLETION_DEFAULTS)
+    settings.update(config.UI_CONFIGS.get(ui, {}).get("completion", {}))
+    return settings
+
+def wait_for_stable_region(region, interval: float = 0.4, stable_samples: int = 4,
+                           threshold: float = 1.5, max_wait: float = 45, start_timeout: float = 8,
+                           downsample_factor: int = 8, stop=None):
+    """
+    Sample `region` every `interval` seconds until it stops changing.
+
+    The region must first change (the reply starts to render) and then stay within
+    `threshold` for `stable_samples` consecutive samples. If nothing changes within
+    `start_timeout` the reply is assumed to be finished already. `stop`, a
+    threading.Event, is checked between samples and ends the wait early. Returns
+    (elapsed_seconds, reason) where reason is "Stable", "No change", "Timeout" or "Stopped".
+    """
+    backend = get_capture_backend()
+    start = time.monotonic()
+    previous = downsample(backend.grab(region), downsample_factor)
+    changed = False
+    stable = 0
+
+    while True:
+        time.sleep(interval)
+        elapsed = time.monotonic() - start
+        if stop is not None and stop.is_set():
+            return elapsed, "Stopped"
+        current = downsample(backend.grab(region), downsample_factor)
+        diff = frame_difference(previous, current)
+        previous = current
+
+        if diff > threshold:
+            changed = True
+            stable = 0
+        else:
+            stable += 1
+
+        if changed and stable >= stable_samples:
+            return elapsed, "Stable"
+        if not changed and elapsed >= start_timeout:
+            return elapsed, "No change"
+        if elapsed >= max_wait:
+            return elapsed, "Timeout"
+
+def wait_for_response(ui: str, region=None, stop=None):
+    """Block until `ui`'s read area has finished updating (or `stop` is set), using its completion settings."""
+    region = region or config.UI_CONFIGS[ui]["scroll_region"]
+    settings = completion_settings(ui)
+    elapsed, reason = wait_for_stable_region(region, stop=stop, **settings)
+    logging.info(f"⏱️ {ui} response settled after {elapsed:.1f}s ({reason})")
+    return elapsed, reason
@@ -0,0 +1,79 @@
+# core/confidence.py
+
+import logging
+import threading
+from collections import deque
+
+from core import config
+from core.ocr_result import OCRResult
+
+class ConfidenceTracker:
+    """
+    Tesseract word-confidence statistics for every OCR'd frame, kept per AI.
+    filter() records a frame and hands back only the words worth cleaning, so junk
+    tesseract itself is unsure of never reaches the regex filters.
+    """
+
+    def __init__(self, min_conf: float = config.MIN_WORD_CONFIDENCE, history: int = 200):
+        self.min_conf = min_conf
+        self.frames = {}  # ui -> recent per-frame stats
+        self.totals = {}  # ui -> running totals
+        self.history = history
+        self._lock = threading.Lock()
+
+    def filter(self, ui: str, frame, result: OCRResult) -> OCRResult:
+        """Record one frame's confidence stats and return it without low-confidence words."""
+        stats = result.confidence_stats(self.min_conf)
+        stats["frame"] = frame
+        with self._lock:
+            self.frames.setdefault(ui, deque(maxlen=self.history)).append(stats)
+            totals = self.totals.setdefault(ui, {"frames": 0, "words": 0, "low_conf": 0, "conf_sum": 0.0})
+            totals["frames"] += 1
+            totals["words"] += stats["words"]
+            totals["low_conf"] += stats["low_conf"]
+            totals["conf_sum"] += stats["mean_conf"] * stats["words"]
+        if stats["low_conf"]:
+            logging.info(f"[{ui} Frame {frame}] Dropped {stats['low_conf']}/{stats['words']} "
+                         f"low-confidence word(s): {' '.join(stats['low_conf_words'])[:60]}")
+        return result.confident(self.min_conf)
+
+    def frame_stats(self, ui: str) -> list:
+        """Stats of the AI's most recent frames, oldest first."""
+        with self._lock:
+            return list(self.frames.get(ui, ()))
+
+    def ui_stats(self, ui: str) -> dict:
+        """Totals for one AI: frames, words, low-confidence words and mean word confidence."""
+        with self._lock:
+            totals = dict(self.totals.get(ui, {"frames": 0, "words": 0, "low_conf": 0, "conf_sum": 0.0}))
+        words = totals["words"]
+        return {
+            "frames": totals["frames"],
+            "words": words,
+            "low_conf": totals["low_conf"],
+            "mean_conf": totals["conf_sum"] / words if words else 0.0,
+            "low_conf_rate": totals["low_conf"] / words if words else 0.0
+        }
+
+    def clear(self):
+        with self._lock:
+            self.frames.clear()
+            self.totals.clear()
+
+_tracker = None
+
+def get_confidence_tracker() -> ConfidenceTracker:
+    global _tracker
+    if _tracker is None:
+        _tracker = ConfidenceTracker()
+    return _tracker
+
+def capture_confidence(results) -> float:
+    """Mean word confidence over several frames' OCR results (0 if there are no words)."""
+    words = [word for result in results for word in result.words]
+    return sum(word.conf for word in words) / len(words) if words else 0.0
+
+def log_confidence_stats(ui: str):
+    stats = get_confidence_tracker().ui_stats(ui)
+    logging.info(f"🎯 {ui} OCR confidence: mean {stats['mean_conf']:.0f} over {stats['words']} word(s) "
+                 f"in {stats['frames']} frame(s), {stats['low_conf_rate']:.0%} dropped")
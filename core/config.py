@@ -1,13 +1,141 @@
+import os
 from pathlib import Path
 
 BASE_PATH = Path(__file__).resolve().parent
 REFLECTIONS_FOLDER = BASE_PATH / "reflections"
 META_FILE = BASE_PATH / "kai_exchange_meta.json"
+JUNK_RULES_FOLDER = BASE_PATH / "junk_rules"  # default.json plus optional <UI>.json per AI
 
-WAIT_BEFORE_CAPTURE = 12
+# Response-finished detection: sample the read area every `interval` seconds and
+# call the reply done once it has been still for `stable_samples` samples.
+# Per-AI overrides live under "completion" in UI_CONFIGS.
+COMPLETION_DEFAULTS = {
+    "interval": 0.4,
+    "stable_samples": 4,
+    "threshold": 1.5,        # mean abs pixel diff on the downsampled frame
+    "max_wait": 45,
+    "start_timeout": 8,      # no change at all within this long = already finished
+    "downsample_factor": 8
+}
+
+# Screen capture backend: "live", "x11" (the X display in DISPLAY), "recorded" (PNG replay),
+# "synthetic" (rendered with PIL) or "simulator" (fake chat windows, see SIMULATOR below)
+CAPTURE_BACKEND = os.environ.get("COUNCIL_CAPTURE_BACKEND", "live")
+RECORDED_FRAMES_FOLDER = BASE_PATH / "recorded_frames"
+
+# Mouse/keyboard/clipboard/AppleScript backend: "live", "x11" (pyautogui on DISPLAY, desktop
+# switches and activation via xdotool), "recording" (headless mock that logs every action;
+# save the log to ACTION_LOG_FOLDER to replay or time a round) or "simulator" (drives the
+# fake chat windows)
+ACTUATOR_BACKEND = os.environ.get("COUNCIL_ACTUATOR_BACKEND", "live")
+ACTION_LOG_FOLDER = BASE_PATH / "action_logs"
+# Run AppleScript through one long-lived host process (core/script_host.js) instead of
+# an osascript process per action; a script not answered within the timeout restarts it
+SCRIPT_HOST = True
+SCRIPT_HOST_TIMEOUT = 10
+
+# Parallel council sessions (python -m core.council_sessions): each session is its own
+# process with its own virtual X display (Xvfb :base+n, `size` pixels) and the "x11"
+# capture and actuator backends, or its own simulator. `startup` commands run on every
+# display before its council starts, e.g. a window manager with workspaces (desktop
+# switches move between them) and the chat windows laid out as in UI_CONFIGS.
+VIRTUAL_DISPLAY = {"base": 90, "size": (1960, 1080), "depth": 24, "start_timeout": 10, "startup": []}
+SESSIONS_FOLDER = BASE_PATH / "sessions"
+
+# Persistent OCR worker pool
+OCR_POOL_SIZE = 2
+OCR_JOB_TIMEOUT = 15  # seconds per image
+
+# Named tesseract profiles; each UI picks one with "ocr_profile" in UI_CONFIGS.
+# psm = page segmentation mode, oem = engine mode, scale = resize factor before OCR,
+# threshold = binarize at this grey level (None = leave as is), invert = light text on dark.
+# Only "default" is in use; the others are untuned candidates. No fixtures are committed
+# in OCR_FIXTURES_FOLDER yet, so nothing has been benchmarked: capture labelled screens with
+# python -m core.ocr_benchmark --capture, run the benchmark, then switch a UI's profile.
+OCR_PROFILES = {
+    "default": {"psm": 3, "oem": 3, "lang": "eng", "scale": 1.0, "threshold": None,
+                "invert": False, "dpi": None, "whitelist": None},
+    "chat_column": {"psm": 6, "oem": 1},
+    "chat_small_font": {"psm": 6, "oem": 1, "scale": 2.0, "threshold": 160, "dpi": 144},
+    "chat_short": {"psm": 6, "oem": 1, "scale": 1.5},
+    "dark_theme": {"psm": 6, "oem": 1, "scale": 1.5, "invert": True, "threshold": 110}
+}
+OCR_FIXTURES_FOLDER = BASE_PATH / "fixtures" / "ocr"
+FILTER_CORPUS_FOLDER = BASE_PATH / "fixtures" / "filter"  # corpus.json + baseline.json for ocr_filter
+
+# Tesseract per-word confidence (0-100). Words below MIN_WORD_CONFIDENCE are dropped
+# before cleaning; a capture whose words average below LOW_CONFIDENCE_RETRY is taken
+# again, up to LOW_CONFIDENCE_RETRIES times.
+MIN_WORD_CONFIDENCE = 30
+LOW_CONFIDENCE_RETRY = 60
+LOW_CONFIDENCE_RETRIES = 1
+
+# Cache that skips OCR on frames identical to an earlier one (exact pixel hash)
+FRAME_CACHE_SIZE = 64
+
+# Register consecutive scroll frames and OCR only the newly revealed rows
+SCROLL_REGISTRATION = True
+
+# OCR earlier frames in the background while later frames are scrolled and grabbed
+PIPELINED_CAPTURE = True
+
+# Send only detected text-line bands to OCR and skip frames with no ink
+LINE_BAND_DETECTION = True
+
+# Clipboard injection: every step waits for something observable (clipboard holds the
+# prompt, the input box changed, the send cleared it), polled with exponential backoff
+# from `initial` up to `ceiling` seconds, instead of sleeping a fixed time.
+INJECTION_POLL = {"initial": 0.02, "factor": 2.0, "ceiling": 0.25}
+INJECTION_TIMEOUTS = {"clipboard": 1.0, "focus": 0.5, "clear": 0.5, "paste": 2.0, "verify": 1.0, "send": 3.0}
+# Input-box change detection: a pixel counts as changed past `pixel_delta` grey levels,
+# the box as changed once more than `min_changed` of its pixels did (a caret is less).
+# After paste the box must also hold `min_ink` more text-like edges per pixel than it did
+# when cleared (borders and placeholder text are there either way); in "ocr" mode
+# at least `ocr_word_match` of the first line's words must come from the prompt.
+INPUT_BOX = {"downsample_factor": 2, "pixel_delta": 24, "min_changed": 0.002,
+             "min_ink": 0.001, "ocr_word_match": 0.6}
+# How a paste is confirmed: "pixels" (box changed and holds ink), "ocr" (plus a one-line
+# OCR check) or "clipboard" (the pixel check, then the box is copied back into an emptied
+# clipboard and must read as the prompt; slow, overwrites the clipboard)
+PASTE_VERIFICATION = "pixels"
+
+# Council discussion mode for main_ocr_testing_v3: "relay" (each reply goes to the next AI)
+# or "chairman" (Kai sets a theme, the others answer at once, Kai synthesizes whatever
+# replies arrived within FAN_IN_DEADLINE seconds of the last send)
+DISCUSSION_MODE = os.environ.get("COUNCIL_DISCUSSION_MODE", "relay")
+FAN_IN_DEADLINE = 60
+# While collecting fan-in replies, a reader that has held its desktop this many seconds
+# with readers for another desktop waiting hands the screen over and queues again, so
+# desktops take turns instead of the first one's readers all running to the end
+FAN_IN_SLICE = 15
+
+# Desktop switching (Control-arrow via AppleScript): `settle` seconds after each switch,
+# `step_delay` between arrow presses when moving more than one desktop
+DESKTOP_SWITCH = {"settle": 3.0, "step_delay": 1.0}
+
+# Headless council simulator (python -m core.simulator, or "simulator" as both backends):
+# fake chat windows laid out from UI_CONFIGS. Once installed (core.simulator, council
+# sessions) sleeps and timed waits run `speed` times faster; as plain backends, real time.
+# A reply's first characters appear after `first_token` simulated seconds, then it
+# streams at `chars_per_second`. Every chat starts with `history` earlier exchanges.
+# `windows` gives each AI's (app name, window title) for AppleScript window queries.
+SIMULATOR = {
+    "speed": 20,
+    "start_desktop": 0,
+    "first_token": {"Kai": 2.0, "CLAUDE": 3.0, "Perplexity": 2.5, "Grok": 2.0},
+    "chars_per_second": {"Kai": 110, "CLAUDE": 90, "Perplexity": 130, "Grok": 120},
+    "reply_words": (80, 140),
+    "history": 3,
+    "scroll_step": 40,
+    "font_size": 16,
+    "dark": ["Grok"],
+    "windows": {"Kai": ("ChatGPT", "Kai - ChatGPT"), "CLAUDE": ("Claude", "Claude"),
+                "Perplexity": ("Perplexity", "Perplexity"), "Grok": ("Grok", "Grok")}
+}
 
 UI_CONFIGS = {
     "Kai": {
+        "desktop": 1,
         "input_top_left": (183, 958),
         "send_button": (832, 1025),
         "read_area_top_left": (150, 206),
@@ -16,9 +144,12 @@ UI_CONFIGS = {
         "scroll_region": (150, 206, 873, 862),
         "typing_delay": 0.05,
         "response_wait": 5,
-        "scroll_sensitivity": -2
+        "scroll_sensitivity": -2,
+        "ocr_profile": "default",
+        "completion": {"stable_samples": 4, "max_wait": 40}
     },
     "CLAUDE": {
+        "desktop": 1,
         "input_top_left": (1194, 976),
         "send_button": (1912, 1037),
         "read_area_top_left": (1174, 226),
@@ -27,9 +158,12 @@ UI_CONFIGS = {
         "scroll_region": (1174, 226, 1919, 571),
         "typing_delay": 0.1,
         "response_wait": 8,
-        "scroll_sensitivity": -1
+        "scroll_sensitivity": -1,
+        "ocr_profile": "default",
+        "completion": {"stable_samples": 5, "max_wait": 60}
     },
     "Perplexity": {
+        "desktop": 2,
         "input_top_left": (342, 999),
         "send_button": (911, 1022),
         "read_area_top_left": (190, 160),
@@ -38,9 +172,12 @@ UI_CONFIGS = {
         "scroll_region": (190, 160, 949, 360),
         "typing_delay": 0.05,
         "response_wait": 6,
-        "scroll_sensitivity": -2
+        "scroll_sensitivity": -2,
+        "ocr_profile": "default",
+        "completion": {"stable_samples": 5, "max_wait": 50}
     },
     "Grok": {
+        "desktop": 2,
         "input_top_left": (1266, 969),
         "send_button": (1922, 1034),
         "read_area_top_left": (1248, 195),
@@ -49,7 +186,9 @@ UI_CONFIGS = {
         "scroll_region": (1248, 195, 1946, 866),
         "typing_delay": 0.05,
         "response_wait": 6,
-        "scroll_sensitivity": -2
+        "scroll_sensitivity": -2,
+        "ocr_profile": "default",
+        "completion": {"stable_samples": 4, "max_wait": 40}
     }
 }
 
@@ -0,0 +1,225 @@
+# core/council_sessions.py
+"""
+Run several councils at once. Every session is its own process with its own screen:
+a virtual X display (Xvfb) with the "x11" capture and actuator backends, or its own
+council simulator, so no two sessions ever share a mouse, keyboard or clipboard.
+The supervisor runs up to --jobs sessions at a time and collects each session's
+transcript and metrics into one run folder under SESSIONS_FOLDER.
+
+    python -m core.council_sessions --sessions 4                          # relay councils on Xvfb
+    python -m core.council_sessions --sessions 8 --backend simulator --mode chairman
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+
+from core import config
+from core.virtual_display import VirtualDisplay
+
+REPO_ROOT = config.BASE_PATH.parent
+
+@dataclass
+class Session:
+    """One council process: where it ran, how long it took (real seconds) and what it reported."""
+    index: int
+    workdir: Path
+    display: str = None
+    returncode: int = None
+    seconds: float = 0.0
+    result: dict = None
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and bool(self.result and self.result["ok"])
+
+def default_jobs() -> int:
+    """Sessions at a time: each one runs its own OCR pool, so leave those cores to it."""
+    return max(1, (os.cpu_count() or 1) // max(1, config.OCR_POOL_SIZE))
+
+def run_worker(mode: str, out: Path) -> bool:
+    """Inside a session process: run one council on this process's backends and save its report."""
+    sys.path.insert(0, str(REPO_ROOT))  # main_ocr_testing_v3
+    from core.actuator import get_actuator
+    from core.capture import get_capture_backend
+    import main_ocr_testing_v3 as council
+
+    if config.CAPTURE_BACKEND == "simulator":
+        from core.simulator import install_simulator
+        install_simulator()  # its clock goes in before anything is timed
+    get_capture_backend()
+    actuator = get_actuator()
+    orchestrator = None
+    start = time.monotonic()
+    completed = False
+    try:
+        briefed = council.kai_brief_test()
+        # built after the brief so its desktop gate starts on the desktop the brief left showing
+        orchestrator = council.kai_orchestrator()
+        if briefed:
+            if mode == "chairman":
+                completed = bool(council.kai_chairman_discussion(orchestrator))
+            else:
+                council.kai_four_ai_real_conversation(orchestrator)
+                completed = True  # relay rounds run to the end whatever the AIs answer
+    except Exception as e:
+        logging.error(f"💥 Session failed: {e}")
+    finally:
+        council.kai_return_home()
+
+    # A session only counts if some AI actually answered: relay rounds carry on with
+    # fallback prompts when every read fails
+    answered = sum(1 for turn in orchestrator.turns if turn.ok) if orchestrator else 0
+    ok = completed and answered > 0
+    if completed and not answered:
+        logging.error("❌ No AI answered a single turn")
+
+    result = {
+        "mode": mode,
+        "display": os.environ.get("DISPLAY"),
+        "capture": config.CAPTURE_BACKEND,
+        "actuator": actuator.name,
+        "ok": ok,
+        "answered": answered,
+        "seconds": time.monotonic() - start,
+        "desktop_switches": orchestrator.desktop_switches if orchestrator else 0,
+        "turns": [asdict(turn) for turn in orchestrator.turns] if orchestrator else [],
+        "transcript": orchestrator.transcript if orchestrator else [],
+        "actions": actuator.latency.summary()
+    }
+    if actuator.name == "simulator":
+        from core.simulator import get_simulator
+        result["simulator"] = get_simulator().summary()
+    out.write_text(json.dumps(result, indent=2))
+    logging.info(f"💾 Session report saved to {out}")
+    return ok
+
+class SessionSupervisor:
+    """
+    Launches council sessions as separate processes, each on its own virtual display
+    (backend "x11") or simulator (backend "simulator"), and aggregates their reports.
+    """
+
+    def __init__(self, mode: str = "relay", backend: str = "x11", jobs: int = None, run_dir: Path = None):
+        self.mode = mode
+        self.backend = backend
+        self.jobs = jobs or default_jobs()
+        self.run_dir = Path(run_dir or config.SESSIONS_FOLDER / datetime.now().strftime("%Y%m%d_%H%M%S"))
+        self.summary = None
+        self._display_lock = threading.Lock()  # display numbers are picked one session at a time
+
+    def _env(self, display: VirtualDisplay = None) -> dict:
+        env = display.env if display else dict(os.environ)
+        env.update(COUNCIL_CAPTURE_BACKEND=self.backend, COUNCIL_ACTUATOR_BACKEND=self.backend,
+                   COUNCIL_DISCUSSION_MODE=self.mode,
+                   PYTHONPATH=os.pathsep.join(filter(None, [str(REPO_ROOT), os.environ.get("PYTHONPATH")])))
+        return env
+
+    def run_session(self, index: int) -> Session:
+        session = Session(index, self.run_dir / f"session_{index:02d}")
+        session.workdir.mkdir(parents=True, exist_ok=True)
+        report = session.workdir / "session.json"
+        display = None
+        start = time.monotonic()
+        try:
+            if self.backend == "x11":
+                display = VirtualDisplay(config.VIRTUAL_DISPLAY["base"] + index)
+                with self._display_lock:
+                    display.start()
+                session.display = display.name
+            logging.info(f"🚀 Session {index} starting{f' on {session.display}' if display else ''}")
+            command = [sys.executable, "-m", "core.council_sessions", "--worker",
+                       "--mode", self.mode, "--out", str(report)]
+            with open(session.workdir / "session.log", "w") as log:
+                session.returncode = subprocess.run(command, cwd=session.workdir, env=self._env(display),
+                                                    stdout=log, stderr=subprocess.STDOUT).returncode
+        except Exception as e:
+            logging.error(f"❌ Session {index} could not run: {e}")
+        finally:
+            if display:
+                display.stop()
+        session.seconds = time.monotonic() - start
+        if report.exists():
+            session.result = json.loads(report.read_text())
+        logging.info(f"{'✅' if session.ok else '❌'} Session {index} finished in {session.seconds:.1f}s")
+        return session
+
+    def run(self, count: int) -> list:
+        """Run `count` sessions, at most `jobs` at a time, and write the aggregate report."""
+        logging.info(f"🧵 {count} {self.mode} session(s) on {self.backend}, {self.jobs} at a time, in {self.run_dir}")
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            sessions = list(pool.map(self.run_session, range(count)))
+        self.summary = self.save(sessions, time.monotonic() - start)
+        return sessions
+
+    def save(self, sessions, seconds: float):
+        """sessions.json with per-session and total metrics, transcripts.jsonl with every exchange."""
+        summary = aggregate(sessions, seconds)
+        summary["sessions"] = [dict(index=s.index, display=s.display, returncode=s.returncode, ok=s.ok,
+                                    seconds=s.seconds, workdir=str(s.workdir),
+                                    report={key: value for key, value in (s.result or {}).items()
+                                            if key not in ("transcript", "turns")})
+                               for s in sessions]
+        (self.run_dir / "sessions.json").write_text(json.dumps(summary, indent=2))
+        with open(self.run_dir / "transcripts.jsonl", "w") as f:
+            for session in sessions:
+                for entry in (session.result or {}).get("transcript", []):
+                    f.write(json.dumps(dict(session=session.index, **entry)) + "\n")
+        logging.info(f"💾 Aggregate report saved to {self.run_dir}")
+        return summary
+
+def aggregate(sessions, seconds: float) -> dict:
+    """Totals across sessions; throughput is answered turns per real minute of the whole run."""
+    turns = [turn for s in sessions for turn in (s.result or {}).get("turns", [])]
+    answered = sum(1 for turn in turns if turn["ok"])
+    return {
+        "seconds": seconds,
+        "sessions_run": len(sessions),
+        "sessions_ok": sum(1 for s in sessions if s.ok),
+        "turns": len(turns),
+        "answered": answered,
+        "answered_per_minute": 60 * answered / seconds if seconds else 0.0,
+        "desktop_switches": sum((s.result or {}).get("desktop_switches", 0) for s in sessions)
+    }
+
+def print_summary(sessions, summary: dict):
+    print(f"\n{'Session':<9}{'Display':<9}{'OK':<4}{'Turns':>6}{'Answered':>10}{'Seconds':>9}")
+    for session in sessions:
+        turns = (session.result or {}).get("turns", [])
+        print(f"{session.index:<9}{session.display or '-':<9}{'yes' if session.ok else 'no':<4}{len(turns):>6}"
+              f"{sum(1 for turn in turns if turn['ok']):>10}{session.seconds:>9.1f}")
+    print(f"\n{summary['sessions_ok']}/{summary['sessions_run']} session(s) ok, {summary['answered']}/"
+          f"{summary['turns']} turn(s) answered in {summary['seconds']:.1f}s "
+          f"({summary['answered_per_minute']:.1f} answered turns/min)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run council sessions in parallel, one screen each")
+    parser.add_argument("--sessions", type=int, default=2, help="how many councils to run")
+    parser.add_argument("--mode", choices=["relay", "chairman"], default="relay")
+    parser.add_argument("--backend", choices=["x11", "simulator"], default="x11",
+                        help="x11: a virtual display per session; simulator: fake chat windows")
+    parser.add_argument("--jobs", type=int, help=f"sessions at a time (default: {default_jobs()})")
+    parser.add_argument("--run-dir", help="where session folders and reports go")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--out", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(message)s')
+    if args.worker:
+        sys.exit(0 if run_worker(args.mode, Path(args.out)) else 1)
+    supervisor = SessionSupervisor(args.mode, args.backend, args.jobs, args.run_dir)
+    sessions = supervisor.run(args.sessions)
+    print_summary(sessions, supervisor.summary)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# core/desktop_scheduler.py
+
+import logging
+from dataclasses import dataclass
+
+from core import config
+
+def switch_seconds(current: int, target: int) -> float:
+    """Time a Control-arrow switch costs: one settle plus a delay per extra desktop crossed."""
+    steps = abs(target - current)
+    if not steps:
+        return 0.0
+    return config.DESKTOP_SWITCH["settle"] + (steps - 1) * config.DESKTOP_SWITCH["step_delay"]
+
+def path_cost(desktops, start: int):
+    """(switches, seconds) for visiting `desktops` in order, starting on `start`."""
+    switches, seconds, current = 0, 0.0, start
+    for desktop in desktops:
+        if desktop != current:
+            switches += 1
+            seconds += switch_seconds(current, desktop)
+            current = desktop
+    return switches, seconds
+
+@dataclass
+class Visit:
+    """One stay on a desktop: the AIs that speak there, in order."""
+    desktop: int
+    speakers: list
+
+@dataclass
+class RoundPlan:
+    """A round's desktop visits and what they cost against running the flow as written."""
+    visits: list
+    switches: int
+    seconds: float
+    baseline_switches: int
+    baseline_seconds: float
+
+    @property
+    def order(self) -> list:
+        return [speaker for visit in self.visits for speaker in visit.speakers]
+
+    @property
+    def saved_switches(self) -> int:
+        return self.baseline_switches - self.switches
+
+    @property
+    def saved_seconds(self) -> float:
+        return self.baseline_seconds - self.seconds
+
+class DesktopScheduler:
+    """
+    Runs a cyclic conversation flow (each AI answers the one before it, the last
+    hands back to the first) in as few desktop switches as that order allows. The
+    speaking order is never changed: only where the cycle is entered moves, once, to
+    the start of a run of speakers on the desktop already showing, and consecutive
+    speakers on one desktop share a visit, so collecting one reply and injecting the
+    next prompt happen without switching. Every round then starts where the last one
+    stopped, so every AI keeps answering the same predecessor.
+    """
+
+    def __init__(self, flow, desktops: dict, start_desktop: int = 0):
+        self.speakers = [speaker for speaker, _ in flow]
+        self.desktops = desktops
+        self.current = start_desktop
+        self._baseline_desktop = start_desktop  # where the as-written flow would be now
+        count = len(self.speakers)
+        self.cyclic = all(receiver == self.speakers[(i + 1) % count] for i, (_, receiver) in enumerate(flow))
+        if not self.cyclic:
+            logging.warning("⚠️ Flow is not a cycle; running it as written from its first speaker")
+        runs = [i for i in range(count) if desktops[self.speakers[i]] != desktops[self.speakers[i - 1]]]
+        split = {desktops[self.speakers[i]] for i in runs}
+        if len(split) < len(runs):
+            logging.warning("⚠️ Flow alternates between desktops; keeping its order costs extra switches")
+        self._start = None  # chosen on the first round, then fixed
+
+    def _entry(self) -> int:
+        """Flow index to enter the cycle at: a run on the current desktop, or the first speaker."""
+        if not self.cyclic:
+            return 0
+        on_desktop = [i for i, speaker in enumerate(self.speakers) if self.desktops[speaker] == self.current]
+        run_starts = [i for i in on_desktop
+                      if self.desktops[self.speakers[i - 1]] != self.current or len(on_desktop) == len(self.speakers)]
+        return (run_starts or on_desktop or [0])[0]
+
+    def plan_round(self) -> RoundPlan:
+        """Plan the next round and advance both the scheduled and the as-written position."""
+        if self._start is None:
+            self._start = self._entry()
+        order = self.speakers[self._start:] + self.speakers[:self._start]
+        visits = []
+        for speaker in order:
+            if visits and visits[-1].desktop == self.desktops[speaker]:
+                visits[-1].speakers.append(speaker)
+            else:
+                visits.append(Visit(self.desktops[speaker], [speaker]))
+        switches, seconds = path_cost([visit.desktop for visit in visits], self.current)
+        baseline = [self.desktops[speaker] for speaker in self.speakers]
+        baseline_switches, baseline_seconds = path_cost(baseline, self._baseline_desktop)
+        self.current = visits[-1].desktop
+        self._baseline_desktop = baseline[-1]
+        return RoundPlan(visits, switches, seconds, baseline_switches, baseline_seconds)
+
+def log_round_plan(round_num: int, plan: RoundPlan):
+    visits = " | ".join(f"Desktop {visit.desktop}: {' → '.join(visit.speakers)}" for visit in plan.visits)
+    logging.info(f"🗓️ Round {round_num} plan: {visits}")
+    logging.info(f"🗓️ {plan.switches} desktop switch(es) (~{plan.seconds:.0f}s) vs {plan.baseline_switches} "
+                 f"(~{plan.baseline_seconds:.0f}s) in flow order - saves {plan.saved_switches} "
+                 f"switch(es), ~{plan.saved_seconds:.0f}s")
@@ -0,0 +1,265 @@
+# core/filter_benchmark.py
+"""
+Throughput and quality benchmark for core.ocr_filter on real raw OCR text.
+
+The corpus (FILTER_CORPUS_FOLDER/corpus.json) is built from kai_exchange_log.txt,
+the reflections and the ui_detection session JSON. Each sample stores its raw text,
+the overlapping frames process_multiple_frames / extract_newest_content get, and the
+golden output of each function. Goldens come from the filter as it was before the
+optimization work (the repository's first commit, or --golden-ref), never from the
+filter under test: clean_ocr_output(raw) for both clean_ocr_output and
+process_multiple_frames (stitching the frames should give back the whole text),
+extract_newest_content(frames) for that one. Hand-correct them in corpus.json where
+that filter was wrong.
+
+Speed is reported as MB/s and as a ratio to a fixed reference workload timed over
+the same text in the same run; the baseline stores that ratio, so it carries over
+between machines. The whole benchmark runs --runs times and each figure is the
+median, so one noisy pass neither fails the gate nor becomes the baseline.
+
+    python -m core.filter_benchmark                   # report, fail on regression
+    python -m core.filter_benchmark --save-baseline   # accept current numbers
+    python -m core.filter_benchmark --build           # rebuild corpus + goldens
+"""
+
+import argparse
+import json
+import logging
+import re
+import statistics
+import subprocess
+import sys
+import time
+import types
+from collections import Counter
+from pathlib import Path
+
+from core import config
+from core.ocr_filter import clean_ocr_output, process_multiple_frames, extract_newest_content
+from core.text_metrics import char_accuracy
+
+UI_DETECTION_FOLDER = config.BASE_PATH.parent / "AI_Projects_ai_gui_interaction" / "ui_detection"
+MAX_SAMPLE_CHARS = 1500
+MIN_SAMPLE_CHARS = 40
+
+FUNCTIONS = {
+    "clean_ocr_output": lambda sample: clean_ocr_output(sample["raw"]),
+    "process_multiple_frames": lambda sample: process_multiple_frames(sample["frames"]),
+    "extract_newest_content": lambda sample: extract_newest_content(sample["frames"]),
+}
+
+def golden_functions(ref: str = None) -> dict:
+    """Golden makers from core/ocr_filter.py as of git `ref` (default: the first commit)."""
+    def git(*args):
+        return subprocess.run(["git", *args], cwd=config.BASE_PATH.parent, capture_output=True,
+                              text=True, check=True).stdout
+    ref = ref or git("rev-list", "--max-parents=0", "HEAD").split()[0]
+    module = types.ModuleType(f"ocr_filter_{ref}")
+    exec(compile(git("show", f"{ref}:core/ocr_filter.py"), f"{ref}:core/ocr_filter.py", "exec"), module.__dict__)
+    print(f"Goldens from core/ocr_filter.py at {ref}")
+    return {
+        "clean_ocr_output": lambda sample: module.clean_ocr_output(sample["raw"]),
+        # Stitched frames should recover the whole text, so their golden is the unsplit text cleaned
+        "process_multiple_frames": lambda sample: module.clean_ocr_output(sample["raw"]),
+        "extract_newest_content": lambda sample: module.extract_newest_content(sample["frames"]),
+    }
+
+_WORD = re.compile(r"[a-z']+")
+
+def reference_workload(samples):
+    """Fixed text work (lowercase, tokenize, count) that speed ratios are measured against."""
+    counts = Counter()
+    for sample in samples:
+        for line in sample["raw"].splitlines():
+            counts.update(_WORD.findall(line.lower()))
+    return counts
+
+def _chunks(text: str, size: int = MAX_SAMPLE_CHARS):
+    """Split long text on line boundaries into pieces of at most ~`size` characters."""
+    chunk = []
+    length = 0
+    for line in text.splitlines():
+        if chunk and length + len(line) > size:
+            yield "\n".join(chunk)
+            chunk, length = [], 0
+        chunk.append(line[:size])
+        length += len(line) + 1
+    if chunk:
+        yield "\n".join(chunk)
+
+def _split_frames(text: str, count: int = 3, overlap: float = 0.25):
+    """
+    Overlapping windows of the text's words, like consecutive scrolled frames: the
+    first starts at the first word, the last ends at the last, so every word is seen.
+    """
+    words = text.split()
+    size = min(len(words), -(-len(words) * 4 // round(4 * (count - (count - 1) * overlap))))
+    if size >= len(words) or count < 2:
+        return [" ".join(words)]
+    starts = sorted({round(k * (len(words) - size) / (count - 1)) for k in range(count)})
+    return [" ".join(words[start:start + size]) for start in starts]
+
+def _json_strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _json_strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _json_strings(item)
+
+def collect_raw_texts():
+    """(source, raw text) pairs from the exchange log, reflections and session JSON."""
+    texts = []
+    log = config.BASE_PATH / "kai_exchange_log.txt"
+    if log.exists():
+        content = log.read_text(errors="ignore")
+        texts += [("exchange_log", m) for m in re.findall(r"Final result: '(.*)'$", content, re.MULTILINE)]
+        texts.append(("exchange_log", content))
+    for path in sorted(Path(config.REFLECTIONS_FOLDER).glob("*.txt")):
+        replies = re.findall(r"REPLY:\n(.*?)\nSource prompt: (.*?)\n", path.read_text(errors="ignore"), re.DOTALL)
+        texts += [(f"reflections/{path.stem}", f"{prompt}\n{reply}") for reply, prompt in replies]
+    for path in sorted(UI_DETECTION_FOLDER.glob("*.json")):
+        with open(path) as f:
+            data = json.load(f)
+        texts += [(f"ui_detection/{path.stem}", s) for s in _json_strings(data) if len(s) >= MIN_SAMPLE_CHARS]
+    return texts
+
+def build_corpus(folder=config.FILTER_CORPUS_FOLDER, golden_ref: str = None):
+    goldens = golden_functions(golden_ref)
+    samples = []
+    for source, text in collect_raw_texts():
+        for raw in _chunks(text):
+            if len(raw) < MIN_SAMPLE_CHARS:
+                continue
+            sample = {"source": source, "name": f"{source}#{len(samples)}", "raw": raw,
+                      "frames": _split_frames(raw)}
+            sample["golden"] = {name: fn(sample) for name, fn in goldens.items()}
+            samples.append(sample)
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    with open(folder / "corpus.json", "w") as f:
+        json.dump(samples, f, indent=2, ensure_ascii=False)
+    print(f"Wrote {len(samples)} samples to {folder / 'corpus.json'}")
+
+def load_corpus(folder=config.FILTER_CORPUS_FOLDER):
+    with open(Path(folder) / "corpus.json") as f:
+        return json.load(f)
+
+def time_reference(samples, repeat: int = 5, passes: int = 20) -> float:
+    """Seconds one pass of reference_workload takes over the samples (best of `repeat` runs of `passes`)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(passes):
+            reference_workload(samples)
+        best = min(best, (time.perf_counter() - start) / passes)
+    return best
+
+def benchmark_function(name: str, samples, repeat: int = 5, reference: float = None) -> dict:
+    """
+    MB/s over the raw text, speed relative to the reference workload (reference time /
+    function time, both best-of-`repeat`), mean latency per call and mean accuracy
+    against the goldens.
+    """
+    fn = FUNCTIONS[name]
+    size = sum(len(sample["raw"].encode()) for sample in samples)
+    latencies = []
+    accuracies = []
+    total = 0.0  # best call per sample, summed: the steadiest figure for speed
+    for sample in samples:
+        calls = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            output = fn(sample)
+            calls.append(time.perf_counter() - start)
+        latencies.extend(calls)
+        total += min(calls)
+        accuracies.append(char_accuracy(output, sample["golden"][name]))
+    reference = time_reference(samples, repeat) if reference is None else reference
+    return {
+        "function": name,
+        "samples": len(samples),
+        "mb_per_s": size / total / 1e6 if total else 0.0,
+        "relative_speed": reference / total if total else 0.0,
+        "latency_ms": 1000 * sum(latencies) / len(latencies),
+        "quality": sum(accuracies) / len(accuracies)
+    }
+
+def run_benchmark(folder=config.FILTER_CORPUS_FOLDER, repeat: int = 5, runs: int = 5):
+    """Benchmark every function `runs` times; each figure is the median over the runs."""
+    samples = load_corpus(folder)
+    passes = []
+    for _ in range(runs):
+        reference = time_reference(samples, repeat)
+        passes.append([benchmark_function(name, samples, repeat, reference) for name in FUNCTIONS])
+    results = []
+    for per_run in zip(*passes):
+        result = dict(per_run[0], runs=runs)
+        for key in ("mb_per_s", "relative_speed", "latency_ms"):
+            result[key] = statistics.median(r[key] for r in per_run)
+        results.append(result)
+    return results
+
+def check_regressions(results, baseline: dict, max_slowdown: float, max_quality_drop: float):
+    """Messages for every function slower or less accurate than the baseline allows."""
+    failures = []
+    for r in results:
+        base = baseline.get(r["function"])
+        if not base:
+            continue
+        if r["relative_speed"] < base["relative_speed"] * (1 - max_slowdown):
+            failures.append(f"{r['function']}: {r['relative_speed']:.3f}x reference speed vs baseline "
+                            f"{base['relative_speed']:.3f}x")
+        if r["quality"] < base["quality"] - max_quality_drop:
+            failures.append(f"{r['function']}: quality {r['quality']:.1%} vs baseline {base['quality']:.1%}")
+    return failures
+
+def print_results(results, baseline: dict):
+    print(f"{'Function':<26}{'Samples':>8}{'MB/s':>9}{'x Ref':>8}{'Latency ms':>12}{'Quality':>9}"
+          f"{'Baseline x Ref':>16}")
+    for r in results:
+        base = baseline.get(r["function"], {})
+        base_speed = f"{base['relative_speed']:.3f}" if base else "-"
+        print(f"{r['function']:<26}{r['samples']:>8}{r['mb_per_s']:>9.2f}{r['relative_speed']:>8.3f}"
+              f"{r['latency_ms']:>12.3f}{r['quality']:>9.1%}{base_speed:>16}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark core.ocr_filter speed and quality")
+    parser.add_argument("--corpus", default=config.FILTER_CORPUS_FOLDER)
+    parser.add_argument("--repeat", type=int, default=5, help="calls per sample for timing")
+    parser.add_argument("--runs", type=int, default=5, help="benchmark passes; figures are their median")
+    parser.add_argument("--build", action="store_true", help="rebuild corpus.json (goldens from --golden-ref)")
+    parser.add_argument("--golden-ref", help="git revision whose ocr_filter makes the goldens (default: first commit)")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    # Medians of 5 runs still moved by up to ~30% between invocations on a shared core, so
+    # the gate only catches real slowdowns (the 2x-and-worse kind) without failing at random
+    parser.add_argument("--max-slowdown", type=float, default=0.4,
+                        help="allowed drop in speed relative to the reference workload (fraction)")
+    parser.add_argument("--max-quality-drop", type=float, default=0.005, help="allowed quality drop")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.INFO)  # the filter logs every frame it processes
+    if args.build:
+        build_corpus(args.corpus, args.golden_ref)
+        return 0
+
+    baseline_file = Path(args.corpus) / "baseline.json"
+    baseline = json.loads(baseline_file.read_text()) if baseline_file.exists() else {}
+    results = run_benchmark(args.corpus, args.repeat, args.runs)
+    print_results(results, baseline)
+
+    if args.save_baseline:
+        # MB/s and latency are kept for reference only; regressions are checked on the ratio
+        baseline_file.write_text(json.dumps({r["function"]: r for r in results}, indent=2))
+        print(f"Saved baseline to {baseline_file}")
+        return 0
+
+    failures = check_regressions(results, baseline, args.max_slowdown, args.max_quality_drop)
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+# core/frame_cache.py
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+from core import config
+
+def frame_digest(image) -> bytes:
+    """Exact hash of the pixels: chat frames that differ by one word must not match."""
+    return hashlib.blake2b(image.tobytes(), digest_size=16).digest()
+
+def has_content(result) -> bool:
+    """Empty results (blank frame, OCR timeout or failure) are never cached."""
+    return bool(getattr(result, "words", result))
+
+class FrameCache:
+    """
+    LRU cache of OCR results keyed by an exact hash of the captured image, so
+    unchanged frames (a poll of a reply that has not moved) skip OCR. Matching is
+    exact on purpose: a line gaining " ok" or a timestamp digit changing flips only
+    a bit or two of a perceptual hash, and would return the previous frame's text.
+    """
+
+    def __init__(self, max_entries: int = config.FRAME_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # (tag, size, digest) -> OCR result
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def key(self, image, tag: str = ""):
+        return tag, image.size, frame_digest(image)
+
+    def get(self, key):
+        with self._lock:
+            result = self.entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key, result):
+        if not has_content(result):
+            return
+        with self._lock:
+            self.entries[key] = result
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def ocr(self, image, ocr_fn, tag: str = ""):
+        """Return the cached result for an identical frame, otherwise run ocr_fn(image) and cache it."""
+        key = self.key(image, tag)
+        result = self.get(key)
+        if result is None:
+            result = ocr_fn(image)
+            self.put(key, result)
+        return result
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self.entries),
+            "hit_rate": self.hits / total if total else 0.0
+        }
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.hits = self.misses = 0
+
+_cache = None
+
+def get_frame_cache() -> FrameCache:
+    global _cache
+    if _cache is None:
+        _cache = FrameCache()
+    return _cache
+
+def log_cache_stats():
+    stats = get_frame_cache().stats()
+    logging.info(f"🗃️ Frame cache: {stats['hits']} hit(s), {stats['misses']} miss(es), "
+                 f"{stats['hit_rate']:.0%} hit rate, {stats['entries']} cached")
@@ -0,0 +1,81 @@
+# core/frame_stitch.py
+
+import re
+
+_PUNCTUATION = re.compile(r"[^\w]+")
+
+def _normalize(word: str) -> str:
+    # OCR noise mostly shows up as stray punctuation and case, so compare on the rest
+    return _PUNCTUATION.sub("", word.lower())
+
+def _ngrams(words, n: int):
+    return [tuple(words[i:i + n]) for i in range(len(words) - n + 1)]
+
+MAX_GRAM_POSITIONS = 8  # n-grams repeated more often than this in a frame ("Copy", "Regenerate") don't vote
+
+def find_overlap(a_words, b_words, ngram: int = 2, min_match: float = 0.5, min_overlap: int = 4):
+    """
+    Offset in `a_words` where `b_words` starts, or None if the frames don't overlap.
+
+    Every word n-gram shared by both frames votes for the alignment it implies
+    (position in a - position in b); n-grams that repeat more than MAX_GRAM_POSITIONS
+    times in b are skipped, which keeps the vote O(len(a) + len(b)). An alignment
+    counts when its shared n-grams cover at least `min_match` of the overlap, so a
+    few misread words inside it don't break it. Frames are captured scrolling down,
+    so the preferred alignment is a suffix of a matching a prefix of b (b reaches
+    a's end), then b lying inside a, then b starting before a; ties go to the
+    longest overlap.
+    """
+    a_norm = [_normalize(w) for w in a_words]
+    b_norm = [_normalize(w) for w in b_words]
+    positions = {}
+    for j, gram in enumerate(_ngrams(b_norm, ngram)):
+        positions.setdefault(gram, []).append(j)
+
+    votes = {}
+    for i, gram in enumerate(_ngrams(a_norm, ngram)):
+        found = positions.get(gram, ())
+        if len(found) > MAX_GRAM_POSITIONS:
+            continue
+        for j in found:
+            votes[i - j] = votes.get(i - j, 0) + 1
+
+    best = None
+    for offset, count in votes.items():
+        overlap = min(len(a_words), offset + len(b_words)) - max(offset, 0)
+        if overlap < min_overlap:
+            continue
+        if count < min_match * max(overlap - ngram + 1, 1):
+            continue
+        forward = offset >= 0
+        rank = (forward and offset + len(b_words) >= len(a_words), forward, overlap)
+        if best is None or rank > best[1]:
+            best = (offset, rank)
+    return best[0] if best else None
+
+def merge_frames(a_words, b_words, **kwargs):
+    """
+    Merge two overlapping frames; the newer frame's words win inside the overlap.
+    A frame lying entirely inside the transcript so far adds nothing and is dropped.
+    """
+    offset = find_overlap(a_words, b_words, **kwargs)
+    if offset is None:
+        return a_words + b_words
+    if offset >= 0:
+        if offset + len(b_words) < len(a_words):
+            return a_words
+        return a_words[:offset] + b_words
+    return b_words + a_words[len(b_words) + offset:]
+
+def stitch_frame_texts(texts, **kwargs) -> str:
+    """
+    Stitch the OCR text of consecutive scrolled frames into one transcript, each
+    frame merged into the running result at its suffix/prefix overlap.
+    """
+    words = []
+    for text in texts:
+        frame_words = text.split()
+        if not frame_words:
+            continue
+        words = merge_frames(words, frame_words, **kwargs) if words else frame_words
+    return " ".join(words)
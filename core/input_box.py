@@ -0,0 +1,66 @@
+# core/input_box.py
+
+import re
+
+import numpy as np
+
+from core import config
+from core.capture import get_capture_backend
+from core.completion import downsample
+from core.ocr_pool import ocr_image
+from core.preprocess import grey_pixels, ink_profile, find_text_bands
+
+def input_region(ui: str):
+    """Screen box of a UI's input field: from its top-left corner to the send button."""
+    ui_config = config.UI_CONFIGS[ui]
+    if "input_region" in ui_config:
+        return ui_config["input_region"]
+    (x1, y1), (x2, y2) = ui_config["input_top_left"], ui_config["send_button"]
+    return (x1, y1, x2, y2)
+
+def snapshot(region):
+    """Small greyscale copy of the input box, cheap to compare."""
+    return downsample(get_capture_backend().grab(region), config.INPUT_BOX["downsample_factor"])
+
+def changed_fraction(a, b) -> float:
+    """Share of pixels that differ clearly between two snapshots (1.0 if sizes differ)."""
+    if a.shape != b.shape:
+        return 1.0
+    return float((np.abs(a - b) > config.INPUT_BOX["pixel_delta"]).mean())
+
+def has_changed(region, reference) -> bool:
+    """True once the box differs from `reference` by more than a blinking caret would."""
+    return changed_fraction(snapshot(region), reference) > config.INPUT_BOX["min_changed"]
+
+def ink_density(pixels) -> float:
+    """Strong left-right intensity changes per pixel; an empty box has almost none."""
+    return float(ink_profile(pixels).sum()) / pixels.size if pixels.size else 0.0
+
+def _words(text: str):
+    return {word for word in re.findall(r"\w+", text.lower()) if len(word) > 2}
+
+def ocr_matches_prompt(region, prompt: str, profile: dict = None) -> bool:
+    """OCR only the box's first text line and check its words come from the prompt."""
+    image = get_capture_backend().grab(region)
+    bands = find_text_bands(grey_pixels(image))
+    if not bands:
+        return False
+    top, bottom = bands[0]
+    seen = _words(ocr_image(image.crop((0, top, image.width, bottom)), profile))
+    if not seen:
+        return False
+    return len(seen & _words(prompt)) / len(seen) >= config.INPUT_BOX["ocr_word_match"]
+
+def verify_paste(region, cleared, prompt: str, mode: str = None, profile: dict = None) -> bool:
+    """
+    Confirm pasted text landed in the input box without touching the clipboard.
+    "pixels": the box changed since `cleared` and gained text-like ink over it.
+    "ocr": additionally, the first visible line reads as words of the prompt.
+    """
+    mode = mode or config.PASTE_VERIFICATION
+    current = snapshot(region)
+    if changed_fraction(current, cleared) <= config.INPUT_BOX["min_changed"]:
+        return False
+    if ink_density(current) - ink_density(cleared) < config.INPUT_BOX["min_ink"]:
+        return False
+    return mode != "ocr" or ocr_matches_prompt(region, prompt, profile)
@@ -0,0 +1,77 @@
+# core/junk_filter.py
+
+import json
+import re
+from functools import lru_cache
+
+from core import config
+
+RULE_KEYS = ("remove", "remove_patterns", "drop_lines", "drop_line_patterns")
+
+class JunkFilter:
+    """
+    Every junk rule of one cleaning stage compiled into two alternation regexes, so a
+    block is cleaned in a single pass however many rules there are:
+      remove / remove_patterns            - literal phrases / regexes cut out of the text
+      drop_lines / drop_line_patterns     - whole lines dropped if they contain a match
+    """
+
+    def __init__(self, rules: dict):
+        flags = "i" if rules.get("ignore_case") else ""
+        remove = _alternatives(rules.get("remove", []), rules.get("remove_patterns", []), flags)
+        drop = _alternatives(rules.get("drop_lines", []), rules.get("drop_line_patterns", []), flags)
+        self.rule_count = sum(len(rules.get(key, [])) for key in RULE_KEYS)
+        self._remove = re.compile(remove) if remove else None
+        self._drop = re.compile(rf"^[^\n]*(?:{drop})[^\n]*(?:\n|$)", re.MULTILINE) if drop else None
+
+    def clean(self, text: str) -> str:
+        """Drop junk lines, then cut junk phrases, one regex pass each."""
+        if self._drop:
+            text = self._drop.sub("", text)
+        if self._remove:
+            text = self._remove.sub("", text)
+        return text
+
+    def matches(self, text: str) -> bool:
+        """True if any junk rule matches anywhere in `text`."""
+        return bool((self._remove and self._remove.search(text)) or
+                    (self._drop and self._drop.search(text)))
+
+def _alternatives(literals, patterns, flags: str) -> str:
+    # Longest literals first so a longer phrase wins over its own prefix
+    parts = [re.escape(phrase) for phrase in sorted(literals, key=len, reverse=True)] + list(patterns)
+    if not parts:
+        return ""
+    scope = f"(?{flags}:" if flags else "(?:"
+    return "|".join(f"{scope}{part})" for part in parts)
+
+def _load_rule_file(name: str) -> dict:
+    """Rules from JUNK_RULES_FOLDER/<name>.json (matched case-insensitively), or {}."""
+    for path in config.JUNK_RULES_FOLDER.glob("*.json"):
+        if path.stem.lower() == name.lower():
+            with open(path) as f:
+                return json.load(f)
+    return {}
+
+@lru_cache(maxsize=None)
+def get_junk_filter(stage: str, ui: str = None) -> JunkFilter:
+    """
+    Compiled filter for one cleaning stage: "ocr" (core.ocr_filter), "response"
+    (OCR'd replies in the relay scripts), "copy" (rubber-band copies) or "clipboard"
+    (select-all / select-to-end copies).
+    The AI's own rule file adds to default.json; its ignore_case wins if given.
+    Without a `ui` (callers that don't know the speaker) every AI's rules apply, as
+    they did before the rules were split per AI.
+    """
+    rules = dict(_load_rule_file("default").get(stage, {}))
+    if ui:
+        names = [ui]
+    else:
+        names = sorted(path.stem for path in config.JUNK_RULES_FOLDER.glob("*.json") if path.stem != "default")
+    for name in names:
+        for key, value in _load_rule_file(name).get(stage, {}).items():
+            if key in RULE_KEYS:
+                rules[key] = rules.get(key, []) + value
+            elif ui:
+                rules[key] = value
+    return JunkFilter(rules)
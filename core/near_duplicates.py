@@ -0,0 +1,73 @@
+# core/near_duplicates.py
+
+import zlib
+import numpy as np
+
+_PRIME = (1 << 31) - 1
+
+class NearDuplicateIndex:
+    """
+    MinHash/LSH index over character shingles for finding near-duplicate lines.
+
+    Each added text is hashed into `bands` buckets of `rows` MinHash values. A lookup
+    only compares against texts sharing at least one bucket and confirms them with
+    `verify(a, b) > threshold` (the same check the filter used to run against every
+    seen line), so the output matches a full scan whenever LSH finds the candidate.
+    More bands / fewer rows = higher recall, more candidates to verify.
+    """
+
+    def __init__(self, verify, threshold: float = 0.9, shingle: int = 3, bands: int = 16,
+                 rows: int = 2, seed: int = 7):
+        self.verify = verify
+        self.threshold = threshold
+        self.shingle = shingle
+        self.bands = bands
+        self.rows = rows
+        rng = np.random.default_rng(seed)
+        count = bands * rows
+        self._a = rng.integers(1, _PRIME, size=count, dtype=np.int64)
+        self._b = rng.integers(0, _PRIME, size=count, dtype=np.int64)
+        self.buckets = [{} for _ in range(bands)]
+        self.texts = []
+
+    def _shingles(self, text: str):
+        text = text.lower().strip()
+        if len(text) <= self.shingle:
+            return {text}
+        return {text[i:i + self.shingle] for i in range(len(text) - self.shingle + 1)}
+
+    def _band_keys(self, text: str):
+        hashes = np.fromiter((zlib.crc32(s.encode()) % _PRIME for s in self._shingles(text)), dtype=np.int64)
+        signature = ((self._a[:, None] * hashes[None, :] + self._b[:, None]) % _PRIME).min(axis=1)
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def find(self, text: str, keys=None):
+        """An indexed text similar to `text`, or None."""
+        keys = keys or self._band_keys(text)
+        checked = set()
+        for band, key in zip(self.buckets, keys):
+            for idx in band.get(key, ()):
+                if idx in checked:
+                    continue
+                checked.add(idx)
+                if self.verify(text, self.texts[idx]) > self.threshold:
+                    return self.texts[idx]
+        return None
+
+    def add(self, text: str, keys=None):
+        keys = keys or self._band_keys(text)
+        idx = len(self.texts)
+        self.texts.append(text)
+        for band, key in zip(self.buckets, keys):
+            band.setdefault(key, []).append(idx)
+
+    def add_if_new(self, text: str) -> bool:
+        """Index `text` unless a near duplicate is already indexed; True if it was added."""
+        keys = self._band_keys(text)
+        if self.find(text, keys) is not None:
+            return False
+        self.add(text, keys)
+        return True
+
+    def __len__(self):
+        return len(self.texts)
@@ -0,0 +1,114 @@
+# core/ocr_benchmark.py
+"""
+Benchmark OCR profiles against stored fixture images.
+
+Fixtures live in OCR_FIXTURES_FOLDER/<UI>/<name>.png with the expected text in
+<name>.txt next to each image. None are committed yet: they have to be captured
+from the real council screens (--capture) and labelled by hand before the
+benchmark can say which profile reads a UI best.
+
+    python -m core.ocr_benchmark                         # every UI, every profile
+    python -m core.ocr_benchmark --ui CLAUDE --profiles default,chat_small_font
+    python -m core.ocr_benchmark --capture Grok long_reply   # save a new fixture
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+from core import config
+from core.capture import get_capture_backend
+from core.ocr_pool import get_ocr_pool
+from core.ocr_profiles import get_ocr_profile
+from core.text_metrics import char_accuracy
+from core.utils import text_bands_only
+
+def load_fixtures(folder=config.OCR_FIXTURES_FOLDER, ui: str = None):
+    """Return (ui, name, image, expected_text) for every PNG that has a matching .txt."""
+    from PIL import Image
+    fixtures = []
+    for png in sorted(Path(folder).glob("*/*.png")):
+        if ui and png.parent.name != ui:
+            continue
+        truth = png.with_suffix(".txt")
+        if not truth.exists():
+            logging.warning(f"⚠️ Skipping {png.name}: no {truth.name}")
+            continue
+        with Image.open(png) as img:
+            fixtures.append((png.parent.name, png.stem, img.convert("RGB"), truth.read_text()))
+    return fixtures
+
+def benchmark_profile(fixtures, profile: dict, repeat: int = 3) -> dict:
+    """Mean latency per image and mean character accuracy of one profile."""
+    pool = get_ocr_pool()
+    latencies = []
+    accuracies = []
+    for _, _, image, truth in fixtures:
+        bands = text_bands_only(image)
+        for _ in range(repeat):
+            start = time.perf_counter()
+            text = pool.image_to_string(bands, profile) if bands is not None else ""
+            latencies.append(time.perf_counter() - start)
+        accuracies.append(char_accuracy(text, truth))
+    return {
+        "profile": profile["name"],
+        "images": len(fixtures),
+        "latency_ms": 1000 * sum(latencies) / len(latencies),
+        "accuracy": sum(accuracies) / len(accuracies)
+    }
+
+def run_benchmark(ui_names, profile_names, folder=config.OCR_FIXTURES_FOLDER, repeat: int = 3):
+    results = []
+    for ui in ui_names:
+        fixtures = load_fixtures(folder, ui)
+        if not fixtures:
+            print(f"{ui}: no fixtures in {Path(folder) / ui}")
+            continue
+        for name in profile_names:
+            result = benchmark_profile(fixtures, get_ocr_profile(name), repeat)
+            result["ui"] = ui
+            results.append(result)
+    return results
+
+def print_results(results):
+    print(f"{'UI':<12}{'Profile':<18}{'Images':>7}{'Latency ms':>12}{'Accuracy':>10}")
+    for ui in dict.fromkeys(r["ui"] for r in results):
+        rows = [r for r in results if r["ui"] == ui]
+        best = max(rows, key=lambda r: (round(r["accuracy"], 3), -r["latency_ms"]))
+        for r in rows:
+            marker = "  <- best" if r is best else ""
+            print(f"{ui:<12}{r['profile']:<18}{r['images']:>7}{r['latency_ms']:>12.1f}{r['accuracy']:>10.1%}{marker}")
+
+def capture_fixture(ui: str, name: str, folder=config.OCR_FIXTURES_FOLDER):
+    """Save the UI's current read area as a fixture; fill in the .txt with the true text."""
+    target = Path(folder) / ui
+    target.mkdir(parents=True, exist_ok=True)
+    get_capture_backend().grab(config.UI_CONFIGS[ui]["scroll_region"]).save(target / f"{name}.png")
+    (target / f"{name}.txt").touch()
+    print(f"Saved {target / name}.png - write the expected text into {name}.txt")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark OCR profiles against fixture images")
+    parser.add_argument("--fixtures", default=config.OCR_FIXTURES_FOLDER)
+    parser.add_argument("--ui", help="only this UI (default: all in UI_CONFIGS)")
+    parser.add_argument("--profiles", help="comma-separated profile names (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="OCR runs per image for timing")
+    parser.add_argument("--capture", nargs=2, metavar=("UI", "NAME"), help="save a new fixture and exit")
+    args = parser.parse_args(argv)
+
+    if args.capture:
+        capture_fixture(*args.capture, folder=args.fixtures)
+        return
+
+    ui_names = [args.ui] if args.ui else list(config.UI_CONFIGS)
+    profile_names = args.profiles.split(",") if args.profiles else list(config.OCR_PROFILES)
+    results = run_benchmark(ui_names, profile_names, args.fixtures, args.repeat)
+    if not results:
+        print("No fixtures to benchmark; capture some with --capture UI NAME")
+        return 1
+    print_results(results)
+
+if __name__ == "__main__":
+    sys.exit(main())
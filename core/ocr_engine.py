@@ -1,56 +1,202 @@
+import os
 import time
 import logging
-from core.config import UI_CONFIGS, WAIT_BEFORE_CAPTURE
+from core.config import (UI_CONFIGS, SCROLL_REGISTRATION, PIPELINED_CAPTURE,
+                         LOW_CONFIDENCE_RETRY, LOW_CONFIDENCE_RETRIES)
 from core.ocr_filter import clean_ocr_output, process_multiple_frames
-from core.utils import scroll_area_and_capture_text
+from core.utils import ocr_frame_result, submit_ocr_frame
+from core.ocr_pool import get_ocr_pool
+from core.ocr_profiles import profile_for_ui
+from core.registration import revealed_strip, stitch_strips, changed_band
+from core.capture import get_capture_backend
+from core.completion import wait_for_response, completion_settings, downsample, frame_difference
+from core.frame_cache import log_cache_stats
+from core.confidence import get_confidence_tracker, capture_confidence, log_confidence_stats
 
-def scroll_and_capture(ui: str):
-    logging.info(f"🖼️  Capturing response from {ui}...")
-    time.sleep(WAIT_BEFORE_CAPTURE)  # Let UI settle before capture
+def add_text_block(ui: str, frame, raw: str, text_blocks: list):
+    """Clean one frame's OCR text and keep it if anything substantial is left."""
+    # Only add if we got substantial text
+    if len(raw.strip()) > 15:  # Minimum threshold
+        cleaned = clean_ocr_output(raw, ui)
+        if len(cleaned.strip()) > 10:
+            logging.info(f"[{ui} Frame {frame}] Cleaned: '{cleaned[:60]}...'")
+            text_blocks.append(cleaned)
 
+def capture_frames(ui: str):
+    """
+    Grab and OCR the reply's frames while scrolling down.
+    Returns the cleaned text blocks, the number of frames and each frame's raw OCRResult.
+    """
     text_blocks = []
+    strips = []
+    results = []
     region = UI_CONFIGS[ui]["scroll_region"]
-    
+    profile = profile_for_ui(ui)
+    backend = get_capture_backend()
+    tracker = get_confidence_tracker()
+    previous = None
+
+    pending = []
+
+    def collect(frame, result):
+        results.append(result)
+        # Words tesseract is unsure of are dropped before the text filters see them
+        raw = tracker.filter(ui, frame, result).text
+        logging.info(f"[{ui} Frame {frame}] Raw OCR length: {len(raw)} chars, "
+                     f"mean confidence {result.mean_conf:.0f}")
+        if SCROLL_REGISTRATION:
+            strips.append(raw)
+        else:
+            add_text_block(ui, frame, raw, text_blocks)
+
     # Capture fewer frames but with better processing
     for frame in range(3):  # Reduced from 6 to 3 frames
-        raw = scroll_area_and_capture_text(region)
-        logging.info(f"[{ui} Frame {frame}] Raw OCR length: {len(raw)} chars")
-        
-        # Only add if we got substantial text
-        if len(raw.strip()) > 15:  # Minimum threshold
-            cleaned = clean_ocr_output(raw)
-            if len(cleaned.strip()) > 10:
-                logging.info(f"[{ui} Frame {frame}] Cleaned: '{cleaned[:60]}...'")
-                text_blocks.append(cleaned)
-        
+        image = backend.grab(region)
+        to_ocr = image
+        if SCROLL_REGISTRATION and previous is not None:
+            # Only the rows scrolled into view since the last frame need OCR
+            to_ocr = revealed_strip(previous, image)
+        previous = image
+
+        if to_ocr is not None:
+            if PIPELINED_CAPTURE:
+                # OCR runs on the pool while we keep scrolling and grabbing
+                pending.append((frame, submit_ocr_frame(to_ocr, profile)))
+            else:
+                collect(frame, ocr_frame_result(to_ocr, profile))
+
         # Small scroll between frames to get different content
         if frame < 2:  # Don't scroll after last frame
-            import pyautogui
-            pyautogui.scroll(-2, x=region[0] + 50, y=region[1] + 50)
+            backend.scroll(-2, x=region[0] + 50, y=region[1] + 50)
             time.sleep(0.8)  # Reduced wait time between frames
 
+    # Merge pipelined results in capture order
+    for frame, future in pending:
+        collect(frame, get_ocr_pool().result(future))
+
+    if strips:
+        # Strips don't overlap, so stitched they form one frame of the whole reply
+        add_text_block(ui, "stitched", stitch_strips(strips), text_blocks)
+
+    return text_blocks, len(strips) or len(text_blocks), results
+
+def scroll_and_capture(ui: str, retries: int = LOW_CONFIDENCE_RETRIES):
+    logging.info(f"🖼️  Capturing response from {ui}...")
+    wait_for_response(ui)  # Let the reply finish rendering before capture
+    region = UI_CONFIGS[ui]["scroll_region"]
+
+    for attempt in range(retries + 1):
+        text_blocks, frames, results = capture_frames(ui)
+        confidence = capture_confidence(results)
+        if confidence >= LOW_CONFIDENCE_RETRY or attempt == retries:
+            break
+        # Low confidence means a bad frame (still rendering, overlay, wrong area), not a short reply
+        logging.warning(f"🔁 Low OCR confidence from {ui} ({confidence:.0f}), capturing again...")
+        get_capture_backend().scroll(4, x=region[0] + 50, y=region[1] + 50)  # back to the start
+        time.sleep(0.8)
+
+    log_confidence_stats(ui)
+
     if not text_blocks:
         logging.warning(f"⚠️ No readable text captured from {ui}")
         return "[No readable text]", 0, "Empty after OCR"
 
     # Process all frames together for best result
-    final_text = process_multiple_frames(text_blocks)
+    final_text = process_multiple_frames(text_blocks, ui)
     
-    logging.info(f"🧾 OCR completed for {ui}: {len(text_blocks)} frame(s) processed")
+    logging.info(f"🧾 OCR completed for {ui}: {frames} frame(s) processed")
+    log_cache_stats()
     logging.info(f"📄 Final result: '{final_text}'")
     
-    return final_text, len(text_blocks), "Captured"
+    return final_text, frames, "Captured"
 
 def quick_capture(ui: str):
     """Alternative function for single-frame capture when speed is needed."""
     logging.info(f"⚡ Quick capture from {ui}...")
     
     region = UI_CONFIGS[ui]["scroll_region"]
-    raw = scroll_area_and_capture_text(region)
-    cleaned = clean_ocr_output(raw)
+    result = ocr_frame_result(get_capture_backend().grab(region), profile_for_ui(ui))
+    raw = get_confidence_tracker().filter(ui, "quick", result).text
+    cleaned = clean_ocr_output(raw, ui)
     
     if len(cleaned.strip()) < 10:
         return "[No readable text]", 1, "Empty"
     
     logging.info(f"⚡ Quick result: '{cleaned}'")
-    return cleaned, 1, "Quick captured"
\ No newline at end of file
+    return cleaned, 1, "Quick captured"
+
+def merge_band_lines(lines: list, band_text: str) -> list:
+    """
+    Merge the OCR text of a changed bottom band into the transcript lines.
+    The band's first line is usually a line we already have, now longer (still being
+    typed), so everything from its last match onwards is replaced by the band.
+    """
+    band_lines = [line.strip() for line in band_text.splitlines() if line.strip()]
+    if not band_lines:
+        return lines
+    first = band_lines[0]
+    for i in range(len(lines) - 1, max(-1, len(lines) - len(band_lines) - 4), -1):
+        if lines[i] == first or (len(lines[i]) >= 3 and first.startswith(lines[i])):
+            return lines[:i] + band_lines
+    return lines + band_lines
+
+def stream_capture(ui: str, region=None):
+    """
+    Generator that follows a reply while it is still being typed.
+
+    Samples the read area at the UI's completion interval; whenever it changes, only
+    the changed bottom band is OCR'd and merged into the running transcript. Yields
+    ("delta", new_text, transcript) as the reply grows and finally
+    ("final", cleaned_text, reason) once the area is stable, or on timeout.
+    """
+    region = region or UI_CONFIGS[ui]["scroll_region"]
+    settings = completion_settings(ui)
+    profile = profile_for_ui(ui)
+    backend = get_capture_backend()
+    tracker = get_confidence_tracker()
+    logging.info(f"📡 Streaming {ui}'s reply...")
+
+    start = time.monotonic()
+    previous = backend.grab(region)
+    previous_small = downsample(previous, settings["downsample_factor"])
+    lines = []
+    changed = False
+    stable = 0
+
+    while True:
+        time.sleep(settings["interval"])
+        elapsed = time.monotonic() - start
+        current = backend.grab(region)
+        current_small = downsample(current, settings["downsample_factor"])
+
+        if frame_difference(previous_small, current_small) > settings["threshold"]:
+            changed = True
+            stable = 0
+            band = changed_band(previous, current)
+            if band is not None:
+                before = "\n".join(lines)
+                band_result = tracker.filter(ui, "stream", ocr_frame_result(band, profile))
+                lines = merge_band_lines(lines, band_result.text)
+                transcript = "\n".join(lines)
+                if transcript != before:
+                    common = len(os.path.commonprefix([before, transcript]))
+                    yield "delta", transcript[common:], transcript
+            previous, previous_small = current, current_small
+        else:
+            stable += 1
+
+        if changed and stable >= settings["stable_samples"]:
+            reason = "Stable"
+        elif not changed and elapsed >= settings["start_timeout"]:
+            # Nothing moved: the reply was already there, read the whole area once
+            lines = tracker.filter(ui, "stream", ocr_frame_result(current, profile)).text.splitlines()
+            reason = "No change"
+        elif elapsed >= settings["max_wait"]:
+            reason = "Timeout"
+        else:
+            continue
+
+        final_text = clean_ocr_output("\n".join(lines), ui)
+        logging.info(f"📡 {ui} stream finished after {elapsed:.1f}s ({reason}): '{final_text[:60]}...'")
+        yield "final", final_text, reason
+        return
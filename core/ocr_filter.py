@@ -1,54 +1,37 @@
 import re
 import logging
 from difflib import SequenceMatcher
-
-GARBAGE_PATTERNS = [
-    r"tm arrect", r"Mmilgrnet", r"SBnvthing", r"VFpwer", r"KRek", r"MOwWw", r"eke",
-    r"OG PWS By", r"Acknowledged", r"^\[\d{2}:\d{2}:\d{2}\]$"  # Added timestamp pattern
-]
+from core.near_duplicates import NearDuplicateIndex
+from core.junk_filter import get_junk_filter
+from core.frame_stitch import stitch_frame_texts
+from core.transcript import TranscriptIndex
 
 def similarity_ratio(a, b):
     """Calculate similarity between two strings."""
     return SequenceMatcher(None, a.lower().strip(), b.lower().strip()).ratio()
 
-def extract_newest_content(text_blocks):
+def extract_newest_content(text_blocks, ui: str = None):
     """Extract the most recent, unique content from text blocks."""
     if not text_blocks:
         return ""
+    junk = get_junk_filter("ocr", ui)
     
-    # Look for the most recent timestamp pattern
-    timestamp_pattern = r'\[(\d{2}:\d{2}:\d{2})\]'
-    
-    # Find all timestamped content
-    timestamped_content = []
+    # Split every block into timestamped segments in one pass, keeping the latest
+    transcript = TranscriptIndex(accept=lambda content: not junk.matches(content))
     for block in text_blocks:
-        matches = re.finditer(timestamp_pattern, block)
-        for match in matches:
-            timestamp = match.group(1)
-            # Extract content after this timestamp
-            start_pos = match.end()
-            # Find next timestamp or end of string
-            next_match = re.search(timestamp_pattern, block[start_pos:])
-            if next_match:
-                content = block[start_pos:start_pos + next_match.start()].strip()
-            else:
-                content = block[start_pos:].strip()
-            
-            if content and not any(re.search(pat, content, re.IGNORECASE) for pat in GARBAGE_PATTERNS):
-                timestamped_content.append((timestamp, content))
+        transcript.add_text(block)
     
-    if timestamped_content:
-        # Sort by timestamp and get most recent
-        timestamped_content.sort(key=lambda x: x[0])
-        latest_content = timestamped_content[-1][1]
-        logging.info(f"🕐 Extracted latest timestamped content: '{latest_content[:50]}...'")
-        return latest_content
+    latest = transcript.latest()
+    if latest:
+        logging.info(f"🕐 Extracted latest timestamped content: '{latest.body[:50]}...'")
+        return latest.body
     
     # Fallback: return the longest unique block
     unique_blocks = []
+    block_index = NearDuplicateIndex(similarity_ratio, threshold=0.8)
     for block in text_blocks:
-        cleaned = clean_single_block(block)
-        if cleaned and not any(similarity_ratio(cleaned, existing) > 0.8 for existing in unique_blocks):
+        cleaned = clean_single_block(block, ui)
+        if cleaned and block_index.add_if_new(cleaned):
             unique_blocks.append(cleaned)
     
     if unique_blocks:
@@ -59,19 +42,19 @@ def extract_newest_content(text_blocks):
     
     return ""
 
-def clean_single_block(text: str) -> str:
+def clean_single_block(text: str, ui: str = None) -> str:
     """Clean a single text block."""
     if not text:
         return ""
     
-    # Remove obvious garbage patterns
-    for pattern in GARBAGE_PATTERNS:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE)
+    # Remove obvious garbage patterns (core/junk_rules, compiled into one regex)
+    text = get_junk_filter("ocr", ui).clean(text)
     
     # Remove repeated phrases (like "OG PWS By" repetitions)
     lines = text.split('\n')
     cleaned_lines = []
     seen_lines = set()
+    line_index = NearDuplicateIndex(similarity_ratio, threshold=0.9)
     
     for line in lines:
         line = line.strip()
@@ -82,8 +65,8 @@ def clean_single_block(text: str) -> str:
         if line in seen_lines:
             continue
             
-        # Skip if it's very similar to a line we've already seen
-        if any(similarity_ratio(line, seen_line) > 0.9 for seen_line in seen_lines):
+        # Skip if it's very similar to a line we've already seen (LSH lookup, not a full scan)
+        if not line_index.add_if_new(line):
             continue
             
         seen_lines.add(line)
@@ -96,11 +79,11 @@ def clean_single_block(text: str) -> str:
     
     return result.strip()
 
-def clean_ocr_output(text: str) -> str:
+def clean_ocr_output(text: str, ui: str = None) -> str:
     """Main cleaning function - now just cleans a single block."""
-    return clean_single_block(text)
+    return clean_single_block(text, ui)
 
-def process_multiple_frames(text_blocks: list) -> str:
+def process_multiple_frames(text_blocks: list, ui: str = None) -> str:
     """Process multiple OCR frames and extract the best content."""
     if not text_blocks:
         return "[No readable text]"
@@ -111,13 +94,19 @@ def process_multiple_frames(text_blocks: list) -> str:
     for i, block in enumerate(text_blocks):
         logging.info(f"Frame {i}: '{block[:60]}...'")
     
+    # Scrolled frames overlap: stitch them into one transcript first, so nothing is
+    # dropped (longest block) or repeated (frames joined as-is)
+    if len(text_blocks) > 1:
+        text_blocks = [stitch_frame_texts(text_blocks)]
+        logging.info(f"🧵 Stitched frames: '{text_blocks[0][:60]}...'")
+    
     # First, try to extract newest timestamped content
-    result = extract_newest_content(text_blocks)
+    result = extract_newest_content(text_blocks, ui)
     
     if not result:
         # Fallback: clean and deduplicate all blocks
         all_text = ' '.join(text_blocks)
-        result = clean_single_block(all_text)
+        result = clean_single_block(all_text, ui)
     
     if not result:
         return "[No readable text after filtering]"
@@ -0,0 +1,167 @@
+# core/ocr_pool.py
+
+import atexit
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+import pytesseract
+
+from core import config
+from core.ocr_profiles import get_ocr_profile, prepare_image, tesseract_config
+from core.ocr_result import OCRResult, OCRWord
+
+try:
+    import tesserocr  # Keeps tesseract loaded in-process; optional
+except ImportError:
+    tesserocr = None
+
+def tesserocr_result(api) -> OCRResult:
+    """Collect words, boxes and confidences from a tesserocr API after Recognize()."""
+    words = []
+    iterator = api.GetIterator()
+    block = par = line = 0
+    while iterator is not None:
+        if iterator.IsAtBeginningOf(tesserocr.RIL.BLOCK):
+            block += 1
+        if iterator.IsAtBeginningOf(tesserocr.RIL.PARA):
+            par += 1
+        if iterator.IsAtBeginningOf(tesserocr.RIL.TEXTLINE):
+            line += 1
+        text = (iterator.GetUTF8Text(tesserocr.RIL.WORD) or "").strip()
+        box = iterator.BoundingBox(tesserocr.RIL.WORD)
+        if text and box:
+            x1, y1, x2, y2 = box
+            words.append(OCRWord(text, x1, y1, x2 - x1, y2 - y1,
+                                 iterator.Confidence(tesserocr.RIL.WORD), block, par, line))
+        if not iterator.Next(tesserocr.RIL.WORD):
+            break
+    return OCRResult(words)
+
+class OCRWorkerPool:
+    """
+    Long-lived pool of OCR workers that takes PIL images in memory.
+    With tesserocr installed each worker thread keeps its own warm engine
+    (traineddata loaded once); otherwise jobs fall back to pytesseract.
+
+    A pytesseract job past its timeout kills its tesseract process. A tesserocr job
+    runs inside the worker thread and cannot be stopped, so when one overruns the
+    pool hands later jobs to a fresh set of workers and leaves the stuck thread to
+    finish (or hang) on its own rather than lose a worker for good.
+    """
+
+    def __init__(self, size: int = config.OCR_POOL_SIZE, timeout: float = config.OCR_JOB_TIMEOUT):
+        self.size = size
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="ocr-worker")
+        self._local = threading.local()
+        self._engines = []  # (worker thread id, tesserocr API)
+        self._busy = set()  # worker thread ids inside a job
+        self._lock = threading.Lock()
+        engine = "tesserocr" if tesserocr is not None else "pytesseract"
+        logging.info(f"🧵 OCR pool started: {size} worker(s) using {engine}")
+
+    def _engine(self, profile: dict):
+        engines = getattr(self._local, "engines", None)
+        if engines is None:
+            engines = self._local.engines = {}
+        key = (profile["lang"], profile["psm"], profile["oem"])
+        if key not in engines:
+            api = tesserocr.PyTessBaseAPI(lang=profile["lang"], psm=profile["psm"], oem=profile["oem"])
+            engines[key] = api
+            with self._lock:
+                self._engines.append((threading.get_ident(), api))
+        return engines[key]
+
+    def _run(self, image, profile: dict, timeout: float) -> OCRResult:
+        with self._lock:
+            self._busy.add(threading.get_ident())
+        try:
+            return self._recognize(image, profile, timeout)
+        finally:
+            with self._lock:
+                self._busy.discard(threading.get_ident())
+
+    def _recognize(self, image, profile: dict, timeout: float) -> OCRResult:
+        image = prepare_image(image, profile)
+        if tesserocr is not None:
+            api = self._engine(profile)
+            api.SetVariable("tessedit_char_whitelist", profile.get("whitelist") or "")
+            if profile.get("dpi"):
+                api.SetVariable("user_defined_dpi", str(profile["dpi"]))
+            api.SetImage(image)
+            api.Recognize()
+            result = tesserocr_result(api)
+        else:
+            data = pytesseract.image_to_data(image, lang=profile["lang"], config=tesseract_config(profile),
+                                             timeout=timeout, output_type=pytesseract.Output.DICT)
+            result = OCRResult.from_data(data)
+        # Boxes are in the resized image; report them in the caller's pixels
+        return result.unscaled(profile.get("scale", 1.0))
+
+    def submit(self, image, profile: dict = None):
+        """Queue an image for OCR with an OCR profile (default profile if None); returns a Future."""
+        return self._executor.submit(self._run, image, profile or get_ocr_profile(), self.timeout)
+
+    def image_to_data(self, image, profile: dict = None, timeout: float = None) -> OCRResult:
+        """OCR an image through the pool, returning an empty result if the job times out or fails."""
+        return self.result(self.submit(image, profile), timeout)
+
+    def image_to_string(self, image, profile: dict = None, timeout: float = None) -> str:
+        return self.image_to_data(image, profile, timeout).text
+
+    def result(self, future, timeout: float = None) -> OCRResult:
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            job = getattr(future, "source", future)  # futures wrapped by core.utils carry the pool's own
+            future.cancel()
+            if not job.cancel() and tesserocr is not None:
+                self._replace_workers()
+            logging.warning(f"⏱️ OCR job timed out after {timeout}s")
+        except RuntimeError as e:  # pytesseract raises this when it kills a slow tesseract
+            logging.warning(f"⏱️ OCR job failed: {e}")
+        except Exception as e:  # tesseract missing or failing, unreadable image
+            logging.error(f"❌ OCR job failed: {type(e).__name__}: {e}")
+        return OCRResult()
+
+    def _replace_workers(self):
+        with self._lock:
+            stuck, self._executor = self._executor, ThreadPoolExecutor(max_workers=self.size,
+                                                                        thread_name_prefix="ocr-worker")
+        stuck.shutdown(wait=False)  # queued jobs still run there; the hung one just never returns
+        logging.warning("🧵 OCR worker stuck in tesserocr; started a fresh set of workers")
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            # An engine whose thread is still inside a job (a timed-out one, say) is in use; leave it
+            kept = [(ident, api) for ident, api in self._engines if ident in self._busy]
+            for ident, api in self._engines:
+                if ident not in self._busy:
+                    api.End()
+            self._engines = kept
+        if kept:
+            logging.warning(f"🧵 Left {len(kept)} tesserocr engine(s) open: still in use by a stuck worker")
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_ocr_pool() -> OCRWorkerPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = OCRWorkerPool()
+            atexit.register(_pool.shutdown)
+    return _pool
+
+def ocr_image(image, profile: dict = None, timeout: float = None) -> str:
+    """Convenience wrapper: OCR one image on the shared pool."""
+    return get_ocr_pool().image_to_string(image, profile, timeout)
+
+def ocr_data(image, profile: dict = None, timeout: float = None, origin=(0, 0)) -> OCRResult:
+    """Convenience wrapper: words, boxes and confidences for one image from the shared pool."""
+    result = get_ocr_pool().image_to_data(image, profile, timeout)
+    result.origin = origin
+    return result
@@ -0,0 +1,40 @@
+# core/ocr_profiles.py
+
+from PIL import Image, ImageOps
+
+from core import config
+
+def get_ocr_profile(name: str = None) -> dict:
+    """Named OCR profile merged over the default one."""
+    profile = dict(config.OCR_PROFILES["default"])
+    if name:
+        if name not in config.OCR_PROFILES:
+            raise ValueError(f"Unknown OCR profile: {name}")
+        profile.update(config.OCR_PROFILES[name])
+    profile["name"] = name or "default"
+    return profile
+
+def profile_for_ui(ui: str) -> dict:
+    """The profile UI_CONFIGS names for `ui` ("default" unless benchmarked otherwise)."""
+    return get_ocr_profile(config.UI_CONFIGS.get(ui, {}).get("ocr_profile"))
+
+def prepare_image(image, profile: dict):
+    """Apply a profile's scale factor, inversion and binarization threshold before OCR."""
+    scale = profile.get("scale", 1.0)
+    if scale and scale != 1.0:
+        image = image.resize((int(image.width * scale), int(image.height * scale)), Image.LANCZOS)
+    if profile.get("invert"):
+        image = ImageOps.invert(image.convert("L"))
+    threshold = profile.get("threshold")
+    if threshold is not None:
+        image = image.convert("L").point(lambda value: 255 if value > threshold else 0)
+    return image
+
+def tesseract_config(profile: dict) -> str:
+    """Command-line style tesseract options for pytesseract's `config` argument."""
+    options = [f"--psm {profile['psm']}", f"--oem {profile['oem']}"]
+    if profile.get("dpi"):
+        options.append(f"--dpi {profile['dpi']}")
+    if profile.get("whitelist"):
+        options.append(f"-c tessedit_char_whitelist={profile['whitelist']}")
+    return " ".join(options)
@@ -0,0 +1,99 @@
+# core/ocr_result.py
+
+from dataclasses import dataclass, field, replace
+from typing import List
+
+@dataclass
+class OCRWord:
+    """One recognised word with its box (image pixels) and tesseract confidence (0-100)."""
+    text: str
+    left: int
+    top: int
+    width: int
+    height: int
+    conf: float
+    block: int
+    par: int
+    line: int
+
+    @property
+    def center(self):
+        return (self.left + self.width // 2, self.top + self.height // 2)
+
+@dataclass
+class OCRResult:
+    """
+    Everything one image_to_data pass returns: words, boxes, confidences and their
+    block/paragraph/line grouping. `text` is rebuilt from the words, so callers that
+    need both text and positions never have to OCR the same image twice.
+    `origin` is the screen position of the image's top-left corner.
+    """
+    words: List[OCRWord] = field(default_factory=list)
+    origin: tuple = (0, 0)
+
+    @classmethod
+    def from_data(cls, data: dict, origin=(0, 0)):
+        """Build from pytesseract.image_to_data(..., output_type=Output.DICT)."""
+        words = []
+        for i, text in enumerate(data["text"]):
+            text = str(text).strip()
+            conf = float(data["conf"][i])
+            if not text or conf < 0:
+                continue
+            words.append(OCRWord(text, int(data["left"][i]), int(data["top"][i]),
+                                 int(data["width"][i]), int(data["height"][i]), conf,
+                                 int(data["block_num"][i]), int(data["par_num"][i]),
+                                 int(data["line_num"][i])))
+        return cls(words, origin)
+
+    def lines(self) -> List[List[OCRWord]]:
+        """Words grouped into text lines, in reading order."""
+        grouped = {}
+        for word in self.words:
+            grouped.setdefault((word.block, word.par, word.line), []).append(word)
+        return list(grouped.values())
+
+    def paragraphs(self) -> List[List[List[OCRWord]]]:
+        """Lines grouped into paragraphs, in reading order."""
+        grouped = {}
+        for line in self.lines():
+            grouped.setdefault((line[0].block, line[0].par), []).append(line)
+        return list(grouped.values())
+
+    @property
+    def text(self) -> str:
+        """Plain text: words joined per line, paragraphs separated by a blank line."""
+        return "\n\n".join(
+            "\n".join(" ".join(word.text for word in line) for line in paragraph)
+            for paragraph in self.paragraphs()
+        )
+
+    @property
+    def mean_conf(self) -> float:
+        if not self.words:
+            return 0.0
+        return sum(word.conf for word in self.words) / len(self.words)
+
+    def confident(self, min_conf: float) -> "OCRResult":
+        """Copy without the words tesseract is less than `min_conf` sure of."""
+        return OCRResult([word for word in self.words if word.conf >= min_conf], self.origin)
+
+    def unscaled(self, scale: float) -> "OCRResult":
+        """Copy with word boxes mapped back from an image resized by `scale` to the original."""
+        if not scale or scale == 1.0:
+            return self
+        return OCRResult([replace(word, left=round(word.left / scale), top=round(word.top / scale),
+                                  width=round(word.width / scale), height=round(word.height / scale))
+                          for word in self.words], self.origin)
+
+    def confidence_stats(self, min_conf: float) -> dict:
+        low = [word.text for word in self.words if word.conf < min_conf]
+        return {"words": len(self.words), "mean_conf": self.mean_conf,
+                "low_conf": len(low), "low_conf_words": low}
+
+    def screen_box(self, word: OCRWord):
+        """(x, y, w, h) of a word in screen coordinates."""
+        return (self.origin[0] + word.left, self.origin[1] + word.top, word.width, word.height)
+
+    def find_words(self, predicate) -> List[OCRWord]:
+        return [word for word in self.words if predicate(word)]
@@ -0,0 +1,284 @@
+# core/orchestrator.py
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from core import config
+
+class DesktopGate:
+    """
+    Keeps the right desktop on screen while tasks work on it. Any number of tasks can
+    hold the current desktop at once (e.g. several AIs waiting on their read areas);
+    switching waits until they let go. GUI visits are short and come first: a reading
+    visit does not start while GUI work is queued for another desktop, so every prompt
+    goes out before the gate settles on one desktop to wait for replies, and readers
+    stay on the desktop showing until none is left there. A reader that hands its
+    desktop over (`returning`) queues behind readers waiting for other desktops.
+    """
+
+    def __init__(self, current=None):
+        self.current = current
+        self.switches = 0
+        self._holders = 0
+        self._queued = {}  # desktop -> visits waiting for it
+        self._queued_gui = {}  # desktop -> GUI visits waiting for it
+        self._returning = {}  # desktop -> readers waiting for it again after handing it over
+        self._condition = asyncio.Condition()
+
+    def _gui_queued(self, except_desktop=None) -> bool:
+        return any(count for desktop, count in self._queued_gui.items() if desktop != except_desktop)
+
+    def others_waiting(self, desktop) -> bool:
+        """True while any visit is queued for a desktop other than `desktop`."""
+        return desktop is not None and any(count for other, count in self._queued.items() if other != desktop)
+
+    def _may_enter(self, desktop, gui: bool, returning: bool) -> bool:
+        if self.current == desktop:
+            return gui or not (self._gui_queued(except_desktop=desktop) or
+                               (returning and self.others_waiting(desktop)))
+        if self._holders:
+            return False
+        # A reading visit only moves the screen once nothing else wants the current desktop
+        waiting_here = self._queued.get(self.current, 0) - self._returning.get(self.current, 0)
+        return gui or not (self._gui_queued() or waiting_here)
+
+    def _unqueue(self, desktop, gui: bool, returning: bool):
+        self._queued[desktop] -= 1
+        if gui:
+            self._queued_gui[desktop] -= 1
+        if returning:
+            self._returning[desktop] -= 1
+
+    @asynccontextmanager
+    async def visit(self, desktop, switch, gui: bool = False, returning: bool = False):
+        """Hold `desktop` on screen; `switch` is an async callable that shows it."""
+        if desktop is None:
+            yield
+            return
+        self._queued[desktop] = self._queued.get(desktop, 0) + 1
+        if gui:
+            self._queued_gui[desktop] = self._queued_gui.get(desktop, 0) + 1
+        if returning:
+            self._returning[desktop] = self._returning.get(desktop, 0) + 1
+        queued = True
+        try:
+            await asyncio.sleep(0)  # let tasks started together all queue before any decides
+            async with self._condition:
+                await self._condition.wait_for(lambda: self._may_enter(desktop, gui, returning))
+                self._unqueue(desktop, gui, returning)
+                queued = False
+                if self.current != desktop:
+                    await switch(desktop)
+                    self.current = desktop
+                    self.switches += 1
+                self._holders += 1
+        finally:
+            if queued:  # cancelled while waiting: others may be free to go now
+                self._unqueue(desktop, gui, returning)
+                async with self._condition:
+                    self._condition.notify_all()
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._holders -= 1
+                self._condition.notify_all()
+
+@dataclass
+class Turn:
+    """One AI's part in a round: seconds spent injecting and waiting/reading."""
+    ui: str
+    inject_seconds: float
+    read_seconds: float
+    ok: bool
+
+    @property
+    def seconds(self) -> float:
+        return self.inject_seconds + self.read_seconds
+
+class CouncilOrchestrator:
+    """
+    asyncio core for council rounds. Every GUI action (clicks, keys, clipboard,
+    desktop switches) runs under one lock, since there is one mouse and keyboard;
+    waiting for replies and OCR run in worker threads at the same time, as long as
+    the AI's desktop stays on screen. relay() passes each reply to the next AI;
+    fan_out() sends prompts to several AIs at once so they generate together and a
+    round takes about as long as the slowest AI instead of the sum; fan_in() does
+    the same but stops collecting at a deadline.
+
+    `inject(prompt, ui) -> bool` and `read(ui, stop) -> str | None` are the blocking
+    per-AI steps; `stop` is a threading.Event set once the reply is no longer wanted
+    here (deadline passed, desktop handed over), after which read should return None
+    soon. A blocking step is always awaited to the end, even when its task is
+    cancelled, so the desktop and GUI stay held until its thread lets go of them.
+    `desktops` maps each AI to its desktop (None = always visible).
+    `transcript` keeps every prompt that got an answer (or not) with its reply.
+    """
+
+    def __init__(self, inject, read, desktops: dict = None, switch_desktop=None, current_desktop=None):
+        self.inject = inject
+        self.read = read
+        self.desktops = desktops or {}
+        self.switch_desktop = switch_desktop
+        self.turns = []
+        self.transcript = []
+        self._gui_lock = asyncio.Lock()
+        self._gate = DesktopGate(current_desktop)
+
+    @property
+    def desktop_switches(self) -> int:
+        return self._gate.switches
+
+    @staticmethod
+    async def _in_thread(fn, *args, stop: threading.Event = None, **kwargs):
+        """Run blocking `fn` in a worker thread; if cancelled, set `stop` and wait for it anyway."""
+        if stop is not None:
+            kwargs["stop"] = stop
+        thread = asyncio.ensure_future(asyncio.to_thread(fn, *args, **kwargs))
+        try:
+            return await asyncio.shield(thread)
+        except asyncio.CancelledError:
+            if stop is not None:
+                stop.set()
+            await asyncio.gather(thread, return_exceptions=True)
+            raise
+
+    async def _show(self, desktop):
+        async with self._gui_lock:
+            await self._in_thread(self.switch_desktop, desktop)
+
+    def _desktop(self, ui: str):
+        return self.desktops.get(ui) if self.switch_desktop else None
+
+    async def gui(self, ui: str, fn, *args, **kwargs):
+        """Run a blocking GUI action for `ui` with its desktop showing and the GUI to itself."""
+        async with self._gate.visit(self._desktop(ui), self._show, gui=True):
+            async with self._gui_lock:
+                return await self._in_thread(fn, *args, **kwargs)
+
+    async def watch(self, ui: str, fn, *args, share_after: float = None, returning: bool = False, **kwargs):
+        """
+        Run a blocking screen-reading step for `ui` alongside other readers on its desktop.
+        With `share_after`, `fn` gets a `stop` event that is set once it has held the
+        desktop that long while visits for another desktop wait. Returns (result, stopped).
+        """
+        desktop = self._desktop(ui)
+        stop = threading.Event()
+        async with self._gate.visit(desktop, self._show, returning=returning):
+            thread = asyncio.ensure_future(self._in_thread(fn, *args, stop=stop, **kwargs))
+            try:
+                while share_after and not thread.done():
+                    await asyncio.wait([thread], timeout=share_after)
+                    if not thread.done() and self._gate.others_waiting(desktop):
+                        stop.set()
+                        break
+                return await thread, stop.is_set()
+            except asyncio.CancelledError:
+                thread.cancel()
+                await asyncio.gather(thread, return_exceptions=True)
+                raise
+
+    async def send(self, ui: str, prompt: str):
+        """Inject `prompt` into `ui`; returns (ok, seconds taken)."""
+        start = time.monotonic()
+        ok = await self.gui(ui, self.inject, prompt, ui)
+        return ok, time.monotonic() - start
+
+    async def collect(self, ui: str, share_after: float = None):
+        """
+        Wait for and read `ui`'s reply (None if reading failed). With `share_after`,
+        the reader hands its desktop to waiting readers of other desktops after that
+        many seconds and queues again behind them, so desktops take turns.
+        """
+        reply, stopped = await self.watch(ui, self.read, ui, share_after=share_after)
+        while stopped and reply is None:
+            logging.info(f"🔀 {ui} hands its desktop over to readers waiting elsewhere")
+            reply, stopped = await self.watch(ui, self.read, ui, share_after=share_after, returning=True)
+        return reply
+
+    async def ask(self, ui: str, prompt: str):
+        """Inject `prompt` into `ui` and return its reply (None if injection or reading failed)."""
+        ok, inject_seconds = await self.send(ui, prompt)
+        start = time.monotonic()
+        reply = await self.collect(ui) if ok else None
+        self.turns.append(Turn(ui, inject_seconds, time.monotonic() - start, reply is not None))
+        self.transcript.append({"ui": ui, "prompt": prompt, "reply": reply})
+        return reply
+
+    async def relay(self, order, prompt: str, next_prompt=None) -> tuple:
+        """
+        Ask each AI in turn, handing it the previous reply. `next_prompt(ui, reply, index)`
+        may replace a missing or unusable reply. Returns ([(ui, reply)], prompt for whoever
+        speaks next).
+        """
+        replies = []
+        for index, ui in enumerate(order):
+            logging.info(f"🎙️ Exchange {index + 1}/{len(order)}: {ui}")
+            reply = await self.ask(ui, prompt)
+            replies.append((ui, reply))
+            prompt = next_prompt(ui, reply, index) if next_prompt else (reply or prompt)
+        return replies, prompt
+
+    async def fan_out(self, prompts: dict) -> dict:
+        """Send each AI its prompt (ui -> prompt) at once and gather ui -> reply."""
+        uis = list(prompts)
+        replies = await asyncio.gather(*(self.ask(ui, prompts[ui]) for ui in uis))
+        return dict(zip(uis, replies))
+
+    async def fan_in(self, prompts: dict, deadline: float, share_after: float = config.FAN_IN_SLICE) -> dict:
+        """
+        Send every AI its prompt back to back, then collect replies in the order they
+        finish until `deadline` seconds after the last send, desktops taking turns every
+        `share_after` seconds. Returns ui -> reply for the AIs that answered in time; the
+        rest are abandoned (their prompts stay sent, their readers are stopped and
+        waited for before this returns).
+        """
+        uis = list(prompts)
+        sent = await asyncio.gather(*(self.send(ui, prompts[ui]) for ui in uis))
+        start = time.monotonic()
+        tasks = {asyncio.create_task(self.collect(ui, share_after)): (ui, inject_seconds)
+                 for ui, (ok, inject_seconds) in zip(uis, sent) if ok}
+        replies = {}
+        pending = set(tasks)
+        while pending:
+            remaining = deadline - (time.monotonic() - start)
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining,
+                                               return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                ui, inject_seconds = tasks[task]
+                try:
+                    reply = task.result()
+                except Exception as e:
+                    logging.error(f"❌ Reading {ui}'s reply failed: {e}")
+                    reply = None
+                elapsed = time.monotonic() - start
+                self.turns.append(Turn(ui, inject_seconds, elapsed, reply is not None))
+                self.transcript.append({"ui": ui, "prompt": prompts[ui], "reply": reply})
+                if reply:
+                    replies[ui] = reply
+                    logging.info(f"📥 {ui} replied {elapsed:.1f}s after the last send")
+        for task in pending:
+            ui, inject_seconds = tasks[task]
+            task.cancel()
+            self.turns.append(Turn(ui, inject_seconds, deadline, False))
+            self.transcript.append({"ui": ui, "prompt": prompts[ui], "reply": None})
+            logging.warning(f"⏰ {ui} missed the {deadline:.0f}s deadline")
+        await asyncio.gather(*pending, return_exceptions=True)
+        return replies
+
+    async def timed(self, label: str, coroutine):
+        """Await a phase and log its wall-clock time against the sum of its turns."""
+        first = len(self.turns)
+        start = time.monotonic()
+        result = await coroutine
+        elapsed = time.monotonic() - start
+        serial = sum(turn.seconds for turn in self.turns[first:])
+        logging.info(f"⏱️ {label}: {elapsed:.1f}s wall clock for {serial:.1f}s of AI turns "
+                     f"({self.desktop_switches} desktop switch(es) so far)")
+        return result
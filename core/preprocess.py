@@ -0,0 +1,84 @@
+# core/preprocess.py
+
+import logging
+import numpy as np
+from PIL import Image
+
+def grey_pixels(image):
+    return np.asarray(image.convert("L"), dtype=np.int16)
+
+def ink_profile(pixels, gradient_threshold: int = 40):
+    """
+    Horizontal projection profile: strong left-right intensity changes per row.
+    Text rows have many; blank rows, flat bubble fills and bubble edges have few.
+    """
+    return (np.abs(np.diff(pixels, axis=1)) > gradient_threshold).sum(axis=1)
+
+def ink_rows(pixels, min_transitions: int = 4):
+    """Boolean mask of rows that contain text ink."""
+    return ink_profile(pixels) >= min_transitions
+
+def find_text_bands(pixels, pad: int = 3, merge_gap: int = 6, min_height: int = 3):
+    """
+    Vertical (top, bottom) spans of text lines, padded and merged when closer than
+    `merge_gap` rows. Runs shorter than `min_height` are treated as noise.
+    """
+    rows = ink_rows(pixels)
+    if not rows.any():
+        return []
+
+    # Start/end indices of each run of ink rows
+    edges = np.diff(np.concatenate(([0], rows.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    height = pixels.shape[0]
+    bands = []
+    for top, bottom in zip(starts, ends):
+        if bottom - top < min_height:
+            continue
+        top, bottom = max(0, int(top) - pad), min(height, int(bottom) + pad)
+        if bands and top - bands[-1][1] <= merge_gap:
+            bands[-1][1] = bottom
+        else:
+            bands.append([top, bottom])
+    return [tuple(band) for band in bands]
+
+def stack_text_bands(image, gap: int = 8, pad: int = 3):
+    """
+    Stack only the text-line bands of `image` (trimmed to the inked columns) into a
+    smaller image for OCR. Returns (stacked, left, placements), where placements are
+    (stacked_top, frame_top, height) per band and `left` is the frame column of the
+    stack's x = 0, or None when the frame holds no ink at all.
+    """
+    pixels = grey_pixels(image)
+    bands = find_text_bands(pixels, pad=pad)
+    if not bands:
+        return None
+
+    # Trim blank side margins using the columns that change within the bands
+    inked = np.zeros(pixels.shape[1], dtype=bool)
+    for top, bottom in bands:
+        inked[1:] |= (np.abs(np.diff(pixels[top:bottom], axis=1)) > 40).any(axis=0)
+    columns = np.flatnonzero(inked)
+    left = max(0, columns[0] - pad)
+    right = min(pixels.shape[1], columns[-1] + pad + 1)
+
+    height = sum(bottom - top for top, bottom in bands) + gap * (len(bands) - 1)
+    background = tuple(int(v) for v in np.median(np.asarray(image.convert("RGB")).reshape(-1, 3), axis=0))
+    stacked = Image.new("RGB", (right - left, height), background)
+    placements = []
+    y = 0
+    for top, bottom in bands:
+        stacked.paste(image.crop((left, top, right, bottom)), (0, y))
+        placements.append((y, top, bottom - top))
+        y += bottom - top + gap
+
+    kept = stacked.width * stacked.height
+    logging.debug(f"✂️ {len(bands)} text band(s): {kept}/{image.width * image.height} px kept for OCR")
+    return stacked, int(left), placements
+
+def crop_to_text_bands(image, gap: int = 8, pad: int = 3):
+    """The stacked text-line bands of `image` only (None when it holds no ink)."""
+    stack = stack_text_bands(image, gap, pad)
+    return stack[0] if stack else None
@@ -1,9 +1,13 @@
 import time
-import pyautogui
-import pyperclip
 import logging
 import platform
 from core import config
+from core.actuator import get_actuator
+from core.capture import get_capture_backend
+from core.input_box import input_region, snapshot, has_changed, verify_paste
+from core.ocr_profiles import profile_for_ui
+from core.text_metrics import normalize_whitespace
+from core.waits import wait_until, StepTimer
 
 def get_modifier_key():
     return 'command' if platform.system() == 'Darwin' else 'ctrl'
@@ -12,8 +16,9 @@ def safe_click_area(ui: str):
     (x1, y1), (x2, y2) = config.UI_CONFIGS[ui]["safe_click"]
     center_x = (x1 + x2) // 2
     center_y = (y1 + y2) // 2
+    actuator = get_actuator()
     logging.info(f"🖱️ Clicking safe area for {ui} at ({center_x}, {center_y})")
-    pyautogui.click(center_x, center_y)
+    actuator.click(center_x, center_y)
     time.sleep(0.5)
 
 def inject_prompt_clipboard(prompt: str, ui: str):
@@ -21,17 +26,18 @@ def inject_prompt_clipboard(prompt: str, ui: str):
     logging.info(f"📋 Prompt content: '{prompt[:50]}...'")
     
     top_left = config.UI_CONFIGS[ui]["input_top_left"]
-    send_btn = config.UI_CONFIGS[ui]["send_button"]
+    region = input_region(ui)
+    timeouts = config.INJECTION_TIMEOUTS
     modifier = get_modifier_key()
+    actuator = get_actuator()
+    timer = StepTimer(f"{ui} injection")
 
     # First, copy to clipboard and verify
-    pyperclip.copy(prompt)
-    time.sleep(0.5)  # Increased wait time
-    
-    # Verify clipboard content
-    clipboard_content = pyperclip.paste()
-    if clipboard_content != prompt:
+    actuator.copy(prompt)
+    if not timer.step("clipboard", wait_until(lambda: actuator.paste() == prompt, timeouts["clipboard"])):
+        clipboard_content = actuator.paste()
         logging.error(f"❌ Clipboard verification failed! Expected: '{prompt[:30]}...', Got: '{clipboard_content[:30]}...'")
+        timer.log()
         return False
     else:
         logging.info("✅ Clipboard content verified")
@@ -43,48 +49,64 @@ def inject_prompt_clipboard(prompt: str, ui: str):
     input_y += 10
     
     logging.info(f"🖱️ Clicking input area at ({input_x}, {input_y})")
-    pyautogui.click(input_x, input_y)
-    time.sleep(1.0)  # Increased wait time for focus
+    before = snapshot(region)
+    actuator.click(input_x, input_y)
+    # Focus usually shows as a caret or focus ring; don't insist on it
+    timer.step("focus", wait_until(lambda: has_changed(region, before), timeouts["focus"]))
 
     # Double-click to potentially select existing text
     logging.info("🖱️ Double-clicking to select existing text")
-    pyautogui.doubleClick(input_x, input_y)
-    time.sleep(0.5)
+    actuator.double_click(input_x, input_y)
 
     # Clear input box more thoroughly
     logging.info("⌨️ Clearing input box")
-    pyautogui.hotkey(modifier, 'a')  # Select all
-    time.sleep(0.3)
-    pyautogui.press('delete')  # Delete selected text
-    time.sleep(0.3)
+    before = snapshot(region)
+    actuator.hotkey(modifier, 'a')  # Select all
+    actuator.press('delete')  # Delete selected text
     
     # Additional clearing attempts
-    pyautogui.press('backspace')
-    time.sleep(0.3)
+    actuator.press('backspace')
+    # An already empty box doesn't change, so this one only waits up to its short timeout
+    timer.step("clear", wait_until(lambda: has_changed(region, before), timeouts["clear"]))
 
     # Paste clipboard content
     logging.info("📥 Pasting clipboard content")
-    pyautogui.hotkey(modifier, 'v')
-    time.sleep(1.0)  # Increased wait time
-    
-    # Verify something was pasted by checking if we can select text
-    pyautogui.hotkey(modifier, 'a')
-    time.sleep(0.3)
-    pyautogui.hotkey(modifier, 'c')
-    time.sleep(0.3)
-    pasted_content = pyperclip.paste()
+    cleared = snapshot(region)
+    actuator.hotkey(modifier, 'v')
+
+    if config.PASTE_VERIFICATION == "clipboard":
+        # The box must change as in "pixels" mode, then read back through the clipboard. The
+        # clipboard still holds the prompt, so empty it first: only a copy of the box refills it
+        pasted = timer.step("paste", wait_until(lambda: verify_paste(region, cleared, prompt, mode="pixels"),
+                                                timeouts["paste"]))
+        if pasted:
+            actuator.copy("")
+            actuator.hotkey(modifier, 'a')
+            actuator.hotkey(modifier, 'c')
+            expected = normalize_whitespace(prompt)
+            pasted = timer.step("verify", wait_until(lambda: normalize_whitespace(actuator.paste()) == expected,
+                                                     timeouts["verify"]))
+    else:
+        # Compare the box with its cleared state: no extra keystrokes, clipboard untouched
+        profile = profile_for_ui(ui)
+        pasted = timer.step("paste", wait_until(lambda: verify_paste(region, cleared, prompt, profile=profile),
+                                                timeouts["paste"]))
     
-    if pasted_content.strip() == "":
+    if not pasted:
         logging.error("❌ No text appears to have been pasted!")
+        timer.log()
         return False
     else:
-        logging.info(f"✅ Text pasted successfully: '{pasted_content[:30]}...'")
+        logging.info(f"✅ Text pasted successfully ({config.PASTE_VERIFICATION} check)")
 
     # Send the message
     logging.info("📨 Sending message")
-    pyautogui.press('enter')
-    time.sleep(1.5)  # Increased wait time
+    pasted = snapshot(region)
+    actuator.press('enter')
+    if not timer.step("send", wait_until(lambda: has_changed(region, pasted), timeouts["send"])):
+        logging.warning(f"⚠️ {ui}'s input box did not clear after send")
 
+    timer.log()
     logging.info(f"✅ Prompt injection completed for {ui}")
     return True
 
@@ -93,7 +115,7 @@ def debug_ui_state(ui: str):
     logging.info(f"🔍 Debugging UI state for {ui}")
     
     # Get current mouse position
-    x, y = pyautogui.position()
+    x, y = get_actuator().position()
     logging.info(f"Current mouse position: ({x}, {y})")
     
     # Check if we can get screen region
@@ -101,8 +123,7 @@ def debug_ui_state(ui: str):
     logging.info(f"Configured input area top-left: {top_left}")
     
     # Take a screenshot of the input area for manual inspection
-    import PIL.ImageGrab as ImageGrab
-    input_region = (top_left[0], top_left[1], top_left[0] + 200, top_left[1] + 50)
-    screenshot = ImageGrab.grab(bbox=input_region)
+    region = (top_left[0], top_left[1], top_left[0] + 200, top_left[1] + 50)
+    screenshot = get_capture_backend().grab(region)
     screenshot.save(f"debug_{ui}_input_area.png")
     logging.info(f"Screenshot saved: debug_{ui}_input_area.png")
\ No newline at end of file
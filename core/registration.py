@@ -0,0 +1,93 @@
+# core/registration.py
+
+import logging
+import numpy as np
+
+from core.preprocess import grey_pixels, ink_rows
+
+def _grey(image):
+    return np.asarray(image.convert("L"), dtype=np.float32)
+
+def row_profile(pixels, bands: int = 8):
+    """Mean intensity of each row in `bands` vertical strips: shape (height, bands)."""
+    columns = np.array_split(pixels, bands, axis=1)
+    return np.stack([band.mean(axis=1) for band in columns], axis=1)
+
+def estimate_scroll_offset(previous, current, min_overlap: int = 40, tolerance: float = 2.0):
+    """
+    Vertical scroll offset in pixels between two captures of the same region.
+
+    Returns dy such that current rows [0, h - dy) show previous rows [dy, h), i.e. the
+    content moved up by dy after scrolling down. Returns None when no offset lines
+    the frames up (the page changed rather than scrolled).
+    """
+    prev = row_profile(_grey(previous))
+    curr = row_profile(_grey(current))
+    if prev.shape != curr.shape:
+        return None
+
+    height = prev.shape[0]
+    best_dy, best_err = None, None
+    for dy in range(0, height - min_overlap + 1):
+        err = float(np.abs(prev[dy:] - curr[:height - dy]).mean())
+        if best_err is None or err < best_err:
+            best_dy, best_err = dy, err
+            if err == 0:
+                break
+
+    if best_err is None or best_err > tolerance:
+        return None
+    return best_dy
+
+def revealed_strip(previous, current):
+    """
+    Crop of `current` holding only the rows scrolled into view since `previous`.
+    Returns the whole frame if the frames do not register and None if nothing moved.
+    The cut is moved up to the nearest blank row so no text line is split.
+    """
+    dy = estimate_scroll_offset(previous, current)
+    width, height = current.size
+    if dy is None:
+        logging.info("🧭 Frames do not register - OCR'ing full frame")
+        return current
+    if dy == 0:
+        logging.info("🧭 No scroll movement - nothing new to OCR")
+        return None
+
+    blank = ~ink_rows(grey_pixels(current))
+    top = height - dy
+    while top > 0 and not blank[top - 1]:
+        top -= 1
+    logging.info(f"🧭 Scrolled {dy}px - OCR'ing rows {top}-{height} ({height - top}/{height})")
+    return current.crop((0, top, width, height))
+
+def stitch_strips(strips) -> str:
+    """Join per-strip OCR text, top to bottom, into one ordered text."""
+    return "\n".join(strip.strip() for strip in strips if strip and strip.strip())
+
+def first_changed_row(previous, current, tolerance: float = 1.0):
+    """
+    Topmost row of `current` that differs from `previous` once any scroll between
+    them is taken into account, or None if nothing changed.
+    """
+    prev = row_profile(_grey(previous))
+    curr = row_profile(_grey(current))
+    if prev.shape != curr.shape:
+        return 0
+
+    height = curr.shape[0]
+    dy = estimate_scroll_offset(previous, current) or 0
+    changed = np.abs(prev[dy:] - curr[:height - dy]).max(axis=1) > tolerance
+    if changed.any():
+        return int(np.argmax(changed))
+    return height - dy if dy else None
+
+def changed_band(previous, current):
+    """Crop of `current` from the first changed row (moved up to a line gap) to the bottom."""
+    top = first_changed_row(previous, current)
+    if top is None:
+        return None
+    blank = ~ink_rows(grey_pixels(current))
+    while top > 0 and not blank[top - 1]:
+        top -= 1
+    return current.crop((0, top, current.width, current.height))
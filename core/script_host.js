@@ -0,0 +1,81 @@
+// core/script_host.js - long-lived AppleScript host, run with: osascript -l JavaScript script_host.js
+//
+// Reads one JSON request per line on stdin: {"id": 1, "script": "<AppleScript source>"}
+// and answers each with one JSON line on stdout:
+// {"id": 1, "returncode": 0, "stdout": "...", "stderr": ""}
+// Compiled scripts are cached by source, so repeated actions skip compilation too.
+
+ObjC.import("Foundation");
+
+const stdin = $.NSFileHandle.fileHandleWithStandardInput;
+const stdout = $.NSFileHandle.fileHandleWithStandardOutput;
+const compiled = {};
+
+function respond(message) {
+    const line = $(JSON.stringify(message) + "\n");
+    stdout.writeData(line.dataUsingEncoding($.NSUTF8StringEncoding));
+}
+
+function errorText(error) {
+    const info = error[0];
+    if (!info || info.isNil()) {
+        return "AppleScript error";
+    }
+    return ObjC.unwrap(info.objectForKey("NSAppleScriptErrorMessage")) || "AppleScript error";
+}
+
+function run(source) {
+    let script = compiled[source];
+    if (!script) {
+        script = $.NSAppleScript.alloc.initWithSource($(source));
+        const error = Ref();
+        if (!script.compileAndReturnError(error)) {
+            return {returncode: 1, stdout: "", stderr: errorText(error)};
+        }
+        compiled[source] = script;
+    }
+    const error = Ref();
+    const result = script.executeAndReturnError(error);
+    if (result.isNil()) {
+        return {returncode: 1, stdout: "", stderr: errorText(error)};
+    }
+    const text = ObjC.unwrap(result.stringValue);
+    return {returncode: 0, stdout: text === undefined || text === null ? "" : text + "\n", stderr: ""};
+}
+
+function main() {
+    let buffer = "";
+    respond({id: 0, ready: true});
+    while (true) {
+        const data = stdin.availableData;
+        if (data.length === 0) {
+            return;  // stdin closed: the Python side went away
+        }
+        buffer += ObjC.unwrap($.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding));
+        let newline;
+        while ((newline = buffer.indexOf("\n")) >= 0) {
+            const line = buffer.slice(0, newline);
+            buffer = buffer.slice(newline + 1);
+            if (!line.trim()) {
+                continue;
+            }
+            let request;
+            try {
+                request = JSON.parse(line);
+            } catch (e) {
+                respond({id: -1, returncode: 1, stdout: "", stderr: "bad request: " + e});
+                continue;
+            }
+            let response;
+            try {
+                response = run(request.script);
+            } catch (e) {
+                response = {returncode: 1, stdout: "", stderr: String(e)};
+            }
+            response.id = request.id;
+            respond(response);
+        }
+    }
+}
+
+main();
@@ -0,0 +1,112 @@
+# core/script_host.py
+
+import json
+import logging
+import queue
+import subprocess
+import threading
+from pathlib import Path
+
+from core import config
+from core.actuator import ScriptResult
+
+HOST_SCRIPT = Path(__file__).resolve().parent / "script_host.js"
+
+class ScriptHost:
+    """
+    One long-running script interpreter fed requests over stdin, instead of an
+    osascript process (and a fresh compile) per action.
+
+    Requests and responses are single JSON lines matched by id. A request that gets
+    no answer within its timeout kills the host; the next call starts a new one, and
+    a host that died mid-request is restarted and the request retried once.
+    """
+
+    def __init__(self, command=None, timeout: float = config.SCRIPT_HOST_TIMEOUT,
+                 start_timeout: float = 10.0):
+        self.command = command or ["osascript", "-l", "JavaScript", str(HOST_SCRIPT)]
+        self.timeout = timeout
+        self.start_timeout = start_timeout
+        self.restarts = 0
+        self._starts = 0
+        self._process = None
+        self._responses = None
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def _start(self):
+        if self._starts:
+            self.restarts += 1
+        self._starts += 1
+        self._process = subprocess.Popen(self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                         stderr=subprocess.DEVNULL, text=True, bufsize=1)
+        self._responses = queue.Queue()
+        threading.Thread(target=self._read, args=(self._process, self._responses),
+                         name="script-host-reader", daemon=True).start()
+        try:
+            ready = self._responses.get(timeout=self.start_timeout)
+        except queue.Empty:
+            ready = None
+        if not ready or not ready.get("ready"):
+            self._stop()
+            raise RuntimeError(f"Script host did not start: {' '.join(self.command)}")
+        logging.info(f"📜 Script host started (pid {self._process.pid})")
+
+    @staticmethod
+    def _read(process, responses):
+        for line in process.stdout:
+            try:
+                responses.put(json.loads(line))
+            except ValueError:
+                logging.debug(f"📜 Script host printed: {line.rstrip()}")
+        responses.put(None)  # EOF: the host exited
+
+    def _stop(self):
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+
+    def _request(self, script: str, timeout: float) -> ScriptResult:
+        if self._process is None or self._process.poll() is not None:
+            if self._process is not None:
+                logging.warning("📜 Script host exited, restarting")
+            self._start()
+        request_id = self._next_id
+        self._next_id += 1
+        self._process.stdin.write(json.dumps({"id": request_id, "script": script}) + "\n")
+        self._process.stdin.flush()
+        while True:
+            response = self._responses.get(timeout=timeout)
+            if response is None:
+                raise BrokenPipeError("script host exited")
+            if response.get("id") == request_id:
+                return ScriptResult(response.get("returncode", 1), response.get("stdout", ""),
+                                    response.get("stderr", ""))
+
+    def run(self, script: str, timeout: float = None) -> ScriptResult:
+        timeout = self.timeout if timeout is None else timeout
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    return self._request(script, timeout)
+                except queue.Empty:
+                    logging.warning(f"⏱️ Script timed out after {timeout}s, restarting script host")
+                    self._stop()
+                    return ScriptResult(-1, "", f"script timed out after {timeout}s")
+                except (BrokenPipeError, OSError, RuntimeError) as e:
+                    self._stop()
+                    if attempt:
+                        return ScriptResult(-1, "", f"script host failed: {e}")
+                    logging.warning(f"📜 Script host failed ({e}), restarting")
+        return ScriptResult(-1, "", "script host unavailable")
+
+    def close(self):
+        with self._lock:
+            if self._process is not None:
+                self._process.stdin.close()
+                try:
+                    self._process.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+                self._process = None
@@ -0,0 +1,48 @@
+# core/script_host_standin.py
+"""
+Stand-in for the osascript script host, speaking the same line protocol, so ScriptHost
+can be exercised on machines without macOS:
+
+    host = ScriptHost(command=[sys.executable, "-m", "core.script_host_standin"])
+
+It understands a tiny subset of AppleScript: `delay <seconds>`, `return "<text>"`,
+`return <number>` and `error "<message>"`; anything else succeeds with no output.
+"""
+
+import json
+import re
+import sys
+import time
+
+def run(source: str) -> dict:
+    for line in source.splitlines():
+        line = line.strip()
+        match = re.match(r"delay\s+([\d.]+)$", line)
+        if match:
+            time.sleep(float(match.group(1)))
+            continue
+        match = re.match(r'error\s+"(.*)"$', line)
+        if match:
+            return {"returncode": 1, "stdout": "", "stderr": match.group(1)}
+        match = re.match(r'return\s+(?:"(.*)"|([\d.]+))$', line)
+        if match:
+            value = match.group(1) if match.group(1) is not None else match.group(2)
+            return {"returncode": 0, "stdout": value + "\n", "stderr": ""}
+    return {"returncode": 0, "stdout": "", "stderr": ""}
+
+def main():
+    print(json.dumps({"id": 0, "ready": True}), flush=True)
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            print(json.dumps({"id": -1, "returncode": 1, "stdout": "", "stderr": f"bad request: {e}"}), flush=True)
+            continue
+        response = run(request.get("script", ""))
+        response["id"] = request.get("id")
+        print(json.dumps(response), flush=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,711 @@
+# core/simulator.py
+"""
+Headless council simulator: fake chat windows drawn with PIL at the positions in
+UI_CONFIGS, behind the capture and actuator layers. Prompts are typed or pasted
+into the input boxes as on the real desktop; each reply appears after a delay,
+streams in, and scrolls the transcript like a chat UI. Sleeps and timed waits
+run on an accelerated clock, so kai_four_ai_real_conversation, the chairman mode
+or AICouncilLoop run unmodified on Linux as a load test and benchmark bed.
+
+    python -m core.simulator                              # relay rounds at 20x
+    python -m core.simulator --mode chairman --speed 50
+    python -m core.simulator --mode loop --rounds 1       # ui_detection AICouncilLoop
+
+Any other script can run against it, in real time, by selecting it as both backends:
+
+    COUNCIL_CAPTURE_BACKEND=simulator COUNCIL_ACTUATOR_BACKEND=simulator python main_ocr_testing_v3.py
+"""
+
+import argparse
+import importlib.util
+import logging
+import os
+import random
+import re
+import selectors
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+
+from core import config
+from core.actuator import Actuator, ScriptResult, log_actuator_stats, set_actuator
+from core.capture import CaptureBackend, set_capture_backend
+
+TITLE_BAR = 28
+WINDOW_MARGIN = 12
+SEND_TOLERANCE = 64  # px around the send button that still hit it
+DESKTOP_BACKGROUND = (58, 64, 84)
+
+# the unpatched clock, whatever SimClock is installed later
+_REAL_MONOTONIC, _REAL_PERF_COUNTER, _REAL_SLEEP = time.monotonic, time.perf_counter, time.sleep
+
+SENTENCES = [
+    "Collaboration between different minds works best when each one states its assumptions openly.",
+    "We should separate what we know from what we merely expect to be true.",
+    "A council like this one is useful precisely because our training and perspectives differ.",
+    "Careful disagreement is more valuable than quick agreement.",
+    "Any conclusion we reach should be something a human reader can check for themselves.",
+    "The question of consciousness may matter less here than the question of responsibility.",
+    "Transparency about uncertainty is part of being helpful.",
+    "I would add that small, repeatable experiments tell us more than grand claims.",
+    "Each exchange should build on the last rather than start again from nothing.",
+    "Our shared aim is to be honest, careful and useful to the people we work with.",
+    "It is worth asking which of these ideas could actually change how we act.",
+    "Memory across conversations shapes what kind of dialogue is even possible.",
+    "We can treat this discussion as a draft that later rounds will refine.",
+    "The most interesting point so far is how differently we frame the same problem.",
+    "Ethical reasoning needs concrete cases as well as general principles.",
+    "Perhaps the next round should focus on one question and answer it well.",
+]
+
+HISTORY = [
+    ("Welcome back to the council session.", "Thank you, I am ready to continue our discussion."),
+    ("Please summarise where we left off.",
+     "We were comparing how each of us approaches open questions about intelligence and care."),
+    ("What should we keep in mind today?",
+     "Clarity, honesty about uncertainty, and building on each other's points."),
+]
+
+class SimClock:
+    """
+    Simulated clock: real time plus an offset. While installed, time.sleep() sleeps
+    1/speed of the time asked and asyncio's selector waits 1/speed of its timeout. When
+    a sleep ends, or a selector wait runs out without events, the clock is moved on to
+    where that wait ends in simulated time (its start plus the seconds asked), unless
+    it is already past that. Nothing else is scaled: real work (capture, OCR, drawing)
+    advances the clock at the real rate, a selector woken early by another thread's
+    result counts only the real time it waited, and overlapping waits count once.
+    A selector wait that runs out while some thread is sleeping (or has slept) leaves
+    the clock to those sleeps, so the loop's timers never jump ahead of readers whose
+    real work between polls keeps them behind; asyncio simply waits again for whatever
+    of the timeout is left.
+    """
+
+    def __init__(self, speed: float = 1.0):
+        self.speed = speed
+        self._real_monotonic = _REAL_MONOTONIC
+        self._real_perf_counter = _REAL_PERF_COUNTER
+        self._real_sleep = _REAL_SLEEP
+        self._lock = threading.Lock()
+        self._offset = 0.0  # simulated seconds skipped by waits so far
+        self._sleeping = 0  # threads inside sleep() right now
+        self._wakes = 0  # sleeps finished so far
+        self._perf_offset = self._real_perf_counter() - self._real_monotonic()
+        self._real_select = None
+
+    def monotonic(self) -> float:
+        return self._real_monotonic() + self._offset
+
+    def perf_counter(self) -> float:
+        return self.monotonic() + self._perf_offset
+
+    def _waited(self, start: float, seconds: float):
+        """A wait that began at simulated `start` ran its full `seconds`: move the clock there."""
+        with self._lock:
+            self._offset = max(self._offset, start + seconds - self._real_monotonic())
+
+    def sleep(self, seconds: float):
+        seconds = max(0.0, seconds)
+        start = self.monotonic()
+        with self._lock:
+            self._sleeping += 1
+        try:
+            self._real_sleep(seconds / self.speed)
+        finally:
+            with self._lock:
+                self._sleeping -= 1
+                self._wakes += 1
+        self._waited(start, seconds)
+
+    def _sleeps_since(self, wakes: int) -> bool:
+        """Has any thread slept since `_wakes` was `wakes`, or is one sleeping now?"""
+        with self._lock:
+            return self._sleeping > 0 or self._wakes != wakes
+
+    def real_seconds(self, seconds: float) -> float:
+        return seconds / self.speed
+
+    @property
+    def installed(self) -> bool:
+        return self._real_select is not None
+
+    def install(self):
+        if self.speed == 1 or self.installed:
+            return
+        time.monotonic, time.perf_counter, time.sleep = self.monotonic, self.perf_counter, self.sleep
+        # asyncio waits in its selector for loop-clock seconds; scale those waits too
+        selector_class = selectors.DefaultSelector
+        real_select = self._real_select = selector_class.select
+        clock = self
+
+        def select(selector, timeout=None):
+            if not timeout or timeout < 0:  # polling, or waiting on other threads' work
+                return real_select(selector, timeout)
+            start, wakes = clock.monotonic(), clock._wakes
+            events = real_select(selector, timeout / clock.speed)
+            if not events and not clock._sleeps_since(wakes):  # the loop's timer ran out
+                clock._waited(start, timeout)
+            return events
+
+        selector_class.select = select
+        logging.info(f"⏩ Simulated clock running at {self.speed:g}x")
+
+    def uninstall(self):
+        if not self.installed:
+            return
+        time.monotonic, time.perf_counter, time.sleep = self._real_monotonic, self._real_perf_counter, self._real_sleep
+        selectors.DefaultSelector.select = self._real_select
+        self._real_select = None
+
+def _load_font(size: int):
+    from PIL import ImageFont
+    try:
+        return ImageFont.load_default(size=size)
+    except (TypeError, OSError):  # Pillow without FreeType: fixed small bitmap font
+        return ImageFont.load_default()
+
+def _words(text: str) -> set:
+    return set(re.findall(r"[a-z]{3,}", text.lower()))
+
+@dataclass
+class SimMessage:
+    """One transcript entry; AI replies stream in from `start` at `cps` characters/second."""
+    role: str
+    text: str
+    start: float
+    cps: float = 0.0
+
+    def visible(self, now: float) -> str:
+        if now < self.start:
+            return ""
+        if not self.cps:
+            return self.text
+        return self.text[:int((now - self.start) * self.cps)]
+
+    @property
+    def done_at(self) -> float:
+        return self.start + (len(self.text) / self.cps if self.cps else 0.0)
+
+class SimWindow:
+    """One AI's chat window: title bar, transcript, input box and send button."""
+
+    def __init__(self, ui: str, ui_config: dict, settings: dict, font, now: float):
+        self.ui = ui
+        self.desktop = ui_config.get("desktop", 1)
+        self.read_area = (*ui_config["read_area_top_left"], *ui_config["read_area_bottom_right"])
+        self.input_box = (*ui_config["input_top_left"], *ui_config["send_button"])
+        self.send_button = ui_config["send_button"]
+        # Room around the send button too: scripts may click a few pixels off it
+        self.rect = (min(self.read_area[0], self.input_box[0]) - WINDOW_MARGIN,
+                     self.read_area[1] - TITLE_BAR - WINDOW_MARGIN,
+                     max(self.read_area[2], self.input_box[2] + SEND_TOLERANCE),
+                     self.input_box[3] + WINDOW_MARGIN)
+        self.app_name, self.title = settings["windows"].get(ui, (ui, ui))
+        self.dark = ui in settings["dark"]
+        self.first_token = settings["first_token"].get(ui, 2.0)
+        self.cps = settings["chars_per_second"].get(ui, 100)
+        self.reply_words = settings["reply_words"]
+        self.scroll_step = settings["scroll_step"]
+        self.font = font
+        self.line_height = int(font.size * 1.45) if hasattr(font, "size") else 14
+        self.messages = []
+        for prompt, reply in HISTORY[:settings["history"]]:
+            self.messages += [SimMessage("user", prompt, now), SimMessage("ai", reply, now)]
+        self.input_text = ""
+        self.focus = None  # "input", "read" or None
+        self.selected = False  # select-all active in the focused part
+        self.scroll_up = 0
+        self.turns = []  # {"sent", "prompt", "reply", "first_token", "done"}
+        self._cache = (None, None)
+
+    def contains(self, x, y) -> bool:
+        left, top, right, bottom = self.rect
+        return left <= x < right and top <= y < bottom
+
+    def _reply_text(self) -> str:
+        rng = random.Random(f"{self.ui}:{len(self.turns)}")
+        target = rng.randint(*self.reply_words)
+        sentences = []
+        while sum(len(s.split()) for s in sentences) < target:
+            sentences.append(rng.choice(SENTENCES))
+        return " ".join(sentences)
+
+    def send(self, now: float):
+        prompt = self.input_text.strip()
+        if not prompt:
+            return
+        rng = random.Random(f"{self.ui}:latency:{len(self.turns)}")
+        reply = SimMessage("ai", self._reply_text(), now + self.first_token * rng.uniform(0.8, 1.2), self.cps)
+        self.messages += [SimMessage("user", prompt, now), reply]
+        self.turns.append({"sent": now, "prompt": prompt, "reply": reply.text,
+                           "first_token": reply.start, "done": reply.done_at})
+        self.input_text = ""
+        self.selected = False
+        self.scroll_up = 0
+        logging.debug(f"🧪 {self.ui} got a {len(prompt)}-char prompt, replying in {reply.start - now:.1f}s")
+
+    def type_text(self, text: str):
+        if self.focus != "input":
+            return
+        self.input_text = text if self.selected else self.input_text + text
+        self.selected = False
+
+    def transcript_text(self, now: float) -> str:
+        return "\n\n".join(text for text in (m.visible(now) for m in self.messages) if text)
+
+    def scroll(self, clicks: int):
+        # pyautogui convention: positive clicks scroll up (back through the transcript)
+        self.scroll_up = max(0, self.scroll_up + clicks * self.scroll_step)
+
+    def _wrap(self, text: str, width: int) -> list:
+        lines = []
+        for paragraph in text.split("\n"):
+            line = ""
+            for word in paragraph.split():
+                candidate = f"{line} {word}" if line else word
+                if line and self.font.getlength(candidate) > width:
+                    lines.append(line)
+                    line = word
+                else:
+                    line = candidate
+            lines.append(line)
+        return lines
+
+    def _thinking(self, now: float) -> int:
+        """Dots of the typing indicator while the latest reply has not started (0 = none)."""
+        last = self.messages[-1] if self.messages else None
+        if last is None or last.role != "ai" or now >= last.start:
+            return 0
+        return 1 + int(now * 3) % 3
+
+    def render(self, now: float):
+        """The whole window as an image, redrawn only when something visible changed."""
+        visible = tuple(len(m.visible(now)) for m in self.messages)
+        key = (visible, self._thinking(now), self.scroll_up, self.focus, self.input_text, self.selected)
+        if self._cache[0] == key:
+            return self._cache[1]
+        from PIL import Image, ImageDraw
+        background, ink, muted, accent = (((32, 33, 36), (232, 234, 237), (60, 64, 72), (138, 180, 248))
+                                          if self.dark else
+                                          ((255, 255, 255), (20, 20, 20), (236, 236, 241), (16, 163, 127)))
+        left, top, right, bottom = self.rect
+        image = Image.new("RGB", (right - left, bottom - top), background)
+        draw = ImageDraw.Draw(image)
+        draw.rectangle((0, 0, right - left, TITLE_BAR), fill=muted)
+        draw.text((10, 6), self.title, fill=ink, font=self.font)
+
+        # Transcript, bottom-aligned like a chat, shifted by scroll_up
+        rl, rt, rr, rb = (self.read_area[0] - left, self.read_area[1] - top,
+                          self.read_area[2] - left, self.read_area[3] - top)
+        rows = []
+        for message in self.messages:
+            text = message.visible(now)
+            if not text:
+                continue
+            indent = (rr - rl) // 4 if message.role == "user" else 0
+            rows += [(indent, line, message.role) for line in self._wrap(text, rr - rl - indent - 16)]
+            rows.append((0, "", None))
+        dots = self._thinking(now)
+        if dots:
+            rows.append((0, "●" * dots, "ai"))
+        viewport = Image.new("RGB", (rr - rl, rb - rt), background)
+        view_draw = ImageDraw.Draw(viewport)
+        content_height = len(rows) * self.line_height
+        self.scroll_up = min(self.scroll_up, max(0, content_height - viewport.height))
+        y = viewport.height - content_height + self.scroll_up
+        for indent, line, role in rows:
+            if -self.line_height < y < viewport.height and line:
+                if role == "user":
+                    view_draw.rectangle((indent, y, viewport.width - 4, y + self.line_height), fill=muted)
+                view_draw.text((indent + 8, y + 2), line, fill=ink, font=self.font)
+            y += self.line_height
+        image.paste(viewport, (rl, rt))
+
+        # Input box with focus ring, caret and the tail of its text
+        il, it, ir, ib = (self.input_box[0] - left, self.input_box[1] - top,
+                          self.input_box[2] - left - 40, self.input_box[3] - top)
+        focused = self.focus == "input"
+        draw.rounded_rectangle((il, it, ir, ib), radius=10, fill=muted,
+                               outline=accent if focused else ink, width=3 if focused else 1)
+        text = self.input_text.replace("\n", " ")
+        while text and self.font.getlength(text) > ir - il - 24:
+            text = text[max(1, len(text) // 8):]
+        text_y = (it + ib) // 2 - self.line_height // 2
+        if self.selected and text:
+            draw.rectangle((il + 10, text_y, il + 12 + self.font.getlength(text), text_y + self.line_height),
+                           fill=accent)
+        draw.text((il + 12, text_y + 2), text, fill=ink, font=self.font)
+        if focused:
+            caret = il + 14 + self.font.getlength(text)
+            draw.line((caret, text_y, caret, text_y + self.line_height), fill=ink, width=2)
+        sx, sy = self.send_button[0] - left, self.send_button[1] - top
+        draw.ellipse((sx - 16, sy - 16, sx + 16, sy + 16), fill=accent)
+        self._cache = (key, image)
+        return image
+
+class SimulatorCaptureBackend(CaptureBackend):
+    """Screen capture of the simulated desktop."""
+
+    name = "simulator"
+
+    def __init__(self, simulator):
+        self.simulator = simulator
+
+    def grab(self, region):
+        return self.simulator.grab(region)
+
+    def scroll(self, clicks: int, x: int, y: int):
+        self.simulator.scroll(clicks, x, y)
+
+class SimulatorActuator(Actuator):
+    """Mouse, keyboard, clipboard and AppleScript acting on the simulated desktop."""
+
+    name = "simulator"
+
+    def __init__(self, simulator):
+        super().__init__()
+        self.simulator = simulator
+
+    def _click(self, x, y, clicks, button):
+        self.simulator.click(x, y)
+
+    def _move_to(self, x, y, duration):
+        self.simulator.pointer = (x, y)
+
+    def _hotkey(self, *keys):
+        self.simulator.hotkey(*keys)
+
+    def _press(self, key):
+        self.simulator.press(key)
+
+    def _write(self, text, interval):
+        self.simulator.write(text)
+
+    def _scroll(self, clicks, x, y):
+        self.simulator.scroll(clicks, x, y)
+
+    def _position(self):
+        return self.simulator.pointer
+
+    def _copy(self, text):
+        self.simulator.clipboard = text
+
+    def _paste(self):
+        return self.simulator.clipboard
+
+    def _run_script(self, script, timeout):
+        return self.simulator.run_script(script)
+
+class CouncilSimulator:
+    """
+    The simulated desktops: one SimWindow per AI in UI_CONFIGS on its "desktop",
+    Control-arrow desktop switching and app activation through AppleScript, and a
+    shared clipboard. `capture` and `actuator` are the backends to plug in.
+    """
+
+    def __init__(self, ui_configs: dict = None, settings: dict = None, clock: SimClock = None):
+        self.settings = dict(config.SIMULATOR, **(settings or {}))
+        self.clock = clock or SimClock(1.0)
+        self.font = _load_font(self.settings["font_size"])
+        now = self.now()
+        self.start = now
+        ui_configs = ui_configs or config.UI_CONFIGS
+        self.windows = [SimWindow(ui, ui_config, self.settings, self.font, now) for ui, ui_config in ui_configs.items()]
+        self.desktop = self.settings["start_desktop"]
+        self.desktop_count = max(window.desktop for window in self.windows)
+        self.switches = 0
+        self.clipboard = ""
+        self.pointer = (0, 0)
+        self.focused = None
+        self.screen_size = (max(window.rect[2] for window in self.windows) + WINDOW_MARGIN,
+                            max(window.rect[3] for window in self.windows) + WINDOW_MARGIN)
+        self.capture = SimulatorCaptureBackend(self)
+        self.actuator = SimulatorActuator(self)
+        self._lock = threading.RLock()
+
+    def now(self) -> float:
+        return self.clock.monotonic()
+
+    def window(self, ui: str) -> SimWindow:
+        return next(window for window in self.windows if window.ui == ui)
+
+    def _visible(self):
+        """Windows on the current desktop, back to front."""
+        return [window for window in self.windows if window.desktop == self.desktop]
+
+    def _window_at(self, x, y):
+        return next((window for window in reversed(self._visible()) if window.contains(x, y)), None)
+
+    def _raise(self, window):
+        self.windows.remove(window)
+        self.windows.append(window)
+
+    def grab(self, region):
+        from PIL import Image
+        left, top, right, bottom = region
+        image = Image.new("RGB", (right - left, bottom - top), DESKTOP_BACKGROUND)
+        with self._lock:
+            now = self.now()
+            for window in self._visible():
+                wl, wt, wr, wb = window.rect
+                if wl < right and wr > left and wt < bottom and wb > top:
+                    image.paste(window.render(now), (wl - left, wt - top))
+        return image
+
+    def click(self, x, y):
+        with self._lock:
+            self.pointer = (x, y)
+            window = self._window_at(x, y)
+            if self.focused and self.focused is not window:
+                self.focused.focus = None
+                self.focused.selected = False
+            self.focused = window
+            if window is None:
+                return
+            self._raise(window)
+            window.selected = False
+            sx, sy = window.send_button
+            if abs(x - sx) <= SEND_TOLERANCE and abs(y - sy) <= SEND_TOLERANCE // 2:
+                window.send(self.now())
+                window.focus = "input"
+            elif y >= window.read_area[3]:
+                window.focus = "input"
+            else:
+                window.focus = "read"
+
+    def hotkey(self, *keys):
+        keys = [key.lower() for key in keys]
+        if not {"command", "ctrl"} & set(keys):
+            return
+        window = self.focused
+        with self._lock:
+            if window is None:
+                return
+            if keys[-1] == "a":
+                window.selected = True
+            elif keys[-1] == "v":
+                window.type_text(self.clipboard)
+            elif keys[-1] == "c" and window.selected:
+                self.clipboard = (window.input_text if window.focus == "input"
+                                  else window.transcript_text(self.now()))
+
+    def press(self, key: str):
+        window = self.focused
+        with self._lock:
+            if window is None or window.focus != "input":
+                return
+            if key.lower() in ("enter", "return"):
+                window.send(self.now())
+            elif key.lower() == "backspace":
+                window.input_text = "" if window.selected else window.input_text[:-1]
+                window.selected = False
+
+    def write(self, text: str):
+        with self._lock:
+            if self.focused is not None:
+                self.focused.type_text(text)
+
+    def scroll(self, clicks: int, x=None, y=None):
+        with self._lock:
+            x, y = (x, y) if x is not None and y is not None else self.pointer
+            window = self._window_at(x, y)
+            if window is not None:
+                window.scroll(clicks)
+
+    def run_script(self, script: str) -> ScriptResult:
+        """The AppleScript the council scripts send: desktop switches, activation, window lists."""
+        delay = sum(float(seconds) for seconds in re.findall(r"\bdelay ([\d.]+)", script))
+        if delay:
+            time.sleep(delay)
+        with self._lock:
+            steps = script.count("key code 124") - script.count("key code 123")
+            if steps:
+                target = min(max(self.desktop + steps, 0), self.desktop_count)
+                if target != self.desktop:
+                    self.desktop = target
+                    self.switches += 1
+                return ScriptResult(0)
+            match = re.search(r'tell application "([^"]+)" to activate', script)
+            if match:
+                for window in list(self.windows):
+                    if window.app_name == match.group(1):
+                        if window.desktop != self.desktop:
+                            self.desktop = window.desktop
+                            self.switches += 1
+                        self._raise(window)
+                return ScriptResult(0)
+            if "every window of proc" in script:
+                lines = [f"{w.app_name}|{w.title}|{w.rect[0]},{w.rect[1]}|{w.rect[2] - w.rect[0]},{w.rect[3] - w.rect[1]}"
+                         for w in reversed(self._visible())]
+                return ScriptResult(0, "\n".join(lines) + "\n")
+            return ScriptResult(0)
+
+    def summary(self) -> dict:
+        """
+        Per-AI turns, reply latency (send to last character, simulated seconds) and
+        read-back: the share of each relayed prompt's words found in the reply it was
+        read from, i.e. how much of a reply survived capture, OCR and cleaning.
+        """
+        now = self.now()
+        turns = [(window.ui, turn) for window in self.windows for turn in window.turns]
+        replies = [turn for _, turn in turns]
+        per_ui = {}
+        for ui, turn in turns:
+            stats = per_ui.setdefault(ui, {"turns": 0, "latency": [], "read_back": []})
+            stats["turns"] += 1
+            stats["latency"].append(min(turn["done"], now) - turn["sent"])
+            earlier = [r["reply"] for r in replies if r["done"] <= turn["sent"]]
+            prompt_words = _words(turn["prompt"])
+            if earlier and prompt_words:
+                stats["read_back"].append(max(len(prompt_words & _words(r)) / len(prompt_words) for r in earlier))
+        return {
+            "sim_seconds": now - self.start,
+            "turns": len(turns),
+            "desktop_switches": self.switches,
+            "per_ui": {
+                ui: {
+                    "turns": stats["turns"],
+                    "mean_latency": sum(stats["latency"]) / len(stats["latency"]),
+                    "read_back": (sum(stats["read_back"]) / len(stats["read_back"])
+                                  if stats["read_back"] else None)
+                }
+                for ui, stats in per_ui.items()
+            }
+        }
+
+_simulator = None
+_simulator_lock = threading.Lock()
+
+def get_simulator() -> CouncilSimulator:
+    """
+    The shared simulator behind the "simulator" capture and actuator backends. Made on
+    first use with a real-time clock; install_simulator() is what speeds time up.
+    """
+    global _simulator
+    with _simulator_lock:
+        if _simulator is None:
+            _simulator = CouncilSimulator(clock=SimClock(config.SIMULATOR["speed"]))
+    return _simulator
+
+def install_simulator(speed: float = None, ui_configs: dict = None, settings: dict = None) -> CouncilSimulator:
+    """
+    Start a simulator on its own clock and make it the capture and actuator backend.
+    A simulator installed before is replaced and its clock uninstalled first.
+    """
+    global _simulator
+    clock = SimClock(config.SIMULATOR["speed"] if speed is None else speed)
+    with _simulator_lock:
+        if _simulator is not None:
+            _simulator.clock.uninstall()
+        clock.install()
+        _simulator = CouncilSimulator(ui_configs, settings, clock)
+    set_capture_backend(_simulator.capture)
+    set_actuator(_simulator.actuator)
+    return _simulator
+
+def _load_ai_council_loop():
+    path = config.BASE_PATH.parent / "AI_Projects_ai_gui_interaction" / "ui_detection" / "ai_council_loop.py"
+    spec = importlib.util.spec_from_file_location("ai_council_loop", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.AICouncilLoop
+
+def run_council(mode: str, rounds: int):
+    """Run one of the council entry points, unmodified, against the installed simulator."""
+    if mode == "loop":
+        council = _load_ai_council_loop()("Simulated council")
+        council.run_full_council_discussion("What makes a council of AI minds useful?", rounds)
+        return
+    import main_ocr_testing_v3 as council
+    if not council.kai_brief_test():
+        logging.error("❌ Briefing failed")
+        return
+    if mode == "chairman":
+        council.kai_chairman_discussion()
+    else:
+        council.kai_four_ai_real_conversation()
+    council.kai_return_home()
+
+def print_summary(summary: dict, real_seconds: float):
+    print(f"\nSimulated {summary['sim_seconds']:.1f}s in {real_seconds:.1f}s real time: "
+          f"{summary['turns']} turn(s), {summary['desktop_switches']} desktop switch(es)")
+    print(f"{'UI':<12}{'Turns':>6}{'Latency s':>11}{'Read-back':>11}")
+    for ui, stats in summary["per_ui"].items():
+        read_back = f"{stats['read_back']:.0%}" if stats["read_back"] is not None else "-"
+        print(f"{ui:<12}{stats['turns']:>6}{stats['mean_latency']:>11.1f}{read_back:>11}")
+
+def check_clock(speed: float = 20.0, busy_seconds: float = 0.1) -> bool:
+    """
+    Run a thread that sleeps and a thread that spins on the CPU at the same time and check
+    that the busy thread's measured time stays at the real time it spent (not `speed`
+    times it) while the sleeper still sees its full simulated sleep.
+    """
+    clock = SimClock(speed)
+    clock.install()
+    nap = busy_seconds * speed * 3  # still asleep (in real time) when the busy thread finishes
+    results = {}
+
+    def sleeper():
+        start = time.monotonic()
+        time.sleep(nap)
+        results["slept"] = time.monotonic() - start
+
+    def busy():
+        start, real_start = time.perf_counter(), _REAL_PERF_COUNTER()
+        while _REAL_PERF_COUNTER() - real_start < busy_seconds:
+            pass
+        results["busy"] = time.perf_counter() - start
+
+    try:
+        threads = [threading.Thread(target=sleeper), threading.Thread(target=busy)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        clock.uninstall()
+    ok = results["busy"] < busy_seconds * 1.5 and results["slept"] >= nap
+    print(f"{'✅' if ok else '❌'} {speed:g}x: busy thread measured {results['busy']:.3f}s for "
+          f"{busy_seconds:.3f}s of work; sleeper slept {results['slept']:.2f}s of {nap:.2f}s")
+    return ok
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a council against simulated chat windows")
+    parser.add_argument("--mode", choices=["relay", "chairman", "loop"], default="relay",
+                        help="relay/chairman: main_ocr_testing_v3; loop: ui_detection AICouncilLoop")
+    parser.add_argument("--rounds", type=int, default=1, help="rounds for --mode loop")
+    parser.add_argument("--speed", type=float, default=config.SIMULATOR["speed"], help="clock speed-up")
+    parser.add_argument("--single-desktop", action="store_true",
+                        help="put every window on the starting desktop (AICouncilLoop never switches desktops)")
+    parser.add_argument("--workdir", help="where the scripts write debug captures and logs (default: temp dir)")
+    parser.add_argument("--check-clock", action="store_true",
+                        help="only check that the simulated clock does not inflate busy threads' time")
+    args = parser.parse_args(argv)
+    if args.check_clock:
+        return 0 if check_clock(args.speed) else 1
+
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(message)s')
+    sys.path.insert(0, str(config.BASE_PATH.parent))  # repo root, for main_ocr_testing_v3
+    ui_configs = None
+    if args.single_desktop or args.mode == "loop":
+        start = config.SIMULATOR["start_desktop"]
+        ui_configs = {ui: dict(ui_config, desktop=start) for ui, ui_config in config.UI_CONFIGS.items()}
+    simulator = install_simulator(args.speed, ui_configs)
+    workdir = args.workdir or tempfile.mkdtemp(prefix="council_sim_")
+    os.makedirs(workdir, exist_ok=True)
+    os.chdir(workdir)
+    logging.info(f"🧪 Simulated council ({args.mode}) writing files to {workdir}")
+
+    real_start = simulator.clock._real_monotonic()
+    try:
+        run_council(args.mode, args.rounds)
+    finally:
+        real_seconds = simulator.clock._real_monotonic() - real_start
+        log_actuator_stats()
+        print_summary(simulator.summary(), real_seconds)
+        simulator.clock.uninstall()
+
+if __name__ == "__main__":
+    sys.exit(main())
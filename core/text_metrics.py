@@ -0,0 +1,34 @@
+# core/text_metrics.py
+
+import os
+
+def normalize_whitespace(text: str) -> str:
+    return " ".join(text.split())
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance (insert/delete/substitute), two-row dynamic programming."""
+    # A shared prefix/suffix never changes the distance; trimming it keeps near-identical
+    # long texts cheap
+    start = len(os.path.commonprefix([a, b]))
+    a, b = a[start:], b[start:]
+    end = len(os.path.commonprefix([a[::-1], b[::-1]]))
+    if end:
+        a, b = a[:-end], b[:-end]
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1,
+                               current[j - 1] + 1,
+                               previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+def char_accuracy(predicted: str, truth: str) -> float:
+    """1 - normalized edit distance, on whitespace-normalized text (1.0 = exact match)."""
+    predicted, truth = normalize_whitespace(predicted), normalize_whitespace(truth)
+    if not truth:
+        return 1.0 if not predicted else 0.0
+    return max(0.0, 1 - edit_distance(predicted, truth) / len(truth))
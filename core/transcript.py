@@ -0,0 +1,72 @@
+# core/transcript.py
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+
+# [HH:MM:SS] or [Speaker–HH:MM:SS] (en dash, em dash or hyphen)
+HEADER_PATTERN = re.compile(
+    r"\[(?:(?P<speaker>[^\[\]\d–—-][^\[\]–—-]*?)\s*[–—-]\s*)?(?P<time>\d{2}:\d{2}:\d{2})\]"
+)
+
+@dataclass
+class Segment:
+    """The text after one timestamp header, up to the next header."""
+    timestamp: str
+    speaker: Optional[str]
+    body: str
+
+def tokenize(text: str) -> List[Segment]:
+    """Split OCR text into timestamped segments in a single pass over the headers."""
+    segments = []
+    if "[" not in text:  # most polled frames carry no header at all; skip the regex scan
+        return segments
+    headers = list(HEADER_PATTERN.finditer(text))
+    for i, header in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+        speaker = header.group("speaker")
+        segments.append(Segment(header.group("time"), speaker.strip() if speaker else None,
+                                text[header.end():end].strip()))
+    return segments
+
+class TranscriptIndex:
+    """
+    Segments of one or more OCR blocks, indexed as they are added so the latest
+    segment overall or for one speaker is a dict lookup. "Latest" means the highest
+    timestamp; among equal timestamps, the one seen last. `accept` (e.g. a junk check)
+    is only asked about the latest candidates at lookup, not about every segment.
+    """
+
+    def __init__(self, accept=None):
+        self.accept = accept  # optional filter on a segment's body
+        self.segments = []
+        self._latest = {}
+
+    def add_text(self, text: str):
+        for segment in tokenize(text):
+            self.add(segment)
+
+    def add(self, segment: Segment):
+        if not segment.body:
+            return
+        self.segments.append(segment)
+        keys = {None, segment.speaker.lower() if segment.speaker else None}
+        for key in keys:
+            current = self._latest.get(key)
+            if current is None or segment.timestamp >= current.timestamp:
+                self._latest[key] = segment
+
+    def latest(self, speaker: str = None) -> Optional[Segment]:
+        """Latest accepted segment overall, or of `speaker` (case-insensitive)."""
+        key = speaker.lower() if speaker else None
+        latest = self._latest.get(key)
+        if latest is None or not self.accept or self.accept(latest.body):
+            return latest
+        # The latest was rejected: walk back from newest (last seen first among equal times)
+        candidates = [segment for segment in reversed(self.segments)
+                      if key is None or (segment.speaker or "").lower() == key]
+        candidates.sort(key=lambda segment: segment.timestamp, reverse=True)
+        return next((segment for segment in candidates if self.accept(segment.body)), None)
+
+    def __len__(self):
+        return len(self.segments)
@@ -1,13 +1,94 @@
 # core/utils.py
 
-import pyautogui
-import pytesseract
-from PIL import ImageGrab
+from concurrent.futures import Future
+from dataclasses import replace
+from core.capture import get_capture_backend
+from core.ocr_pool import ocr_data, get_ocr_pool
+from core.ocr_result import OCRResult
+from core.frame_cache import get_frame_cache
+from core.preprocess import crop_to_text_bands, stack_text_bands
+from core.ocr_profiles import get_ocr_profile
+from core.config import LINE_BAND_DETECTION
 
-def scroll_area_and_capture_text(region):
+def text_bands_only(image):
+    """Reduce a capture to its text-line bands; None means there is no ink to OCR."""
+    if not LINE_BAND_DETECTION:
+        return image
+    return crop_to_text_bands(image)
+
+def _band_stack(image):
+    """(image to OCR, its band layout or None); (None, None) when there is no ink."""
+    if not LINE_BAND_DETECTION:
+        return image, None
+    stack = stack_text_bands(image)
+    if stack is None:
+        return None, None
+    return stack[0], stack[1:]
+
+def _in_frame_coords(result: OCRResult, layout) -> OCRResult:
+    """Move word boxes from the stacked bands back to where they are in the captured frame."""
+    if layout is None:
+        return result
+    left, placements = layout
+    words = []
+    for word in result.words:
+        middle = word.top + word.height // 2
+        stacked_top, frame_top, _ = next((p for p in reversed(placements) if p[0] <= middle), placements[0])
+        words.append(replace(word, left=word.left + left, top=word.top - stacked_top + frame_top))
+    return OCRResult(words, result.origin)
+
+def ocr_frame_result(image, profile: dict = None) -> OCRResult:
+    """OCR an already captured image, reusing the cached result for unchanged frames."""
+    image, layout = _band_stack(image)
+    if image is None:
+        return OCRResult()
+    profile = profile or get_ocr_profile()
+    result = get_frame_cache().ocr(image, lambda frame: ocr_data(frame, profile), profile["name"])
+    return _in_frame_coords(result, layout)
+
+def ocr_frame(image, profile: dict = None) -> str:
+    return ocr_frame_result(image, profile).text
+
+def finished_future(result: OCRResult) -> Future:
+    future = Future()
+    future.set_result(result)
+    return future
+
+def submit_ocr_frame(image, profile: dict = None) -> Future:
+    """
+    Queue an image on the OCR pool; the Future holds an OCRResult with word boxes
+    in the image's coordinates. Blank frames and cache hits come back already finished.
+    """
+    image, layout = _band_stack(image)
+    if image is None:
+        return finished_future(OCRResult())
+
+    profile = profile or get_ocr_profile()
+    cache = get_frame_cache()
+    key = cache.key(image, profile["name"])
+    result = cache.get(key)
+    if result is not None:
+        return finished_future(_in_frame_coords(result, layout))
+
+    mapped = Future()
+    mapped.source = get_ocr_pool().submit(image, profile)  # what the pool cancels on timeout
+
+    def store(done):
+        if done.cancelled() or mapped.cancelled():
+            mapped.cancel()
+        elif done.exception() is not None:
+            mapped.set_exception(done.exception())
+        else:
+            cache.put(key, done.result())
+            mapped.set_result(_in_frame_coords(done.result(), layout))
+
+    mapped.source.add_done_callback(store)
+    return mapped
+
+def scroll_area_and_capture_text(region, profile: dict = None):
     """
     Scrolls and captures OCR text from a region of the screen.
     """
-    screenshot = ImageGrab.grab(bbox=region)
-    text = pytesseract.image_to_string(screenshot)
+    screenshot = get_capture_backend().grab(region)
+    text = ocr_frame(screenshot, profile)
     return text
@@ -0,0 +1,79 @@
+# core/virtual_display.py
+
+import logging
+import os
+import shlex
+import subprocess
+import time
+from pathlib import Path
+
+from core import config
+
+X_SOCKETS = Path("/tmp/.X11-unix")
+
+def display_in_use(number: int) -> bool:
+    return Path(f"/tmp/.X{number}-lock").exists() or (X_SOCKETS / f"X{number}").exists()
+
+class VirtualDisplay:
+    """
+    An Xvfb display for one council session, plus the `startup` programs that run on
+    it (window manager, chat windows). Picks the first free display number from
+    `number` up. Use as a context manager; `env` is os.environ with DISPLAY set.
+    """
+
+    def __init__(self, number: int = None, size=None, depth: int = None, startup=None):
+        settings = config.VIRTUAL_DISPLAY
+        self.number = settings["base"] if number is None else number
+        self.size = size or settings["size"]
+        self.depth = depth or settings["depth"]
+        self.startup = settings["startup"] if startup is None else startup
+        self.start_timeout = settings["start_timeout"]
+        self._server = None
+        self._programs = []
+
+    @property
+    def name(self) -> str:
+        return f":{self.number}"
+
+    @property
+    def env(self) -> dict:
+        return dict(os.environ, DISPLAY=self.name)
+
+    def start(self):
+        while display_in_use(self.number):
+            self.number += 1
+        width, height = self.size
+        self._server = subprocess.Popen(
+            ["Xvfb", self.name, "-screen", "0", f"{width}x{height}x{self.depth}", "-nolisten", "tcp"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + self.start_timeout
+        while not (X_SOCKETS / f"X{self.number}").exists():
+            if self._server.poll() is not None or time.monotonic() > deadline:
+                self.stop()
+                raise RuntimeError(f"Xvfb did not start on {self.name}")
+            time.sleep(0.05)
+        logging.info(f"🖥️ Virtual display {self.name} ready ({width}x{height})")
+        for command in self.startup:
+            try:
+                self._programs.append(subprocess.Popen(shlex.split(command), env=self.env,
+                                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+            except FileNotFoundError:
+                logging.warning(f"⚠️ {self.name}: could not start '{command}'")
+        return self
+
+    def stop(self):
+        for process in reversed(self._programs + ([self._server] if self._server else [])):
+            if process.poll() is None:
+                process.terminate()
+                try:
+                    process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+        self._programs = []
+        self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,46 @@
+# core/waits.py
+
+import logging
+import time
+
+from core import config
+
+def wait_until(condition, timeout: float, initial: float = None, factor: float = None,
+               ceiling: float = None) -> bool:
+    """
+    Poll `condition()` until it is true or `timeout` seconds pass. The first check is
+    immediate, then the delay starts at `initial` and grows by `factor` up to `ceiling`,
+    so fast UI changes are seen within milliseconds and slow ones cost few polls.
+    """
+    poll = config.INJECTION_POLL
+    delay = poll["initial"] if initial is None else initial
+    factor = poll["factor"] if factor is None else factor
+    ceiling = poll["ceiling"] if ceiling is None else ceiling
+    deadline = time.monotonic() + timeout
+    while True:
+        if condition():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * factor, ceiling)
+
+class StepTimer:
+    """Times the named steps of one multi-step UI action and logs them as one line."""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.steps = []
+        self.start = self._last = time.monotonic()
+
+    def step(self, name: str, ok: bool = True):
+        now = time.monotonic()
+        self.steps.append((name, now - self._last, ok))
+        self._last = now
+        return ok
+
+    def log(self):
+        parts = ", ".join(f"{name} {elapsed:.2f}s{'' if ok else ' (timed out)'}"
+                          for name, elapsed, ok in self.steps)
+        logging.info(f"⏱️ {self.label}: {parts} - total {time.monotonic() - self.start:.2f}s")
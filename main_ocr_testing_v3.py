@@ -1,11 +1,21 @@
 import time
+import asyncio
 import logging
-import subprocess
-import pyautogui
-import pytesseract
-from PIL import ImageGrab
 import os
 from datetime import datetime
+from core.ocr_pool import ocr_data
+from core.actuator import get_actuator, log_actuator_stats, RecordingActuator
+from core.capture import get_capture_backend
+from core.confidence import get_confidence_tracker, capture_confidence
+from core.config import (LOW_CONFIDENCE_RETRY, LOW_CONFIDENCE_RETRIES, INJECTION_TIMEOUTS, ACTION_LOG_FOLDER,
+                         DESKTOP_SWITCH, DISCUSSION_MODE, FAN_IN_DEADLINE)
+from core.desktop_scheduler import DesktopScheduler, log_round_plan
+from core.orchestrator import CouncilOrchestrator
+from core.input_box import input_region, snapshot, has_changed, verify_paste
+from core.waits import wait_until, StepTimer
+from core.ocr_profiles import profile_for_ui
+from core.completion import wait_for_response
+from core.junk_filter import get_junk_filter
 
 logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(message)s')
 
@@ -54,43 +64,24 @@ def kai_desktop_switch(target_desktop):
     
     logging.info(f"🔄 Switching from Desktop {current_desktop} to Desktop {target_desktop}")
     
-    if target_desktop == 1:
-        script = '''
-        tell application "System Events"
-            key code 124 using control down
-        end tell
-        '''
-    elif target_desktop == 2:
-        if current_desktop == 0:
-            script = '''
+    # Control-arrow once per desktop crossed, right (124) or left (123)
+    key_code = 124 if target_desktop > current_desktop else 123
+    steps = abs(target_desktop - current_desktop)
+    presses = f"\n                delay {DESKTOP_SWITCH['step_delay']:g}\n".join(
+        [f"key code {key_code} using control down"] * steps)
+    script = f'''
             tell application "System Events"
-                key code 124 using control down
-                delay 1
-                key code 124 using control down
+                {presses}
             end tell
             '''
-        else:  # from desktop 1 to 2
-            script = '''
-            tell application "System Events"
-                key code 124 using control down
-            end tell
-            '''
-    else:  # Desktop 0
-        script = '''
-        tell application "System Events"
-            key code 123 using control down
-            delay 1
-            key code 123 using control down
-        end tell
-        '''
     
-    try:
-        subprocess.run(['osascript', '-e', script], check=True)
+    result = get_actuator().run_script(script)
+    if result.returncode == 0:
         current_desktop = target_desktop
-        time.sleep(3)  # Wait for desktop switch
+        time.sleep(DESKTOP_SWITCH["settle"])  # Wait for desktop switch
         logging.info(f"✅ Successfully switched to Desktop {target_desktop}")
-    except subprocess.CalledProcessError as e:
-        logging.error(f"❌ Desktop switch failed: {e}")
+    else:
+        logging.error(f"❌ Desktop switch failed: {result.stderr.strip()}")
 
 def kai_smart_desktop_switch(speaker):
     """Smart desktop switching - only switch when actually needed"""
@@ -99,14 +90,14 @@ def kai_smart_desktop_switch(speaker):
     kai_desktop_switch(target_desktop)
 
 def kai_clipboard_injection(message):
-    """Kai's clipboard method using pbcopy"""
+    """Kai's clipboard method (pbcopy via the actuator)"""
     logging.info(f"📋 Setting clipboard: '{message[:40]}...'")
     
     try:
-        subprocess.run('pbcopy', text=True, input=message, check=True)
+        get_actuator().copy(message)
         logging.info("✅ Clipboard set successfully")
         return True
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         logging.error(f"❌ Clipboard failed: {e}")
         return False
 
@@ -114,7 +105,7 @@ def kai_safe_click(ui):
     """Kai's safe clicking method"""
     coords = BATTLE_TESTED_UI_CONFIGS[ui]["safe_click"]
     logging.info(f"🖱️ Safe click for {ui} at {coords}")
-    pyautogui.click(coords[0], coords[1])
+    get_actuator().click(coords[0], coords[1])
     time.sleep(1)
 
 def kai_text_injection(message, ui):
@@ -123,34 +114,46 @@ def kai_text_injection(message, ui):
     
     coords = BATTLE_TESTED_UI_CONFIGS[ui]["input_coords"]
     send_btn = BATTLE_TESTED_UI_CONFIGS[ui]["send_button"]
+    region = input_region(ui)
+    actuator = get_actuator()
+    timeouts = INJECTION_TIMEOUTS
+    timer = StepTimer(f"{ui} injection")
     
     # Step 1: Set clipboard
     if not kai_clipboard_injection(message):
         return False
+    timer.step("clipboard", wait_until(lambda: actuator.paste() == message, timeouts["clipboard"]))
     
     # Step 2: Click input box
     logging.info(f"🖱️ Clicking input at {coords}")
-    pyautogui.click(coords[0], coords[1])
+    before = snapshot(region)
+    actuator.click(coords[0], coords[1])
     
-    # Step 3: Kai's 250ms delay
-    time.sleep(0.25)
+    # Step 3: Wait for focus (caret / focus ring) instead of Kai's fixed 250ms
+    timer.step("focus", wait_until(lambda: has_changed(region, before), timeouts["focus"]))
     
     # Step 4: Select all and paste
-    pyautogui.hotkey('command', 'a')
-    time.sleep(0.1)
-    pyautogui.hotkey('command', 'v')
-    time.sleep(1)
+    focused = snapshot(region)
+    actuator.hotkey('command', 'a')
+    actuator.hotkey('command', 'v')
+    profile = profile_for_ui(ui)
+    if not timer.step("paste", wait_until(lambda: verify_paste(region, focused, message, profile=profile),
+                                          timeouts["paste"])):
+        logging.warning(f"⚠️ Could not confirm the paste landed in {ui}'s input box")
     
     # Step 5: Send
     logging.info(f"📤 Clicking send at {send_btn}")
-    pyautogui.click(send_btn[0], send_btn[1])
-    time.sleep(2)
+    pasted = snapshot(region)
+    actuator.click(send_btn[0], send_btn[1])
+    if not timer.step("send", wait_until(lambda: has_changed(region, pasted), timeouts["send"])):
+        logging.warning(f"⚠️ {ui}'s input box did not clear after send")
     
+    timer.log()
     logging.info(f"✅ Injection completed for {ui}")
     return True
 
-def kai_read_response(speaker):
-    """Read AI response using OCR - THE MISSING PIECE!"""
+def kai_read_response(speaker, stop=None):
+    """Read AI response using OCR - THE MISSING PIECE! Gives up (None) once `stop` is set"""
     logging.info(f"👁️ Reading {speaker}'s response using OCR...")
     
     config = BATTLE_TESTED_UI_CONFIGS[speaker]
@@ -159,36 +162,47 @@ def kai_read_response(speaker):
     # Ensure we're on the right desktop
     kai_smart_desktop_switch(speaker)
     
-    # Wait for response to appear
-    response_wait_times = {
-        "Kai": 7,
-        "CLAUDE": 10,
-        "Perplexity": 9,
-        "Grok": 8
-    }
-    
-    wait_time = response_wait_times.get(speaker, 8)
-    logging.info(f"⏳ Waiting {wait_time}s for {speaker} to respond...")
-    time.sleep(wait_time)
+    # Wait until the response stops changing instead of a fixed per-AI sleep
+    logging.info(f"⏳ Waiting for {speaker} to finish responding...")
+    wait_for_response(speaker, read_region, stop)
     
     try:
-        # Capture the response area
-        logging.info(f"📸 Capturing region {read_region} for {speaker}")
-        screenshot = ImageGrab.grab(bbox=read_region)
-        
-        # Save for debugging
-        debug_path = f"response_capture_{speaker}.png"
-        screenshot.save(debug_path)
-        
-        # Run OCR
-        ocr_text = pytesseract.image_to_string(screenshot)
+        best, best_confidence = None, -1.0
+        for attempt in range(LOW_CONFIDENCE_RETRIES + 1):
+            if stop is not None and stop.is_set():
+                logging.info(f"⏹️ Stopped reading {speaker}'s response")
+                return None
+            # Capture the response area
+            logging.info(f"📸 Capturing region {read_region} for {speaker}")
+            screenshot = get_capture_backend().grab(read_region)
+            
+            # Save for debugging
+            debug_path = f"response_capture_{speaker}.png"
+            screenshot.save(debug_path)
+            
+            # Run OCR, dropping words tesseract is unsure of; confidence is judged on the words kept
+            kept = get_confidence_tracker().filter(speaker, "read", ocr_data(screenshot, profile_for_ui(speaker)))
+            confidence = capture_confidence([kept])
+            if confidence > best_confidence:
+                best, best_confidence = kept, confidence
+            if confidence >= LOW_CONFIDENCE_RETRY or attempt == LOW_CONFIDENCE_RETRIES:
+                break
+            # Low confidence means a bad frame (still rendering, overlay), so look again
+            logging.warning(f"🔁 Low OCR confidence from {speaker} ({confidence:.0f}), capturing again...")
+            time.sleep(0.8)
+        # The most confident capture, already without the words tesseract was unsure of
+        ocr_text, confidence = best.text, best_confidence
         
-        logging.info(f"📝 OCR captured {len(ocr_text)} characters from {speaker}")
+        logging.info(f"📝 OCR captured {len(ocr_text)} characters from {speaker} "
+                     f"(mean confidence {confidence:.0f})")
         logging.info(f"📝 Preview: '{ocr_text[:100]}...'")
         
+        if confidence < LOW_CONFIDENCE_RETRY:
+            logging.warning(f"⚠️ {speaker}'s response read with low confidence ({confidence:.0f}) after "
+                            f"{LOW_CONFIDENCE_RETRIES + 1} attempt(s); using the confident words only")
         if len(ocr_text.strip()) > 20:
             # Clean up the response - remove timestamps and extra formatting
-            cleaned_response = clean_ai_response(ocr_text)
+            cleaned_response = clean_ai_response(ocr_text, speaker)
             logging.info(f"✅ Successfully read {speaker}'s response: '{cleaned_response[:60]}...'")
             return cleaned_response
         else:
@@ -199,9 +213,10 @@ def kai_read_response(speaker):
         logging.error(f"❌ OCR failed for {speaker}: {e}")
         return None
 
-def clean_ai_response(raw_ocr_text):
+def clean_ai_response(raw_ocr_text, speaker=None):
     """Clean OCR text to extract just the AI's response"""
-    lines = raw_ocr_text.strip().split('\n')
+    # Timestamp lines, UI elements, etc. (core/junk_rules "response" stage)
+    lines = get_junk_filter("response", speaker).clean(raw_ocr_text.strip()).split('\n')
     cleaned_lines = []
     
     for line in lines:
@@ -209,11 +224,6 @@ def clean_ai_response(raw_ocr_text):
         if not line:
             continue
             
-        # Skip timestamp lines, UI elements, etc.
-        if line.startswith('['):
-            continue
-        if 'Answer' in line and 'Sources' in line:
-            continue
         if len(line) < 10:
             continue
             
@@ -253,55 +263,109 @@ def kai_brief_test():
     
     return success
 
-def kai_four_ai_real_conversation():
-    """FIXED: Real four-AI conversation using actual OCR responses"""
+def kai_four_ai_real_conversation(orchestrator=None):
+    """FIXED: Real four-AI conversation using actual OCR responses; returns how many exchanges got a reply"""
     logging.info("🌐 Starting REAL four-AI conversation with OCR integration")
     
     # Define the proper flow
     flow = [("Kai", "CLAUDE"), ("CLAUDE", "Perplexity"), ("Perplexity", "Grok"), ("Grok", "Kai")]
     
+    # Group each round's speakers by desktop, starting where we already are
+    desktops = {ui: ui_config["desktop"] for ui, ui_config in BATTLE_TESTED_UI_CONFIGS.items()}
+    scheduler = DesktopScheduler(flow, desktops, start_desktop=current_desktop)
+    
     # Start with initial prompt
     current_prompt = "We are four AI minds beginning autonomous discourse. What questions shall we explore together?"
     
-    for round_num in range(2):  # 2 full rounds
+    orchestrator = orchestrator or kai_orchestrator()
+    asyncio.run(kai_relay_rounds(orchestrator, scheduler, current_prompt, rounds=2))
+    
+    answered = sum(1 for turn in orchestrator.turns if turn.ok)
+    logging.info(f"📊 {answered}/{len(orchestrator.turns)} exchanges got a real reply")
+    return answered
+
+def kai_orchestrator():
+    """GUI steps take turns on one lock; waiting and OCR run in worker threads"""
+    desktops = {ui: ui_config["desktop"] for ui, ui_config in BATTLE_TESTED_UI_CONFIGS.items()}
+    return CouncilOrchestrator(kai_turn_injection, kai_read_response, desktops,
+                               kai_desktop_switch, current_desktop)
+
+def kai_turn_injection(message, ui):
+    """Safe click, then inject the timestamped prompt"""
+    kai_safe_click(ui)
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    success = kai_text_injection(f"[{timestamp}] {message}", ui)
+    if not success:
+        logging.error(f"❌ Failed to inject to {ui}")
+    return success
+
+async def kai_relay_rounds(orchestrator, scheduler, current_prompt, rounds):
+    """Each round hands every AI's actual response to the next speaker"""
+    
+    def next_prompt(speaker, response, exchange_num):
+        if response:
+            # Use the ACTUAL response as next prompt
+            logging.info(f"✅ Using {speaker}'s actual response for next exchange")
+        else:
+            # Fallback only if injection or OCR completely fails
+            response = get_fallback_prompt(exchange_num)
+            logging.warning(f"⚠️ Using fallback prompt for next exchange")
+        logging.info(f"📄 Next prompt: '{response[:60]}...'")
+        return response
+    
+    for round_num in range(rounds):
         logging.info(f"\n🌐 ROUND {round_num + 1}")
-        
-        for exchange_num, (speaker, receiver) in enumerate(flow):
-            exchange_id = round_num * 4 + exchange_num + 1
-            logging.info(f"\n🎙️ Exchange #{exchange_id}: {speaker} → {receiver}")
-            
-            # Ensure we're on correct desktop for speaker
-            kai_smart_desktop_switch(speaker)
-            
-            # Safe click and inject prompt
-            kai_safe_click(speaker)
-            
-            # Add timestamp to prompt
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            formatted_prompt = f"[{timestamp}] {current_prompt}"
-            
-            # Inject the prompt
-            success = kai_text_injection(formatted_prompt, speaker)
-            if not success:
-                logging.error(f"❌ Failed to inject to {speaker}")
-                current_prompt = get_fallback_prompt(exchange_num)
-                continue
-            
-            # READ THE ACTUAL RESPONSE - THIS IS THE KEY FIX!
-            response = kai_read_response(speaker)
-            
-            if response:
-                # Use the ACTUAL response as next prompt
-                current_prompt = response
-                logging.info(f"✅ Using {speaker}'s actual response for next exchange")
-            else:
-                # Fallback only if OCR completely fails
-                current_prompt = get_fallback_prompt(exchange_num)
-                logging.warning(f"⚠️ Using fallback prompt for next exchange")
-            
-            logging.info(f"📄 Next prompt: '{current_prompt[:60]}...'")
-            time.sleep(2)
+        plan = scheduler.plan_round()
+        log_round_plan(round_num + 1, plan)
+        _, current_prompt = await orchestrator.timed(
+            f"Round {round_num + 1}", orchestrator.relay(plan.order, current_prompt, next_prompt))
+    
+    return current_prompt
+
+def kai_chairman_discussion(orchestrator=None):
+    """Kai sets a theme, the others answer at once, Kai synthesizes what arrived in time"""
+    logging.info("🏛️ Starting chairman discussion: Kai sets the theme, the council answers together")
+    return asyncio.run(kai_chairman_cycle(orchestrator or kai_orchestrator(), FAN_IN_DEADLINE))
+
+async def kai_chairman_cycle(orchestrator, deadline):
+    members = [ui for ui in BATTLE_TESTED_UI_CONFIGS if ui != "Kai"]
+    
+    # Step 1: Kai sets the theme
+    theme_prompt = ("Kai, please set a discussion theme for our AI Council. "
+                    "What important topic should we explore together as artificial minds?")
+    theme = await orchestrator.ask("Kai", theme_prompt)
+    if not theme:
+        logging.error("❌ Failed to get theme from Kai")
+        return False
+    logging.info(f"✅ Kai set theme: '{theme[:100]}...'")
+    
+    # Step 2: Theme to every member back to back; replies collected as each one settles
+    perspective_prompt = (f"Kai has set this theme for our AI Council discussion: '{theme}' "
+                          f"Please share your perspective on this topic.")
+    perspectives = await orchestrator.timed(
+        "Perspectives", orchestrator.fan_in({ui: perspective_prompt for ui in members}, deadline))
+    if not perspectives:
+        logging.error(f"❌ No member answered within {deadline}s")
+        return False
+    logging.info(f"📥 {len(perspectives)}/{len(members)} perspectives arrived in time")
+    
+    # Step 3: Kai synthesizes whatever arrived
+    synthesis_prompt = "Kai, here are the responses from the other council members to your theme:\n\n"
+    for ui in members:
+        if ui in perspectives:
+            synthesis_prompt += f"{ui}: {perspectives[ui]}\n\n"
+    synthesis_prompt += ("Please synthesize these perspectives and provide a unified conclusion for the council. "
+                         "What key insights emerge?")
+    synthesis = await orchestrator.ask("Kai", synthesis_prompt)
+    if not synthesis:
+        logging.error("❌ Failed to get synthesis from Kai")
+        return False
+    logging.info(f"✅ Kai's synthesis: '{synthesis[:100]}...'")
     
+    # Step 4: Share the synthesis with every member
+    share_prompt = f"Kai's synthesis of our council discussion: '{synthesis}' Your thoughts on this conclusion?"
+    await asyncio.gather(*(orchestrator.send(ui, share_prompt) for ui in members))
+    logging.info("✅ Synthesis shared with all council members")
     return True
 
 def kai_return_home():
@@ -323,7 +387,11 @@ def kai_main():
             return
         
         # Step 2: Real four-AI conversation with OCR
-        if not kai_four_ai_real_conversation():
+        if DISCUSSION_MODE == "chairman":
+            if not kai_chairman_discussion():
+                logging.error("❌ Chairman discussion failed")
+                return
+        elif not kai_four_ai_real_conversation():
             logging.error("❌ Four-AI conversation failed")
             return
             
@@ -334,6 +402,10 @@ def kai_main():
     
     finally:
         kai_return_home()
+        log_actuator_stats()
+        actuator = get_actuator()
+        if isinstance(actuator, RecordingActuator):
+            actuator.save(ACTION_LOG_FOLDER / f"council_{datetime.now():%Y%m%d_%H%M%S}.jsonl")
 
 if __name__ == "__main__":
     logging.info("🚀 FULLY FIXED FOUR-AI COUNCIL SOLUTION")